@@ -34,8 +34,15 @@ ComplianceSearchUtils
 
     _response_not_success()             --  Helper method to raise exception when response is not 200 (ok)
 
+    _get_search_request()               --  Method to build the compliance search request for the search text
+
+    _get_search_page()                  --  Method to fetch a page of the compliance search results
+
     do_compliance_search()              --  Method to run a compliance search with the search text provided
 
+    iter_compliance_search()            --  Method to walk the compliance search results page by page,
+                                            with optional concurrent prefetch of the pages
+
 
 ExportSets
 ============
@@ -78,6 +85,14 @@ ExportSet
 
     export_items_to_set()               --  Method to export items/documents to the export set
 
+    export_items_in_batches()           --  Method to export items from any iterable in batches,
+                                            creating an export for each batch
+
+    wait_for_exports()                  --  Method to wait for the export jobs to finish, polling them
+                                            at a growing interval
+
+    download_exports()                  --  Method to download the exports of the export set concurrently
+
     select()                            --  Static Method to randomly pick user input
                                             amount of items from the search result items
 
@@ -108,15 +123,25 @@ Export
 
     refresh()                           --  Method to refresh all the properties of the class Export
 
+    _download_cloud_file()              --  Method to download the exported items from the cloud URL,
+                                            resuming a partial download and verifying the checksum
+
     download_export()                   --  Method to download the exported items to a zip file
 
 """
 import copy
 import base64
+import hashlib
 import os.path
 import random
+import time
 import requests
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from cvpysdk.bulk_operations import BulkOperationRunner
 from cvpysdk.exception import SDKException
 from cvpysdk.activateapps.constants import ComplianceConstants
 
@@ -148,35 +173,24 @@ class ComplianceSearchUtils():
             self._update_response_(
                 response.text))
 
-    def do_compliance_search(self, search_text, index_server_name=None,
-                             page_size=50, app_type=ComplianceConstants.AppTypes.FILE_SYSTEM):
-        """Method to run a compliance search with the search text provided
+    def _get_search_request(self, search_text, index_server_name=None,
+                            app_type=ComplianceConstants.AppTypes.FILE_SYSTEM):
+        """Method to build the compliance search request for the search text provided
 
             Args:
                 search_text         (str)   -   Search text to be searched on the Compliance search
                 index_server_name   (str)   -   Index server name on which the search has to be executed
-                page_size           (int)   -   Search result page size value (To Fetch all HITS - 0)
-                                                Default: 50
                 app_type            (str)   -   ComplianceConstants.AppTypes Enum values
                                                 Default: FILE_SYSTEM
 
             Returns:
-                (list)  -   List of all the search result items with the metadata and SOLR fields
-                Example :
-                    [ {
-                        "FileName": <name>,
-                        "SizeKB": <size>...,
-                        <name>: <key>
-                    },
-                    {
-                        "FileName": <name>,
-                        "SizeKB": <size>...,
-                        <name>: <key>
-                    }... ]
+                (dict)  -   Compliance search request JSON
 
             Raises:
                     SDKException:
-                        Response was not success
+                        Index server does not exist
+
+                        App type is not supported
 
         """
         self._index_servers.refresh()
@@ -214,21 +228,122 @@ class ComplianceSearchUtils():
             }
         else:
             raise SDKException('ComplianceSearch', '107')
-        if page_size == 0:
-            flag, response = self._cvpysdk_object.make_request('POST', self._do_search_api, payload=search_request)
-            if flag and response.json() and "totalHits" in response.json().get("proccessingInfo"):
-                page_size = max(response.json()["proccessingInfo"]["totalHits"], 50)
+        return search_request
+
+    def _get_search_page(self, search_request, offset, page_size):
+        """Method to fetch a page of the compliance search results
+
+            Args:
+                search_request  (dict)  -   Compliance search request JSON
+                offset          (int)   -   Offset of the first result item of the page
+                page_size       (int)   -   Number of result items in the page
+
+            Returns:
+                (list, int) -   List of the search result items in the page, and the total hits of the search
+
+            Raises:
+                    SDKException:
+                        Response was not success
+
+        """
+        search_request = copy.deepcopy(search_request)
+        search_request["searchProcessingInfo"]["resultOffset"] = offset
         search_request["searchProcessingInfo"]["pageSize"] = page_size
         flag, response = self._cvpysdk_object.make_request('POST', self._do_search_api, payload=search_request)
         if flag:
             if response.json():
-                if "searchResult" in response.json():
-                    if "resultItem" in response.json()["searchResult"]:
-                        return response.json()["searchResult"]["resultItem"]
-                return []
+                total_hits = response.json().get("proccessingInfo", {}).get("totalHits", 0)
+                return response.json().get("searchResult", {}).get("resultItem", []), total_hits
             raise SDKException('Response', '102')
-        else:
-            self._response_not_success(response)
+        self._response_not_success(response)
+
+    def do_compliance_search(self, search_text, index_server_name=None,
+                             page_size=50, app_type=ComplianceConstants.AppTypes.FILE_SYSTEM):
+        """Method to run a compliance search with the search text provided
+
+            Args:
+                search_text         (str)   -   Search text to be searched on the Compliance search
+                index_server_name   (str)   -   Index server name on which the search has to be executed
+                page_size           (int)   -   Search result page size value (To Fetch all HITS - 0)
+                                                Default: 50
+                app_type            (str)   -   ComplianceConstants.AppTypes Enum values
+                                                Default: FILE_SYSTEM
+
+            Returns:
+                (list)  -   List of all the search result items with the metadata and SOLR fields
+                Example :
+                    [ {
+                        "FileName": <name>,
+                        "SizeKB": <size>...,
+                        <name>: <key>
+                    },
+                    {
+                        "FileName": <name>,
+                        "SizeKB": <size>...,
+                        <name>: <key>
+                    }... ]
+
+            Raises:
+                    SDKException:
+                        Response was not success
+
+        """
+        if page_size == 0:
+            return list(self.iter_compliance_search(search_text, index_server_name, app_type=app_type))
+        search_request = self._get_search_request(search_text, index_server_name, app_type)
+        return self._get_search_page(search_request, 0, page_size)[0]
+
+    def iter_compliance_search(self, search_text, index_server_name=None, page_size=500,
+                               app_type=ComplianceConstants.AppTypes.FILE_SYSTEM, prefetch=0):
+        """Method to walk all the compliance search results page by page, yielding one result item at a time,
+            so that the results of large searches are never held in memory at once
+
+            Args:
+                search_text         (str)   -   Search text to be searched on the Compliance search
+                index_server_name   (str)   -   Index server name on which the search has to be executed
+                page_size           (int)   -   Number of result items fetched in each request
+                                                Default: 500
+                app_type            (str)   -   ComplianceConstants.AppTypes Enum values
+                                                Default: FILE_SYSTEM
+                prefetch            (int)   -   Number of pages fetched concurrently ahead of the page being read
+                                                Default: 0 (pages are fetched one after the other)
+
+            Yields:
+                (dict)  -   Search result item with the metadata and SOLR fields
+
+            Raises:
+                    SDKException:
+                        Response was not success
+
+        """
+        if not isinstance(page_size, int) or page_size < 1:
+            raise SDKException('ComplianceSearch', '110')
+        search_request = self._get_search_request(search_text, index_server_name, app_type)
+        result_items, total_hits = self._get_search_page(search_request, 0, page_size)
+        for result_item in result_items:
+            yield result_item
+
+        offsets = iter(range(page_size, total_hits, page_size))
+        if not prefetch:
+            for offset in offsets:
+                result_items, _ = self._get_search_page(search_request, offset, page_size)
+                if not result_items:
+                    return
+                for result_item in result_items:
+                    yield result_item
+            return
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pages = deque(
+                executor.submit(self._get_search_page, search_request, offset, page_size)
+                for offset in islice(offsets, prefetch)
+            )
+            while pages:
+                result_items, _ = pages.popleft().result()
+                for offset in islice(offsets, 1):
+                    pages.append(executor.submit(self._get_search_page, search_request, offset, page_size))
+                for result_item in result_items:
+                    yield result_item
 
 
 class ExportSets():
@@ -659,6 +774,111 @@ class ExportSet():
         else:
             self._response_not_success(response)
 
+    def export_items_in_batches(self, export_name, export_items, batch_size=1000,
+                                export_type=ComplianceConstants.ExportTypes.CAB):
+        """Method to export items from any iterable, e.g.; ComplianceSearchUtils.iter_compliance_search(),
+            in batches, creating an export named <export_name>_<batch number> for each batch
+
+            Args:
+                export_name     (str)       -   Export name prefix for the exported items
+                export_items    (iterable)  -   Search result items which needs to be export
+                batch_size      (int)       -   Number of items in each export
+                                                Default: 1000
+                export_type     (str)       -   ComplianceConstants.ExportTypes Enum values
+                                                Default: CAB
+
+            Returns:
+                (list)  -   List of the restore job IDs for the export operations
+
+            Raises:
+                SDKException:
+                    Response was not success
+
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise SDKException('ComplianceSearch', '110')
+        export_items = iter(export_items)
+        job_ids = []
+        batch = list(islice(export_items, batch_size))
+        while batch:
+            job_ids.append(self.export_items_to_set(f"{export_name}_{len(job_ids) + 1}", batch, export_type))
+            batch = list(islice(export_items, batch_size))
+        return job_ids
+
+    def wait_for_exports(self, job_ids, timeout=3600, poll_interval=5, max_poll_interval=60):
+        """Method to wait for the export jobs to finish. Jobs are polled at an interval which grows
+            from poll_interval to max_poll_interval, so that long running exports are not polled every few seconds
+
+            Args:
+                job_ids             (list)  -   Restore job IDs returned by the export operations
+                timeout             (int)   -   Time in seconds to wait for all the jobs to finish
+                                                Default: 3600
+                poll_interval       (int)   -   Interval in seconds before the first poll
+                                                Default: 5
+                max_poll_interval   (int)   -   Maximum interval in seconds between two polls
+                                                Default: 60
+
+            Returns:
+                (dict)  -   Status of each of the export jobs
+
+            Raises:
+                SDKException:
+                    Export jobs did not finish within the timeout
+
+        """
+        jobs = [self._commcell.job_controller.get(job_id) for job_id in job_ids]
+        end_time = time.time() + timeout
+        retry = 0
+        while not all(job.is_finished for job in jobs):
+            if time.time() > end_time:
+                raise SDKException('ComplianceSearch', '112')
+            retry += 1
+            time.sleep(self._commcell.retry_policy.get_delay(retry, poll_interval, max_poll_interval))
+        self.refresh()
+        return {job.job_id: job.status for job in jobs}
+
+    def download_exports(self, download_folder, export_names=None, job_ids=None,
+                         max_concurrency=4, timeout=3600):
+        """Method to download the exports of the export set concurrently.
+            Partially downloaded files are resumed when the download is run again.
+
+            Args:
+                download_folder     (str)   -   Path of the folder in which exported items zip files should be saved
+                export_names        (list)  -   Names of the exports to download
+                                                Default: None (all the exports of the export set)
+                job_ids             (list)  -   Restore job IDs of the exports to wait for before downloading
+                                                Default: None
+                max_concurrency     (int)   -   Maximum number of exports downloaded at a time
+                                                Default: 4
+                timeout             (int)   -   Time in seconds to wait for the export jobs to finish
+                                                Default: 3600
+
+            Returns:
+                (dict)  -   Path of the downloaded zip file for each export name
+
+            Raises:
+                SDKException:
+                    Export not found under the export set
+
+                    Failed to download the exports
+
+        """
+        if job_ids:
+            self.wait_for_exports(job_ids, timeout=timeout)
+        if export_names is None:
+            export_names = list(self._all_exports)
+        exports = [(export_name, self.get(export_name)) for export_name in export_names]
+        runner = BulkOperationRunner(max_concurrency=max_concurrency)
+        downloaded, failed = {}, {}
+        for (export_name, _), result in runner.run(lambda item: item[1].download_export(download_folder), exports):
+            if isinstance(result, Exception):
+                failed[export_name] = str(result)
+            else:
+                downloaded[export_name] = result
+        if failed:
+            raise SDKException('ComplianceSearch', '111', str(failed))
+        return downloaded
+
     @staticmethod
     def select(result_items, no_of_files=0, export_all=False):
         """Static Method to randomly pick user input amount of items from the search result items
@@ -799,6 +1019,77 @@ class Export():
                 ]
             }
 
+    def _download_cloud_file(self, url, download_file, chunk_size=1024 ** 2):
+        """Method to download the exported items from the cloud URL to the file, in chunks.
+            Data is written to <download_file>.part, and a partial file left by a dropped connection
+            is resumed with an HTTP range request.
+
+            Args:
+                url             (str)   -   Cloud URL of the exported items
+                download_file   (str)   -   Path of the file to save the exported items
+                chunk_size      (int)   -   Size of each chunk written to the file
+                                            Default: 1 MB
+
+            Returns:
+                (str) path of the downloaded file
+
+            Raises:
+                SDKException:
+                    Failed to download the file, or the checksum of the file does not match
+
+                    Cloud URL returned a client error, other than a timeout or throttling,
+                    e.g.; 403 / 404 for an expired URL
+
+        """
+        part_file = f'{download_file}.part'
+        content_md5 = None
+        for _ in self._commcell.retry_policy.attempts('Export.download_export'):
+            offset = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+            headers = {'Range': f'bytes={offset}-'} if offset else {}
+            try:
+                with requests.get(url, headers=headers, stream=True, timeout=300) as cloud_file:
+                    if cloud_file.status_code == 416:
+                        break
+                    if 400 <= cloud_file.status_code < 500 and cloud_file.status_code not in (408, 429):
+                        # e.g.; the cloud URL expired, retrying will not help
+                        raise SDKException(
+                            'ComplianceSearch', '109', f'Cloud URL returned status code {cloud_file.status_code}'
+                        )
+                    if cloud_file.status_code not in (200, 206):
+                        continue
+                    mode = 'ab' if cloud_file.status_code == 206 else 'wb'
+                    if cloud_file.status_code == 200:
+                        content_md5 = cloud_file.headers.get('Content-MD5')
+                    with open(part_file, mode) as file_pointer:
+                        for chunk in cloud_file.iter_content(chunk_size=chunk_size):
+                            file_pointer.write(chunk)
+                break
+            except requests.exceptions.RequestException:
+                continue
+        else:
+            raise SDKException('ComplianceSearch', '109')
+
+        if content_md5 is None:
+            # MD5 of a range response covers only the range, get the MD5 of the whole file
+            for _ in self._commcell.retry_policy.attempts('Export.download_export'):
+                try:
+                    content_md5 = requests.head(url, timeout=300).headers.get('Content-MD5')
+                    break
+                except requests.exceptions.RequestException:
+                    continue
+            else:
+                raise SDKException('ComplianceSearch', '109', 'Failed to get the checksum of the downloaded file')
+        if content_md5:
+            md5 = hashlib.md5()
+            with open(part_file, 'rb') as file_pointer:
+                for chunk in iter(lambda: file_pointer.read(chunk_size), b''):
+                    md5.update(chunk)
+            if base64.b64encode(md5.digest()).decode() != content_md5:
+                os.remove(part_file)
+                raise SDKException('ComplianceSearch', '109', 'Checksum of the downloaded file does not match')
+        os.replace(part_file, download_file)
+        return download_file
+
     def download_export(self, download_folder):
         """Method to download the exported items to a zip file
 
@@ -820,14 +1111,8 @@ class Export():
                 file_content = response.json()['fileContent']
                 download_file = os.path.join(download_folder, file_content['fileName'])
                 if 'cloudUrl' in response.json():
-                    url = response.json()['cloudUrl']
-                    cloud_file = requests.get(url)
-                    if cloud_file.status_code == 200:
-                        file_data = cloud_file.content
-                    else:
-                        raise SDKException('ComplianceSearch', '109')
-                else:
-                    file_data = base64.b64decode(file_content['data'])
+                    return self._download_cloud_file(response.json()['cloudUrl'], download_file)
+                file_data = base64.b64decode(file_content['data'])
                 with open(download_file, "wb") as f:
                     f.write(file_data)
                 return download_file
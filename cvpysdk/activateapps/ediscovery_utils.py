@@ -1430,7 +1430,10 @@ class EdiscoveryClientOperations():
 
             Args:
 
-                doc_id          (str)       --  Document id (Mandatory in case of SDG)
+                doc_id          (str/list)  --  Document id or list of document ids (Mandatory in case of SDG)
+
+                                                    list of document ids from the same data source are
+                                                    updated in a single request
 
                 comment         (str)       --  User comment
 
@@ -1466,23 +1469,26 @@ class EdiscoveryClientOperations():
                     'EdiscoveryClients',
                     '102',
                     "DataSource id is mandatory for request from SDG app")
+        review_set_id = self._request_review_set_id
         if self._request_app == TargetApps.FSO.name:
-            self._request_review_set_id = f"FSO_{self._request_review_set_id}"
+            review_set_id = f"FSO_{review_set_id}"
         req_json = {
             "nameValues": [
                 {
-                    "name": f"ConsentFor_{self._request_review_set_id}_b",
+                    "name": f"ConsentFor_{review_set_id}_b",
                     "value": f"{consent}"
                 },
 
                 {
-                    "name": f"CommentFor_{self._request_review_set_id}",
+                    "name": f"CommentFor_{review_set_id}",
                     "value": comment
                 }
             ]
         }
 
         if self._request_app == TargetApps.SDG.name:
+            if isinstance(doc_id, (list, tuple, set)):
+                doc_id = f"({' OR '.join(doc_id)})"
             req_json['nameValues'].append({
                 "name": "q",
                 "value": f"contentid:{doc_id}"
@@ -1494,11 +1500,11 @@ class EdiscoveryClientOperations():
         elif self._request_app == TargetApps.FSO.name:
             req_json['nameValues'].append({
                 "name": "fq",
-                "value": f"contentid:* AND -(ConsentFor_{self._request_review_set_id}_b:*)"
+                "value": f"contentid:* AND -(ConsentFor_{review_set_id}_b:*)"
             })
         if self._request_type == RequestConstants.RequestType.EXPORT.value:
             req_json['nameValues'].append({
-                "name": f"RedactMode_{self._request_review_set_id}_b",
+                "name": f"RedactMode_{review_set_id}_b",
                 "value": f"{redact}"
             })
 
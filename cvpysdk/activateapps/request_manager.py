@@ -65,6 +65,14 @@ Request:
 
      get_document_details()             --  returns the document details for this request
 
+     iter_documents()                   --  yields the document details for this request, page by page
+
+     _get_document_batches()            --  yields the batches of documents to be reviewed for this request
+
+     _review_document_batch()           --  marks review for a batch of documents
+
+     bulk_review_documents()            --  marks review for all the documents matching the query, in batches
+
      mark_review_complete()             --  marks request as review complete
 
      request_approval()                 --  Request approval for this review request
@@ -101,6 +109,7 @@ Request Attributes:
 """
 import copy
 
+from ..bulk_operations import BulkOperationRunner
 from ..exception import SDKException
 from ..activateapps.constants import RequestConstants, TargetApps
 from ..activateapps.ediscovery_utils import EdiscoveryClientOperations
@@ -611,6 +620,195 @@ class Request:
             raise SDKException('RequestManager', '102', 'Failed to get document details for this request')
         self._response_not_success(response)
 
+    def iter_documents(self, criteria=None, attr_list=None, query="*:*", start=0, page_size=500):
+        """Yields the document details for this request, fetching them page by page
+
+            Args:
+
+                criteria        (str)      --  containing criteria for query
+
+                attr_list       (set)      --  Column names to be returned in results
+
+                query           (str)      --  query to be performed (acts as q param in query)
+
+                start           (int)      --  Specifies start index for fetching documents
+
+                page_size       (int)      --  No of document details fetched in each request
+                                                    default:500
+
+            Yields:
+
+                dict        --  Containing document details
+
+            Raises:
+
+                SDKException:
+
+                    if failed to perform search
+        """
+        total, docs = self.get_document_details(
+            criteria=criteria, attr_list=attr_list, query=query, start=start, rows=page_size)
+        while docs:
+            for doc in docs:
+                yield doc
+            start = start + len(docs)
+            if start >= total:
+                return
+            _, docs = self.get_document_details(
+                criteria=criteria, attr_list=attr_list, query=query, start=start, rows=page_size)
+
+    def _get_document_batches(self, total, criteria, query, start, batch_size):
+        """Yields the batches of documents to be reviewed for this request
+
+            Args:
+
+                total           (int)      --  total no of documents matching the query
+
+                criteria        (str)      --  containing criteria for query
+
+                query           (str)      --  query to be performed
+
+                start           (int)      --  start index of the first batch
+
+                batch_size      (int)      --  No of documents in each batch
+
+            Yields:
+
+                tuple       --  start index of the batch, list of document details in the batch
+        """
+        for offset in range(start, total, batch_size):
+            _, docs = self.get_document_details(
+                criteria=criteria, attr_list={"contentid", "data_source"}, query=query, start=offset, rows=batch_size)
+            if not docs:
+                return
+            yield offset, docs
+
+    def _review_document_batch(self, docs, comment, consent, redact):
+        """Marks review for a batch of documents, with a single update for the documents of each data source
+
+            Args:
+
+                docs            (list)      --  Document details containing contentid & data_source
+
+                comment         (str)       --  User comment
+
+                consent         (bool)      --  Accept or Decline
+
+                redact          (bool)      --  Redact ON or OFF
+
+            Returns:
+
+                int     --  No of documents reviewed
+
+            Raises:
+
+                SDKException:
+
+                    if failed to update documents
+        """
+        doc_ids = {}
+        for doc in docs:
+            doc_ids.setdefault(doc['data_source'], []).append(doc['contentid'])
+        for ds_id, ids in doc_ids.items():
+            self._ediscovery_client_ops.do_document_task(
+                comment=comment, doc_id=ids, ds_id=ds_id, consent=consent, redact=redact)
+        return len(docs)
+
+    def bulk_review_documents(self, comment, criteria=None, query="*:*", consent=True, redact=False,
+                              batch_size=200, max_concurrency=1, start=0, progress_callback=None):
+        """Marks review for all the documents matching the query on this request
+
+            Documents are paged from the request in batches, and each batch is updated with one request
+            per data source. Batches are updated over a pool of max_concurrency workers.
+
+            If any batch fails, the remaining batches are still updated, and the start index of the first
+            failed batch is returned as next_start, which can be passed back as start to resume the review.
+            Query should not filter on the review fields, so that the document offsets do not shift
+            while the review is in progress.
+
+            For requests from FSO app, all the non-reviewed documents are updated in a single request.
+
+            Args:
+
+                comment             (str)       --  User comment
+
+                criteria            (str)       --  containing criteria for query
+
+                query               (str)       --  query to be performed (acts as q param in query)
+
+                consent             (bool)      --  Accept or Decline (Default:True)
+
+                redact              (bool)      --  Redact ON or OFF (only in case of export)
+                                                            (Default:False)
+
+                batch_size          (int)       --  No of documents updated in each request
+                                                            (Default:200)
+
+                max_concurrency     (int)       --  No of batches updated at a time
+                                                            (Default:1)
+
+                start               (int)       --  start index of the documents to review, to resume
+                                                    a previous bulk review
+                                                            (Default:0)
+
+                progress_callback   (func)      --  function called with the no of reviewed documents and
+                                                    the total no of documents, after each batch
+
+            Returns:
+
+                dict    --  Containing the review summary
+
+                            Example : {
+                                            'TotalDocuments': 100000,
+                                            'ReviewedDocuments': 99800,
+                                            'FailedBatches': [(2000, 'error message')],
+                                            'next_start': 2000
+                                        }
+
+            Raises:
+
+                SDKException:
+
+                    if input is not valid
+
+                    if failed to perform search
+        """
+        if not isinstance(batch_size, int) or batch_size < 1 or not isinstance(start, int) or start < 0:
+            raise SDKException('RequestManager', '101')
+        if self.request_app == TargetApps.FSO.name:
+            total = int(self.review_stats()[RequestConstants.FIELD_NOT_REVIEWED])
+            self.review_document(comment=comment, consent=consent, redact=redact)
+            if progress_callback:
+                progress_callback(total, total)
+            return {
+                RequestConstants.FIELD_DOC_COUNT: total,
+                RequestConstants.FIELD_REVIEWED: total,
+                'FailedBatches': [],
+                'next_start': None
+            }
+
+        total, _ = self.get_document_details(criteria=criteria, query=query, start=0, rows=0)
+        reviewed = 0
+        failed_batches = []
+        runner = BulkOperationRunner(max_concurrency=max_concurrency)
+        batches = self._get_document_batches(total, criteria, query, start, batch_size)
+        for (offset, _), result in runner.run(
+                lambda batch: self._review_document_batch(batch[1], comment, consent, redact), batches):
+            if isinstance(result, Exception):
+                failed_batches.append((offset, str(result)))
+                continue
+            reviewed = reviewed + result
+            if progress_callback:
+                progress_callback(reviewed, total - start)
+
+        failed_batches.sort()
+        return {
+            RequestConstants.FIELD_DOC_COUNT: total,
+            RequestConstants.FIELD_REVIEWED: reviewed,
+            'FailedBatches': failed_batches,
+            'next_start': failed_batches[0][0] if failed_batches else None
+        }
+
     def review_stats(self):
         """returns review statistics for this request
 
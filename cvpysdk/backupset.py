@@ -81,7 +81,7 @@ Backupset:
     _get_backupset_properties()     -- get the properties of this backupset
 
     _run_backup()                   -- runs full backup for the specified subclient,
-    and appends the job object to the return list
+    and returns the job object
 
     _update()                       -- updates the properties of the backupset
 
@@ -138,12 +138,12 @@ Backupset instance Attributes
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-import threading
 import time
 import copy
 
 from base64 import b64encode
 
+from .bulk_operations import BulkOperationRunner
 from .subclient import Subclients
 from .schedules import Schedules
 from .exception import SDKException
@@ -1212,18 +1212,13 @@ class Backupset(object):
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
-    def _run_backup(self, subclient_name, return_list, **kwargs):
-        """Triggers backup job for the given subclient, and appends its Job object to the list.
+    def _run_backup(self, subclient_name, **kwargs):
+        """Triggers backup job for the given subclient, and returns its Job object.
             Backup job is started only when backup activity is enabled and storage policy is set for it.
 
-            The SDKException class instance is appended to the list,
-            if any exception is raised while running the backup job for the Subclient.
-
             Args:
                 subclient_name (str)   --  name of the subclient to trigger the backup for
 
-                return_list    (list)  --  list to append the job object to
-
             Kwargs:
                 All arguments used by subclient.backup() can be used here. Commonly used arguments are
 
@@ -1233,17 +1228,18 @@ class Backupset(object):
                                     making the request
 
             Returns:
-                None
+                object  -   instance of the Job class for the backup job started
+
+                None    -   if backup is not enabled or storage policy is not set for the subclient
+
+            Raises:
+                SDKException:
+                    if failed to run the backup job
 
         """
-        try:
-            subclient = self.subclients.get(subclient_name)
-            if subclient.is_backup_enabled and subclient.storage_policy is not None:
-                job = subclient.backup(**kwargs)
-                return_list.append(job)
-                time.sleep(2)  # Staggering the next backup job to be started
-        except SDKException as excp:
-            return_list.append(excp)
+        subclient = self.subclients.get(subclient_name)
+        if subclient.is_backup_enabled and subclient.storage_policy is not None:
+            return subclient.backup(**kwargs)
 
     def _process_update_reponse(self, request_json):
         """Runs the Backupset update API with the request JSON provided,
@@ -1806,16 +1802,12 @@ class Backupset(object):
         options = self._prepare_browse_options(options)
         request_json = self._prepare_browse_json(options)
 
-        flag, response = self._cvpysdk_object.make_request('POST', self._BROWSE, request_json)
+        for _ in self._commcell_object.retry_policy.attempts('Backupset._do_browse', max_attempts=retry + 1):
+            flag, response = self._cvpysdk_object.make_request('POST', self._BROWSE, request_json)
 
-        attempt = 1
-        while attempt <= retry:
-            if response.json() == {}:
-                time.sleep(120)
-                flag, response = self._cvpysdk_object.make_request('POST', self._BROWSE, request_json)
-            else:
+            if response.json() != {}:
                 break
-            attempt += 1
+
         return self._process_browse_response(flag, response, options)
 
     def update_properties(self, properties_dict):
@@ -2093,24 +2085,40 @@ class Backupset(object):
                 common_backup_options      (dict)  --  advanced job options to be included while
                                                         making request
 
+                max_concurrency     (int)   --  maximum number of backup requests in flight
+
+                    default: 10
+
+                rate                (float) --  maximum number of backup jobs started per second
+
+                    default: None   (no rate limit)
+
+                    the job starts are no longer spaced 2 seconds apart, pass the rate to
+                    space them out, e.g.; rate=0.5 for a job every 2 seconds
+
             Returns:
                 list    -   list consisting of the job objects for the backup jobs started for
-                the subclients in the backupset
+                the subclients in the backupset, and the SDKException instance for the subclients
+                the backup failed to start for
+
+            Raises:
+                Exception:
+                    any exception other than SDKException raised while starting a backup job
 
         """
         return_list = []
-        thread_list = []
+        runner = BulkOperationRunner(
+            max_concurrency=kwargs.pop('max_concurrency', 10), rate=kwargs.pop('rate', None)
+        )
 
-        if self.subclients.all_subclients:
-            for subclient in self.subclients.all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list), kwargs=kwargs
-                )
-                thread_list.append(thread)
-                thread.start()
+        for _, result in runner.run(
+                lambda subclient: self._run_backup(subclient, **kwargs), self.subclients.all_subclients
+        ):
+            if isinstance(result, Exception) and not isinstance(result, SDKException):
+                raise result
 
-        for thread in thread_list:
-            thread.join()
+            if result is not None:
+                return_list.append(result)
 
         return return_list
 
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Main file for running an operation on a large number of entities concurrently.
+
+This file has the classes used to launch jobs (backups, restores, aux copies, etc.) in bulk,
+with a bound on the number of requests in flight and on the rate at which they are started.
+
+RateLimiter:    Token bucket used to limit the rate at which operations are started
+
+BulkOperationRunner:    Runs an operation on a list of items over a bounded worker pool
+
+RateLimiter:
+    __init__(rate, burst)       --  initialize object of the RateLimiter class
+
+    acquire()                   --  blocks until a token is available and consumes it
+
+BulkOperationRunner:
+    __init__(max_concurrency,
+             rate,
+             burst)             --  initialize object of the BulkOperationRunner class
+
+    run()                       --  runs the operation for each item and yields the results
+                                    as they complete
+
+    _run()                      --  generator submitting the items to the pool and yielding the results
+
+    run_all()                   --  runs the operation for each item and returns the list of results
+
+Usage
+=====
+
+    >>> runner = BulkOperationRunner(max_concurrency=10, rate=2)
+
+    >>> for subclient, job in runner.run(lambda subclient: subclient.backup('Full'), subclients):
+    ...     print(subclient.subclient_name, job)
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .exception import SDKException
+
+
+class RateLimiter(object):
+    """Token bucket rate limiter, safe to be shared across threads."""
+
+    def __init__(self, rate, burst=1):
+        """Initialize object of the RateLimiter class.
+
+            Args:
+                rate    (float)     --  number of tokens added to the bucket per second
+
+                burst   (int)       --  maximum number of tokens the bucket can hold
+
+                    default: 1
+
+            Raises:
+                SDKException:
+                    if rate or burst is not a positive number
+        """
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise SDKException('BulkOperations', '101')
+
+        if not isinstance(burst, int) or burst < 1:
+            raise SDKException('BulkOperations', '101')
+
+        self._rate = float(rate)
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Representation string for the instance of the RateLimiter class."""
+        return "RateLimiter class instance with rate: {0}/s and burst: {1}".format(self._rate, self._burst)
+
+    def acquire(self):
+        """Blocks until a token is available in the bucket, and consumes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) / self._rate
+
+            time.sleep(wait_time)
+
+
+class BulkOperationRunner(object):
+    """Class for running an operation on a list of items over a bounded worker pool."""
+
+    def __init__(self, max_concurrency=10, rate=None, burst=1):
+        """Initialize object of the BulkOperationRunner class.
+
+            Args:
+                max_concurrency     (int)       --  maximum number of operations running at a time
+
+                    default: 10
+
+                rate                (float)     --  maximum number of operations started per second
+
+                    default: None   (no rate limit)
+
+                burst               (int)       --  number of operations which can be started at
+                once before the rate limit applies
+
+                    default: 1
+
+            Raises:
+                SDKException:
+                    if max_concurrency is not a positive integer
+
+                    if rate or burst is not a positive number
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise SDKException('BulkOperations', '101')
+
+        self._max_concurrency = max_concurrency
+        self._rate_limiter = RateLimiter(rate, burst) if rate else None
+
+    def __repr__(self):
+        """Representation string for the instance of the BulkOperationRunner class."""
+        return "BulkOperationRunner class instance with max concurrency: {0}".format(self._max_concurrency)
+
+    def _execute(self, operation, item):
+        """Waits for the rate limiter and runs the operation for the item.
+
+            Returns:
+                object  -   value returned by the operation, or the exception raised by it
+        """
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
+
+        try:
+            return operation(item)
+        except Exception as excp:
+            return excp
+
+    def run(self, operation, items):
+        """Runs the operation for each item, and yields the results as they complete.
+
+            At most max_concurrency items are submitted to the pool at a time, so the items
+            can be a generator over any number of entities.
+
+            Args:
+                operation   (callable)  --  function to run for each item, e.g.;
+                lambda subclient: subclient.backup()
+
+                items       (iterable)  --  items to run the operation for
+
+            Returns:
+                generator   -   yields the tuple (item, result), where result is the value returned
+                by the operation, e.g.; Job instance, or the exception raised by it
+
+            Raises:
+                SDKException:
+                    if the operation is not callable
+        """
+        # validated here, and not in the generator, so that the error is raised on the call
+        if not callable(operation):
+            raise SDKException('BulkOperations', '101')
+
+        return self._run(operation, iter(items))
+
+    def _run(self, operation, items):
+        """Submits the items to the pool, at most max_concurrency at a time, and yields the
+            (item, result) tuples as the operations complete."""
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            pending = {}
+
+            for item in items:
+                pending[executor.submit(self._execute, operation, item)] = item
+
+                if len(pending) < self._max_concurrency:
+                    continue
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+    def run_all(self, operation, items):
+        """Runs the operation for each item, and returns the results once all of them complete.
+
+            Args:
+                operation   (callable)  --  function to run for each item
+
+                items       (iterable)  --  items to run the operation for
+
+            Returns:
+                list    -   list of (item, result) tuples in the order of completion
+        """
+        return list(self.run(operation, items))
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Main file for watching the changes to the events, console alerts and jobs of the commcell.
+
+ChangeFeed keeps a high-water mark for each of the sources, i.e.; the last event ID, the last
+console alert ID and the last job update time seen, and returns only the changes after it on each poll.
+
+A ChangeFeed instance for the commcell is returned by `commcell.watch()`.
+
+ChangeFeed:
+    __init__(commcell_object,
+             sources,
+             interval,
+             callback,
+             include_existing,
+             page_size)             --  initialize object of the ChangeFeed class
+
+    __repr__()                      --  returns the string representation of the change feed
+
+    _get_event_changes()            --  returns the events raised after the last event ID seen
+
+    _get_alert_changes()            --  returns the console alerts raised after the last alert ID seen
+
+    _get_job_changes()              --  returns the jobs updated after the last poll
+
+    poll()                          --  returns the changes on all the sources since the last poll
+
+    watch()                         --  polls the sources at the interval, and yields the changes
+
+    reset()                         --  clears the high-water marks of the sources
+
+Attributes
+----------
+
+    **high_water_marks**    --  returns the last event ID, console alert ID and job update time seen
+
+Change record
+=============
+
+    Each change is a dict with the source, the ID of the entity and its details, as returned by the server
+
+        {
+            'source': 'job',            # event / alert / job
+
+            'id': 1234,
+
+            'time': 1700000000,         # event time / alert detected time / job last update time
+
+            'details': {...}
+        }
+
+Usage
+=====
+
+    >>> feed = commcell.watch(interval=30, sources=['jobs', 'alerts'])
+
+    >>> for change in feed.watch():
+    ...     print(change['source'], change['id'])
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import time
+
+from .exception import SDKException
+
+
+class ChangeFeed(object):
+    """Class for polling the events, console alerts and jobs of the commcell for changes."""
+
+    SOURCES = ('events', 'alerts', 'jobs')
+
+    def __init__(
+            self,
+            commcell_object,
+            sources=None,
+            interval=30,
+            callback=None,
+            include_existing=False,
+            page_size=100):
+        """Initialize object of the ChangeFeed class.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                sources             (list)      --  sources to watch for the changes
+
+                    Valid Values:
+
+                        - events
+
+                        - alerts
+
+                        - jobs
+
+                    default: None   (all the sources)
+
+                interval            (float)     --  time in seconds between two polls
+
+                    default: 30
+
+                callback            (callable)  --  function called with each change record
+
+                    default: None
+
+                include_existing    (bool)      --  if True, the first poll returns the existing
+                entities as changes, otherwise it only sets the high-water marks
+
+                    default: False
+
+                page_size           (int)       --  number of console alerts and jobs fetched per request
+
+                    default: 100
+
+            Raises:
+                SDKException:
+                    if type or value of the inputs is not valid
+        """
+        sources = list(self.SOURCES) if sources is None else sources
+
+        if not isinstance(sources, (list, tuple)) or not set(sources).issubset(self.SOURCES):
+            raise SDKException('ChangeFeed', '101')
+
+        if not isinstance(interval, (int, float)) or interval < 0:
+            raise SDKException('ChangeFeed', '101')
+
+        if callback is not None and not callable(callback):
+            raise SDKException('ChangeFeed', '101')
+
+        self._commcell_object = commcell_object
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._services = commcell_object._services
+        self._update_response_ = commcell_object._update_response_
+
+        self._sources = list(sources)
+        self._interval = interval
+        self._callback = callback
+        self._include_existing = include_existing
+        self._page_size = page_size
+
+        self.reset()
+
+    def __repr__(self):
+        """Representation string for the instance of the ChangeFeed class."""
+        return "ChangeFeed class instance for sources: {0}".format(', '.join(self._sources))
+
+    def _get_event_changes(self):
+        """Returns the events raised after the last event ID seen.
+
+            The events API does not filter on the event ID, so the events are filtered on the client.
+
+            Returns:
+                list    -   change records of the new events
+        """
+        events = self._commcell_object.event_viewer.events(details=True)
+        changes = []
+
+        for event_id in sorted(events, key=int):
+            if self._last_event_id is not None and int(event_id) <= self._last_event_id:
+                continue
+
+            details = events[event_id]
+            changes.append({
+                'source': 'event',
+                'id': int(event_id),
+                'time': details.get('timeSource'),
+                'details': details
+            })
+
+        if events:
+            self._last_event_id = max([int(event_id) for event_id in events] + [self._last_event_id or 0])
+
+        return changes
+
+    def _get_alert_changes(self):
+        """Returns the console alerts raised after the last console alert ID seen.
+
+            Console alerts are returned newest first, so the pages are fetched until a page has an
+            alert which was seen already.
+
+            Returns:
+                list    -   change records of the new console alerts
+        """
+        changes = []
+        page_number = 1
+
+        while True:
+            flag, response = self._cvpysdk_object.make_request(
+                'GET', self._services['GET_ALL_CONSOLE_ALERTS'] % (page_number, self._page_size)
+            )
+
+            if not flag:
+                raise SDKException('Response', '101', self._update_response_(response.text))
+
+            if not response.json() or 'totalNoOfAlerts' not in response.json():
+                raise SDKException('Response', '102')
+
+            feeds = response.json().get('feedsList', [])
+            new_feeds = [
+                feed for feed in feeds
+                if self._last_alert_id is None or int(feed['liveFeedId']) > self._last_alert_id
+            ]
+
+            for feed in new_feeds:
+                changes.append({
+                    'source': 'alert',
+                    'id': int(feed['liveFeedId']),
+                    'time': feed.get('detectedTime', {}).get('time'),
+                    'details': feed
+                })
+
+            # only the newest page is needed to set the high-water mark on the first poll
+            if (self._last_alert_id is None or len(new_feeds) < len(feeds)
+                    or len(feeds) < self._page_size):
+                break
+
+            page_number += 1
+
+        if changes:
+            self._last_alert_id = max(change['id'] for change in changes)
+
+        changes.sort(key=lambda change: change['id'])
+        return changes
+
+    def _get_job_changes(self):
+        """Returns the jobs updated after the last poll.
+
+            Only the jobs finished after the last job update time seen are requested, along with the
+            active jobs, and a job is returned again only if its status, progress or update time changed.
+
+            Returns:
+                list    -   change records of the updated jobs
+        """
+        lookup_time = 24
+        if self._last_job_update_time is not None:
+            # hours since the last update seen, with a minute of margin for the clock skew
+            lookup_time = max(time.time() - self._last_job_update_time + 60, 60) / 3600
+
+        job_controller = self._commcell_object.job_controller
+        jobs = {}
+        offset = 0
+
+        while True:
+            page, page_info = job_controller._get_jobs_list(
+                category='ALL',
+                lookup_time=lookup_time,
+                limit=self._page_size,
+                offset=offset,
+                job_summary='full',
+                paging_info=True
+            )
+
+            # the jobs are keyed by the job ID, so a job moved to the next page by the jobs
+            # started while paging is returned only once
+            jobs.update(page)
+            offset += self._page_size
+
+            # the jobs not visible are dropped from the page, so the server count decides the last page
+            if page_info['count'] < self._page_size:
+                break
+
+            if page_info['total'] is not None and offset >= page_info['total']:
+                break
+
+        changes = []
+
+        for job_id in sorted(jobs):
+            job_summary = jobs[job_id]
+            update_time = job_summary.get('lastUpdateTime', 0)
+            signature = (job_summary.get('status'), job_summary.get('percentComplete'), update_time)
+
+            if self._job_signatures.get(job_id) == signature:
+                continue
+
+            self._job_signatures[job_id] = signature
+            changes.append({
+                'source': 'job',
+                'id': job_id,
+                'time': update_time,
+                'details': job_summary
+            })
+
+            if update_time:
+                self._last_job_update_time = max(self._last_job_update_time or 0, update_time)
+
+        # jobs out of the lookup window will not be returned again, and need not be tracked
+        for job_id in list(self._job_signatures):
+            if job_id not in jobs:
+                del self._job_signatures[job_id]
+
+        if self._last_job_update_time is None:
+            self._last_job_update_time = int(time.time())
+
+        return changes
+
+    def poll(self):
+        """Returns the changes on the sources since the last poll, and calls the callback, if any,
+            with each change.
+
+            Returns:
+                list    -   change records for the changes on all the sources
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        source_methods = {
+            'events': self._get_event_changes,
+            'alerts': self._get_alert_changes,
+            'jobs': self._get_job_changes
+        }
+
+        changes = []
+        for source in self._sources:
+            changes.extend(source_methods[source]())
+
+        if self._first_poll:
+            self._first_poll = False
+
+            if not self._include_existing:
+                return []
+
+        if self._callback:
+            for change in changes:
+                self._callback(change)
+
+        return changes
+
+    def watch(self, max_polls=None):
+        """Polls the sources at the interval, and yields the changes.
+
+            Args:
+                max_polls   (int)   --  number of polls after which to stop watching
+
+                    default: None   (watch until the caller stops iterating)
+
+            Yields:
+                dict    -   change record for each change on the sources
+        """
+        polls = 0
+
+        while max_polls is None or polls < max_polls:
+            start_time = time.monotonic()
+
+            for change in self.poll():
+                yield change
+
+            polls += 1
+
+            if max_polls is not None and polls >= max_polls:
+                break
+
+            time.sleep(max(0, self._interval - (time.monotonic() - start_time)))
+
+    def reset(self):
+        """Clears the high-water marks, so that the next poll starts the feed again."""
+        self._last_event_id = None
+        self._last_alert_id = None
+        self._last_job_update_time = None
+        self._job_signatures = {}
+        self._first_poll = True
+
+    @property
+    def high_water_marks(self):
+        """Returns the last event ID, console alert ID and job update time seen
+
+            dict - consists of the high-water mark of each source
+
+                {
+                    'events': 1234,
+                    'alerts': 56,
+                    'jobs': 1700000000
+                }
+        """
+        return {
+            'events': self._last_event_id,
+            'alerts': self._last_alert_id,
+            'jobs': self._last_job_update_time
+        }
@@ -74,6 +74,12 @@ Clients
 
     _get_client_from_displayname()        --  get the client name for given display name
 
+    _get_client_name_index()              --  returns the index of the names, host names and display
+    names of all the clients, mapped to the client name
+
+    resolve_client_names()                --  returns the client names for the list of names / host
+    names / display names, and the inputs not matching any client
+
     _get_fl_parameters()                  --  Returns the fl parameters to be passed in the mongodb caching api call
 
     _get_sort_parameters()                --  Returns the sort parameters to be passed in the mongodb caching api call
@@ -619,10 +625,8 @@ class Clients(object):
                     if response is not success
 
         """
-        attempts = 0
-        while attempts < 5:
+        for _ in self._commcell_object.retry_policy.attempts('Clients._get_clients'):
             flag, response = self._cvpysdk_object.make_request('GET', self._CLIENTS)
-            attempts += 1
 
             if flag:
                 if response.json() and 'clientProperties' in response.json():
@@ -644,10 +648,10 @@ class Clients(object):
                     return clients_dict
                 else:
                     return {} # logged in user might not have privileges on any client
-            else:
-                if attempts > 4:
-                    raise SDKException('Response', '101', self._update_response_(response.text))
-                time.sleep(5)
+            elif not self._commcell_object.retry_policy.is_retryable(response):
+                break
+
+        raise SDKException('Response', '101', self._update_response_(response.text))
 
     def _get_office_365_clients(self):
         """REST API call to get all office365 clients in the commcell
@@ -1108,6 +1112,84 @@ class Clients(object):
                 raise SDKException('Client', '102', 'Multiple clients have the same display name')
         return client_name
 
+    def _get_client_name_index(self):
+        """Returns the index of the names, host names and display names of all the clients, built
+            once per refresh of the clients.
+
+            The keys are matched in the same order as has_client(): client name, host name, hidden
+            client name, hidden client host name, and then display name. Display names shared by
+            multiple clients are not indexed.
+
+            Returns:
+                dict    -   lower case name / host name / display name mapped to the client name
+        """
+        if self._client_name_index is not None:
+            return self._client_name_index
+
+        index = {}
+        all_clients = self.all_clients or {}
+        hidden_clients = self.hidden_clients or {}
+
+        for client_name in all_clients:
+            index[client_name] = client_name
+
+        for client_name, client in all_clients.items():
+            index.setdefault(client['hostname'], client_name)
+
+        for client_name in hidden_clients:
+            index.setdefault(client_name, client_name)
+
+        for client_name, client in hidden_clients.items():
+            index.setdefault(client['hostname'], client_name)
+
+        display_names = {}
+        for client_name, client in all_clients.items():
+            display_names.setdefault(client['displayName'], []).append(client_name)
+
+        for display_name, client_names in display_names.items():
+            if len(client_names) == 1:
+                index.setdefault(display_name, client_names[0])
+
+        self._client_name_index = index
+        return index
+
+    def resolve_client_names(self, client_names):
+        """Returns the client names for the list of names / host names / display names of the
+            clients, looked up in the index of all the clients instead of scanning the clients
+            for each of the inputs.
+
+            Args:
+                client_names    (list)  --  names / host names / display names of the clients
+
+            Returns:
+                tuple   -   (dict of each input mapped to the client name,
+                list of the inputs not matching any client)
+
+            Raises:
+                SDKException:
+                    if type of the client names argument is not list
+        """
+        if not isinstance(client_names, list):
+            raise SDKException('Client', '101')
+
+        index = self._get_client_name_index()
+        resolved = {}
+        unresolved = []
+
+        for client_name in client_names:
+            if not isinstance(client_name, str):
+                unresolved.append(client_name)
+                continue
+
+            name = index.get(client_name.strip().lower())
+
+            if name is None:
+                unresolved.append(client_name)
+            else:
+                resolved[client_name] = name
+
+        return resolved, unresolved
+
     def _get_fl_parameters(self, fl: list = None) -> str:
         """
         Returns the fl parameters to be passed in the mongodb caching api call
@@ -5156,6 +5238,7 @@ class Clients(object):
         """
         self._clients = self._get_clients()
         self._hidden_clients = self._get_hidden_clients()
+        self._client_name_index = None
         self._virtualization_clients = self._get_virtualization_clients()
         self._virtualization_access_nodes = self._get_virtualization_access_nodes()
         self._office_365_clients = None
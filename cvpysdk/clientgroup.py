@@ -104,6 +104,8 @@ ClientGroup:
 
     _update()                      -- updates the client group properties
 
+    _update_membership()           -- adds/removes the clients in batches of membership_batch_size
+
     _add_or_remove_clients()       -- adds/removes clients to/from a ClientGroup
 
     enable_backup_at_time()        -- enables backup for the client group at the time specified
@@ -130,6 +132,10 @@ ClientGroup:
 
     remove_all_clients()           -- removes all the associated clients from client group
 
+    get_clients_diff()             -- returns the clients to add and remove to match the given clients
+
+    sync_clients()                 -- adds and removes only the clients needed to match the given clients
+
     network()                      -- returns Network class object
 
     push_network_config()          -- performs a push network configuration on client group
@@ -346,14 +352,14 @@ class ClientGroups(object):
         if not isinstance(clients_list, list):
             raise SDKException('ClientGroup', '101')
 
+        resolved, _ = self._commcell_object.clients.resolve_client_names(clients_list)
         clients = []
+        added = set()
 
-        for client in clients_list:
-            if isinstance(client, str):
-                client = client.strip().lower()
-
-                if self._commcell_object.clients.has_client(client):
-                    clients.append(client)
+        for client in resolved.values():
+            if client not in added:
+                added.add(client)
+                clients.append(client)
 
         return clients
 
@@ -1161,6 +1167,9 @@ class ClientGroup(object):
         self._is_smart_client_group = None
         self._company_name = None
 
+        # number of clients sent in each membership update request
+        self.membership_batch_size = 1000
+
         self.refresh()
 
     def __repr__(self):
@@ -1357,7 +1366,8 @@ class ClientGroup(object):
             clientgroup_name,
             clientgroup_description,
             associated_clients=None,
-            operation_type="NONE"):
+            operation_type="NONE",
+            refresh=True):
         """Update the clientgroup properties of this clientgroup.
 
             Args:
@@ -1374,6 +1384,10 @@ class ClientGroup(object):
                         Valid values: NONE, OVERWRITE, ADD, DELETE, CLEAR
                     default: NONE
 
+                refresh                 (bool)      --  refreshes the client group properties
+                                                            after the update
+                    default: True
+
             Raises:
                 SDKException:
                     if response is empty
@@ -1390,7 +1404,7 @@ class ClientGroup(object):
             "CLEAR": 4
         }
 
-        for client in associated_clients:
+        for client in associated_clients or []:
             clients_list.append({'clientName': client})
 
         request_json = {
@@ -1409,7 +1423,8 @@ class ClientGroup(object):
             'POST', self._CLIENTGROUP, request_json
         )
 
-        self.refresh()
+        if refresh:
+            self.refresh()
 
         if flag:
             if response.json():
@@ -1428,6 +1443,46 @@ class ClientGroup(object):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
+    def _update_membership(self, clients, operation_type):
+        """Adds/Removes the clients to/from the ClientGroup, sending at most membership_batch_size
+            clients in each request, and refreshes the client group once all of them are sent.
+
+            Args:
+                clients         (list)  --  names of the clients to be added / removed
+
+                operation_type  (str)   --  type of operation to run for the request
+                    ADD / OVERWRITE / DELETE
+
+                    with OVERWRITE, only the first batch overwrites the clients,
+                    and the remaining batches are added
+
+            Raises:
+                SDKException:
+                    if failed to add / remove the clients
+        """
+        exception_message_dict = {
+            'ADD': 'Failed to add clients to the ClientGroup\nError: "{0}"',
+            'OVERWRITE': 'Failed to add clients to the ClientGroup\nError: "{0}"',
+            'DELETE': 'Failed to remove clients from the ClientGroup\nError: "{0}"'
+        }
+        batch_size = max(int(self.membership_batch_size), 1)
+
+        try:
+            for start in range(0, len(clients), batch_size):
+                output = self._update(
+                    clientgroup_name=self.name,
+                    clientgroup_description=self.description,
+                    associated_clients=clients[start:start + batch_size],
+                    operation_type=operation_type if start == 0 else operation_type.replace('OVERWRITE', 'ADD'),
+                    refresh=False
+                )
+
+                if not output[0]:
+                    o_str = exception_message_dict[operation_type]
+                    raise SDKException('ClientGroup', '102', o_str.format(output[2]))
+        finally:
+            self.refresh()
+
     def _add_or_remove_clients(self, clients, operation_type):
         """Adds/Removes clients to/from the ClientGroup.
 
@@ -1451,44 +1506,36 @@ class ClientGroup(object):
 
                     if failed to remove clients from the ClientGroup
         """
-        if isinstance(clients, (str, list)):
-            clientgroups_object = ClientGroups(self._commcell_object)
+        if not isinstance(clients, (str, list)):
+            raise SDKException(
+                'ClientGroup', '102', 'Client\'s name should be a list or string value'
+            )
 
-            if isinstance(clients, list):
-                validated_clients_list = clientgroups_object._valid_clients(clients)
-            elif isinstance(clients, str):
-                validated_clients_list = clientgroups_object._valid_clients(clients.split(','))
+        if operation_type == 'OVERWRITE':
+            self.sync_clients(clients)
+            return
 
-            if operation_type in ['ADD', 'OVERWRITE']:
-                for client in validated_clients_list:
-                    if client in self._associated_clients:
-                        validated_clients_list.remove(client)
+        if isinstance(clients, str):
+            clients = clients.split(',')
 
-            if not validated_clients_list:
-                raise SDKException('ClientGroup', '102', 'No valid clients were found')
+        validated_clients_list = self._commcell_object.client_groups._valid_clients(clients)
 
-            output = self._update(
-                clientgroup_name=self.name,
-                clientgroup_description=self.description,
-                associated_clients=validated_clients_list,
-                operation_type=operation_type
-            )
+        if not validated_clients_list:
+            raise SDKException('ClientGroup', '102', 'No valid clients were found')
 
-            exception_message_dict = {
-                'ADD': 'Failed to add clients to the ClientGroup\nError: "{0}"',
-                'OVERWRITE': 'Failed to add clients to the ClientGroup\nError: "{0}"',
-                'DELETE': 'Failed to remove clients from the ClientGroup\nError: "{0}"'
-            }
+        associated_clients = set(client.lower() for client in self._associated_clients)
 
-            if output[0]:
-                return
-            else:
-                o_str = exception_message_dict[operation_type]
-                raise SDKException('ClientGroup', '102', o_str.format(output[2]))
+        if operation_type == 'ADD':
+            validated_clients_list = [
+                client for client in validated_clients_list if client not in associated_clients
+            ]
         else:
-            raise SDKException(
-                'ClientGroup', '102', 'Client\'s name should be a list or string value'
-            )
+            validated_clients_list = [
+                client for client in validated_clients_list if client in associated_clients
+            ]
+
+        if validated_clients_list:
+            self._update_membership(validated_clients_list, operation_type)
 
     @property
     def properties(self):
@@ -1967,6 +2014,96 @@ class ClientGroup(object):
             o_str = 'Failed to remove clients from the ClientGroup\nError: "{0}"'
             raise SDKException('ClientGroup', '102', o_str.format(output[2]))
 
+    def get_clients_diff(self, clients):
+        """Returns the clients to add to and remove from the ClientGroup, for its clients to match
+            the given clients.
+
+            Args:
+                clients     (str/list)  --  ',' separated string of client names,
+                                                or a list of clients,
+                                                the client group should have
+
+            Returns:
+                dict    -   clients to add and remove, and the inputs not matching any client
+
+                    {
+                        'add': ['client1'],
+
+                        'remove': ['client2'],
+
+                        'invalid': ['client3']
+                    }
+
+            Raises:
+                SDKException:
+                    if clients is not of type string / list
+        """
+        if isinstance(clients, str):
+            clients = clients.split(',')
+
+        if not isinstance(clients, list):
+            raise SDKException(
+                'ClientGroup', '102', 'Client\'s name should be a list or string value'
+            )
+
+        resolved, invalid = self._commcell_object.clients.resolve_client_names(clients)
+        target_clients = set(resolved.values())
+        associated_clients = {client.lower(): client for client in self._associated_clients}
+
+        return {
+            'add': sorted(target_clients.difference(associated_clients)),
+            'remove': sorted(
+                associated_clients[client] for client in associated_clients
+                if client not in target_clients
+            ),
+            'invalid': invalid
+        }
+
+    def sync_clients(self, clients):
+        """Adds and removes only the clients needed for the clients of the ClientGroup to match
+            the given clients, in batches of membership_batch_size clients per request.
+
+            Args:
+                clients     (str/list)  --  ',' separated string of client names,
+                                                or a list of clients,
+                                                the client group should have
+
+            Returns:
+                dict    -   clients added and removed, and the inputs not matching any client
+
+                    {
+                        'add': ['client1'],
+
+                        'remove': ['client2'],
+
+                        'invalid': ['client3']
+                    }
+
+            Raises:
+                SDKException:
+                    if clients is not of type string / list
+
+                    if no valid clients are found
+
+                    if failed to add / remove the clients
+        """
+        if isinstance(clients, str):
+            clients = clients.split(',')
+
+        clients_diff = self.get_clients_diff(clients)
+
+        # all the clients are removed only by remove_all_clients()
+        if len(clients_diff['invalid']) == len(clients):
+            raise SDKException('ClientGroup', '102', 'No valid clients were found')
+
+        if clients_diff['remove']:
+            self._update_membership(clients_diff['remove'], 'DELETE')
+
+        if clients_diff['add']:
+            self._update_membership(clients_diff['add'], 'ADD')
+
+        return clients_diff
+
     def push_network_config(self):
         """Performs a push network configuration on the client group
 
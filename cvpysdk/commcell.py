@@ -42,6 +42,9 @@ Commcell:
 
     _qoperation_execute()       --  runs the qoperation execute rest api on specified input xml
 
+    qoperation_execute_iter()   --  runs the qoperation execute rest api on specified input xml, and
+    yields the elements of the xml response with the given tag as they are parsed from the stream
+
     _qoperation_execscript()    --  runs the qoperation execute qscript with specified arguements
 
     get_gxglobalparam_value()	--	makes a rest api call to get values from GXGlobalParam
@@ -62,6 +65,12 @@ Commcell:
     class instance
     run_data_aging()            --  triggers data aging job from the commcell level
 
+    run_bulk_operation()        --  runs an operation for each item over a bounded, rate limited
+    worker pool and yields the results
+
+    run_backups()               --  runs backup jobs for the given subclients over a bounded, rate
+    limited worker pool and yields the results
+
     get_saml_token()            --  returns the SAML token for the currently logged-in user
 
     add_additional_setting()    --  adds registry key to the commserve property
@@ -155,6 +164,18 @@ Commcell:
 
     reset_to_local()            --  Removes comet headers, like switching back to local commcell
 
+    fanout_query()              --  runs a query or callable on the registered service commcells
+    concurrently, each with its own comet headers
+
+    watch()                     --  returns the change feed of the events, console alerts and jobs
+    of the commcell, which yields only the changes since the last poll
+
+    get_security_snapshot()     --  loads the users, user groups and roles of the commcell, and
+    returns the snapshot answering the effective permission queries
+
+    get_capacity_sampler()      --  returns the sampler of the capacity, free space and health of
+    the storage pools, disk libraries, mount paths and media agents
+
     allow_users_to_enable_passkey()     --      Enable or Disable passkey authorization for company administrators and client owners
 
     passkey()                       --  Updates Passkey properties of the commcell
@@ -211,6 +232,9 @@ Commcell instance Attributes
 
     **device_id**               --  returns the id associated with the calling machine
 
+    **retry_policy**            --  returns / sets the RetryPolicy used to retry the requests on
+    transient failures
+
     *name_change*               --  returns the name change object of the commcell
 
     **clients**                 --  returns the instance of the `Clients` class,
@@ -383,11 +407,14 @@ from __future__ import unicode_literals
 
 import getpass
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from contextlib import contextmanager
 
 import xmltodict
 
 from base64 import b64encode
+from xml.etree import ElementTree
 
 from requests.exceptions import SSLError
 from requests.exceptions import Timeout
@@ -419,6 +446,7 @@ from .plan import Plans
 from .job import JobController
 from .security.user import Users, User
 from .security.role import Roles
+from .security.security_snapshot import SecuritySnapshot
 from .security.two_factor_authentication import TwoFactorAuthentication
 from .credential_manager import Credentials
 from .download_center import DownloadCenter
@@ -455,6 +483,10 @@ from .index_server import IndexServers
 from .hac_clusters import HACClusters
 from .index_pools import IndexPools
 from .deduplication_engines import DeduplicationEngines
+from .bulk_operations import BulkOperationRunner
+from .change_feed import ChangeFeed
+from .storage_telemetry import StorageCapacitySampler
+from .retry_policy import RetryPolicy
 from .metallic import Metallic
 from .key_management_server import KeyManagementServers
 from .regions import Regions
@@ -601,6 +633,7 @@ class Commcell(object):
 
         self._device_id = socket.getfqdn()
         self._is_service_commcell = is_service_commcell
+        self._retry_policy = RetryPolicy()
 
         # Checks if the service is running or not
         for service in web_service:
@@ -948,7 +981,7 @@ class Commcell(object):
             self._headers['Accept'] = 'application/xml'
 
         flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services['EXECUTE_QCOMMAND'], request_xml
+            'POST', self._services['EXECUTE_QCOMMAND'], request_xml, content_type='application/xml'
         )
 
         if flag:
@@ -985,6 +1018,53 @@ class Commcell(object):
 
         return self._qoperation_execute(request_xml, **kwargs)
 
+    def qoperation_execute_iter(self, request_xml, tag):
+        """Runs the qoperation execute request, and yields the elements with the given tag from the
+            XML response as they are parsed from the stream, without loading the whole response.
+
+            Args:
+                request_xml     (str)   --  request xml that is to be passed
+
+                tag             (str)   --  tag of the repeated elements of the response to yield
+
+            Yields:
+                dict    -   each element with the given tag, in the same format as xmltodict.parse()
+
+            Raises:
+                SDKException:
+                    if response is not a valid XML
+
+                    if response is not success
+        """
+        headers = self._headers.copy()
+        headers.update(getattr(self._cvpysdk_object._thread_context, 'headers', None) or {})
+        headers['Accept'] = 'application/xml'
+
+        flag, response = self._cvpysdk_object.make_request(
+            'POST',
+            self._services['EXECUTE_QCOMMAND'],
+            request_xml,
+            headers=headers,
+            stream=True,
+            content_type='application/xml',
+            remove_processing_info=False
+        )
+
+        if not flag:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
+        response.raw.decode_content = True
+
+        try:
+            for _, element in ElementTree.iterparse(response.raw):
+                if element.tag == tag:
+                    yield xmltodict.parse(ElementTree.tostring(element))[tag]
+                    element.clear()
+        except ElementTree.ParseError as error:
+            raise SDKException('Response', '102', str(error))
+        finally:
+            response.close()
+
     @staticmethod
     def _convert_days_to_epoch(days):
         """
@@ -1264,6 +1344,30 @@ class Commcell(object):
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
+    @property
+    def retry_policy(self):
+        """Returns the instance of the RetryPolicy class used to retry the requests on transient failures."""
+        try:
+            return self._retry_policy
+        except AttributeError:
+            return USER_LOGGED_OUT_MESSAGE
+
+    @retry_policy.setter
+    def retry_policy(self, value):
+        """Sets the RetryPolicy to be used to retry the requests on transient failures.
+
+            Args:
+                value   (object)    --  instance of the RetryPolicy class
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid
+        """
+        if not isinstance(value, RetryPolicy):
+            raise SDKException('Commcell', '107')
+
+        self._retry_policy = value
+
     @property
     def name_change(self):
         """Returns an instance of Namechange class"""
@@ -2288,6 +2392,72 @@ class Commcell(object):
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
+    def run_bulk_operation(self, operation, items, max_concurrency=10, rate=None):
+        """Runs the operation for each item over a bounded worker pool, starting at most
+            `rate` operations per second, and yields the results as they complete.
+
+            Can be used to launch restores, aux copies, etc. in bulk, for e.g.;
+
+                >>> commcell.run_bulk_operation(lambda copy: copy.run_aux_copy(), copies, rate=1)
+
+            Args:
+                operation       (callable)  --  function to run for each item
+
+                items           (iterable)  --  items to run the operation for
+
+                max_concurrency (int)       --  maximum number of operations running at a time
+
+                    default: 10
+
+                rate            (float)     --  maximum number of operations started per second
+
+                    default: None   (no rate limit)
+
+            Returns:
+                generator   -   yields the tuple (item, result), where result is the value returned
+                by the operation, or the exception raised by it
+
+            Raises:
+                SDKException:
+                    if type of the inputs is not valid, raised on the call, before the iteration
+        """
+        runner = BulkOperationRunner(max_concurrency=max_concurrency, rate=rate)
+        return runner.run(operation, items)
+
+    def run_backups(self, subclients, max_concurrency=10, rate=None, **kwargs):
+        """Runs backup jobs for the given subclients over a bounded worker pool, starting at most
+            `rate` jobs per second, and yields the results as the jobs are started.
+
+            Args:
+                subclients      (iterable)  --  Subclient class instances to run the backup for
+
+                max_concurrency (int)       --  maximum number of backup requests in flight
+
+                    default: 10
+
+                rate            (float)     --  maximum number of backup jobs started per second
+
+                    default: None   (no rate limit)
+
+            Kwargs:
+                Please refer subclient.backup() for all the supported arguments. Commonly used arguments are,
+
+                backup_level        (str)   --  level of backup the user wish to run
+                        Full / Incremental / Differential / Synthetic_full
+                    default: Incremental
+
+            Yields:
+                tuple   -   (subclient, result), where result is the Job class instance for the
+                backup job started, or the exception raised while starting it
+
+            Raises:
+                SDKException:
+                    if type of the inputs is not valid
+        """
+        return self.run_bulk_operation(
+            lambda subclient: subclient.backup(**kwargs), subclients, max_concurrency, rate
+        )
+
     def get_saml_token(self, validity=30):
         """Returns the SAML token for the currently logged-in user.
 
@@ -4449,6 +4619,206 @@ class Commcell(object):
         finally:
             self._headers = old_headers
 
+    def watch(self, interval=30, sources=None, callback=None, include_existing=False):
+        """Returns the change feed of the events, console alerts and jobs of the commcell.
+
+            The feed tracks the last event ID, console alert ID and job update time seen, and
+            each poll returns only the changes after them.
+
+            Args:
+                interval            (float)     --  time in seconds between two polls
+
+                    default: 30
+
+                sources             (list)      --  sources to watch, any of events / alerts / jobs
+
+                    default: None   (all the sources)
+
+                callback            (callable)  --  function called with each change record
+
+                    default: None
+
+                include_existing    (bool)      --  if True, the first poll returns the existing
+                entities as changes
+
+                    default: False
+
+            Returns:
+                object  -   instance of the ChangeFeed class, iterate over `feed.watch()` to
+                get the changes as they happen, or call `feed.poll()` to get the changes since
+                the last poll
+
+            Raises:
+                SDKException:
+                    if type or value of the inputs is not valid
+        """
+        return ChangeFeed(self, sources, interval, callback, include_existing)
+
+    def get_security_snapshot(self, max_concurrency=10):
+        """Loads the users, user groups, roles and their security associations, fetching their
+            properties concurrently, and returns the snapshot answering the effective permission
+            queries of the users.
+
+            Args:
+                max_concurrency     (int)   --  maximum number of properties fetched at a time
+
+                    default: 10
+
+            Returns:
+                object  -   instance of the SecuritySnapshot class
+
+            Raises:
+                SDKException:
+                    if failed to get the properties of any of the users, user groups or roles
+        """
+        snapshot = SecuritySnapshot(self, max_concurrency)
+        snapshot.load()
+        return snapshot
+
+    def get_capacity_sampler(self, interval=300, history=288, max_concurrency=4):
+        """Returns the sampler of the capacity, free space and health of the storage pools, disk
+            libraries, mount paths and media agents of the commcell, keeping a fixed number of
+            samples of each of them to project their growth and time to full.
+
+            Args:
+                interval            (float) --  time in seconds between two samples
+
+                    default: 300
+
+                history             (int)   --  number of samples kept for each storage entity
+
+                    default: 288
+
+                max_concurrency     (int)   --  maximum number of library properties fetched at a time
+
+                    default: 4
+
+            Returns:
+                object  -   instance of the StorageCapacitySampler class, iterate over
+                `sampler.run()` to sample at the interval, or call `sampler.sample()` to take
+                a single sample
+
+            Raises:
+                SDKException:
+                    if type or value of the inputs is not valid
+        """
+        return StorageCapacitySampler(self, interval, history, max_concurrency)
+
+    def fanout_query(self, query, commcells=None, max_workers=8, timeout=None, method='GET', payload=None):
+        """Runs the query on each of the given service commcells concurrently, with the comet
+            headers for the target commcell isolated to the thread running the query.
+
+            Args:
+                query       (str / callable)    --  API to run the request on with params, if any,
+                same as accepted by request(), e.g.; 'Client', 'Job?jobFilter=Backup'
+
+                or, function accepting the Commcell class instance and the target commcell name,
+                e.g.; lambda commcell, name: JobController(commcell).active_jobs()
+
+                    the function should create the SDK objects it needs, instead of using the
+                    cached properties of the commcell, as those are shared across the targets
+
+                commcells   (list)              --  names of the service commcells to run the query on
+
+                    default: None   (all the registered commcells)
+
+                max_workers (int)               --  maximum number of commcells queried at a time
+
+                    default: 8
+
+                timeout     (float)             --  time in seconds after which the query on a
+                commcell is reported as timed out, also used as the timeout of each request
+
+                    default: None   (no timeout)
+
+                method      (str)               --  HTTP method to use when query is an API
+
+                    default: 'GET'
+
+                payload     (dict)              --  JSON request body to use when query is an API
+
+                    default: None
+
+            Returns:
+                dict    -   results and failures of the query attributed to each commcell
+
+                    {
+                        'results': {
+                            'commcell_name1': result of the query
+                        },
+                        'errors': {
+                            'commcell_name2': exception raised by the query
+                        },
+                        'timed_out': ['commcell_name3']
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid
+        """
+        if not (isinstance(query, str) or callable(query)):
+            raise SDKException('Commcell', '107')
+
+        if commcells is None:
+            commcells = list(self.registered_commcells)
+
+        if not isinstance(commcells, list):
+            raise SDKException('Commcell', '107')
+
+        def run_query(commcell_name):
+            """Runs the query on the commcell with the comet headers for the commcell"""
+            started[commcell_name] = time.monotonic()
+            headers = {
+                'CVContext': 'Comet',
+                '_cn': commcell_name,
+                'Comet-Commcells': commcell_name
+            }
+
+            with self._cvpysdk_object.thread_context(headers, timeout):
+                if callable(query):
+                    return query(self, commcell_name)
+
+                flag, response = self._cvpysdk_object.make_request(
+                    method.upper(), self._web_service + query, payload
+                )
+
+                if not flag:
+                    raise SDKException('Response', '101', self._update_response_(response.text))
+
+                return response.json()
+
+        started = {}
+        output = {
+            'results': {},
+            'errors': {},
+            'timed_out': []
+        }
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {executor.submit(run_query, commcell_name): commcell_name for commcell_name in commcells}
+
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=1 if timeout else None, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    commcell_name = pending.pop(future)
+                    try:
+                        output['results'][commcell_name] = future.result()
+                    except Exception as excp:
+                        output['errors'][commcell_name] = excp
+
+                if timeout:
+                    now = time.monotonic()
+                    for future, commcell_name in list(pending.items()):
+                        if commcell_name in started and now - started[commcell_name] > timeout:
+                            output['timed_out'].append(commcell_name)
+                            del pending[future]
+        finally:
+            executor.shutdown(wait=False)
+
+        return output
+
     def passkey(self, current_password, action, new_password=None):
         """"
         Updates Passkey properties of the commcell
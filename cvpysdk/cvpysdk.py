@@ -51,8 +51,13 @@ CVPySDK:
 
     _request()                  --  executes the request on the server and return the Response
 
+    thread_context()            --  context manager to set the request headers and timeout for the
+    requests made from the current thread
+
     who_am_i()                  --  Fetches the username of the user to whom authtoken is mapped
 
+    _sniff_content_type()       --  returns the Content-type of a string payload from its first bytes
+
     make_request()              --  run the http request specified on the URL/WebService provided,
     and return the flag specifying success/fail, and response
 
@@ -61,7 +66,9 @@ CVPySDK:
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-from xml.parsers.expat import ExpatError
+import threading
+
+from contextlib import contextmanager
 
 import requests
 import xmltodict
@@ -106,6 +113,7 @@ class CVPySDK(object):
         self._certificate_path = certificate_path
         self._verify_ssl = verify_ssl
         self._response_headers = {}
+        self._thread_context = threading.local()
 
         if not self._verify_ssl:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -295,15 +303,56 @@ class CVPySDK(object):
 
                     **requests.request** method
 
+                session     (object)    --  requests.Session to run the request on, to reuse
+                its connection pool
+
+                    default: None   (new connection for the request)
+
             Returns:
                 object  -   **requests.Response** class instance, as received from calling the
                 **requests.request** method
 
         """
+        timeout = getattr(self._thread_context, 'timeout', None)
+        if timeout is not None and 'timeout' not in kwargs:
+            kwargs['timeout'] = timeout
+
+        session = kwargs.pop('session', None)
+        request = session.request if session is not None else requests.request
+
         if self._certificate_path and self._commcell_object._web_service.startswith('https'):
-            return requests.request(verify=self._certificate_path, **kwargs)
+            return request(verify=self._certificate_path, **kwargs)
         else:
-            return requests.request(verify=self._verify_ssl, **kwargs)
+            return request(verify=self._verify_ssl, **kwargs)
+
+    @contextmanager
+    def thread_context(self, headers=None, timeout=None):
+        """Context manager to set additional request headers and a request timeout, for all the
+            requests made from the current thread only.
+
+            Used to run requests against different targets concurrently from multiple threads,
+            without modifying the headers of the Commcell shared by all the threads.
+
+            Args:
+                headers     (dict)  --  headers to add to the Commcell headers for the requests
+
+                    default: None
+
+                timeout     (float) --  timeout in seconds for each request
+
+                    default: None
+
+        """
+        previous_headers = getattr(self._thread_context, 'headers', None)
+        previous_timeout = getattr(self._thread_context, 'timeout', None)
+
+        self._thread_context.headers = headers
+        self._thread_context.timeout = timeout
+        try:
+            yield
+        finally:
+            self._thread_context.headers = previous_headers
+            self._thread_context.timeout = previous_timeout
 
     def who_am_i(self, authtoken=None):
         """Get the username of the user, to whom the Authtoken belongs to.
@@ -345,6 +394,25 @@ class CVPySDK(object):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
+    @staticmethod
+    def _sniff_content_type(payload):
+        """Returns the Content-type of the string payload, checking only the start of the payload.
+
+            Args:
+                payload     (bytes)     --  encoded payload of the request
+
+            Returns:
+                str     -   application/xml, if the payload starts with an XML tag, or is empty
+
+                text/plain, otherwise
+        """
+        if not payload:
+            return 'application/xml'
+
+        # skip the UTF-8 byte order mark and the leading white spaces of the payload, if any
+        start = payload[:256].lstrip(b'\xef\xbb\xbf').lstrip()
+        return 'application/xml' if start.startswith(b'<') else 'text/plain'
+
     def make_request(
             self,
             method,
@@ -408,6 +476,12 @@ class CVPySDK(object):
 
                     remove_processing_info  (bool)      --  removes the processing instruction info from response.json()
 
+                    session                 (object)    --  requests.Session to run the request on, to reuse
+                    its connection pool
+
+                    content_type            (str)       --  Content-type of a string payload, e.g.;
+                    application/xml, if not given it is detected from the start of the payload
+
             Returns:
                 tuple:
                     (True, response)    -   in case of success
@@ -425,16 +499,21 @@ class CVPySDK(object):
 
         """
         try:
+            session = kwargs.get('session')
+
             if headers is None:
                 headers = self._commcell_object._headers.copy()
 
+                if getattr(self._thread_context, 'headers', None):
+                    headers.update(self._thread_context.headers)
+
             if method == 'POST':
                 if isinstance(payload, (dict, list)):
                     if files is not None:
-                        response = self._request(method=method, url=url, files=files, data=payload)
+                        response = self._request(method=method, url=url, files=files, data=payload, session=session)
                     else:
                         response = self._request(
-                            method=method, url=url, headers=headers, json=payload, stream=stream
+                            method=method, url=url, headers=headers, json=payload, stream=stream, session=session
                         )
                 else:
                     try:
@@ -445,24 +524,21 @@ class CVPySDK(object):
                         # pass silently if payload is alredy encoded in bytes
                         pass
 
-                    if 'Content-type' in headers and headers['Content-type'] not in [
+                    if kwargs.get('content_type'):
+                        headers['Content-type'] = kwargs['content_type']
+                    elif 'Content-type' in headers and headers['Content-type'] not in [
                             'application/x-www-form-urlencoded']:
-                        try:
-                            if payload is not None:
-                                xmltodict.parse(payload)
-                            headers['Content-type'] = 'application/xml'
-                        except ExpatError:
-                            headers['Content-type'] = 'text/plain'
+                        headers['Content-type'] = self._sniff_content_type(payload)
 
                     response = self._request(
-                        method=method, url=url, headers=headers, data=payload, stream=stream
+                        method=method, url=url, headers=headers, data=payload, stream=stream, session=session
                     )
             elif method == 'GET':
-                response = self._request(method=method, url=url, headers=headers, stream=stream)
+                response = self._request(method=method, url=url, headers=headers, stream=stream, session=session)
             elif method == 'PUT':
-                response = self._request(method=method, url=url, headers=headers, json=payload)
+                response = self._request(method=method, url=url, headers=headers, json=payload, session=session)
             elif method == 'DELETE':
-                response = self._request(method=method, url=url, headers=headers)
+                response = self._request(method=method, url=url, headers=headers, session=session)
             else:
                 raise SDKException('CVPySDK', '102', 'HTTP method {} not supported'.format(method))
 
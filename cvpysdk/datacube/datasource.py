@@ -77,6 +77,16 @@ Datasource:
 
     import_data(data)                   --  imports/pumps given data into data source.
 
+    _process_import_response()          --  processes the response of the import data request
+
+    _get_import_batches()               --  splits the documents into batches by count and size
+
+    _import_batch()                     --  imports a batch of documents, retrying on the
+                                                transport and server failures
+
+    stream_import_data(documents)       --  imports documents from any iterable in batches, over
+                                                a bounded pool of concurrent requests
+
     delete_content()                    --  deletes the contents of the data source.
 
     refresh()                           --  refresh the properties of the datasource
@@ -109,9 +119,15 @@ DataSource Attributes
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import json
+import time
+
+from requests.exceptions import RequestException
+
 from .handler import Handlers
 from .sedstype import SEDS_TYPE_DICT
 
+from ..bulk_operations import BulkOperationRunner
 from ..exception import SDKException
 
 
@@ -823,6 +839,22 @@ class Datasource(object):
         flag, response = self._commcell_object._cvpysdk_object.make_request(
             'POST', self._datacube_import_data, data
         )
+        self._process_import_response(flag, response)
+
+    def _process_import_response(self, flag, response):
+        """Processes the response received for the import data request.
+
+            Args:
+                flag        (bool)      --  whether the request was successful
+
+                response    (object)    --  response received for the request
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
         if flag:
             if response.json() and 'errorCode' in response.json():
                 error_code = response.json()['errorCode']
@@ -837,6 +869,188 @@ class Datasource(object):
         )
         raise SDKException('Response', '101', response_string)
 
+    @staticmethod
+    def _get_import_batches(documents, batch_size, max_batch_bytes):
+        """Splits the documents into batches, limited by the number of documents and their size.
+
+            Args:
+                documents       (iterable)  --  documents to split into batches
+
+                batch_size      (int)       --  maximum number of documents in a batch
+
+                max_batch_bytes (int)       --  maximum size of the JSON encoded batch in bytes
+
+            Yields:
+                tuple   -   (batch number, list of documents, size of the batch in bytes)
+        """
+        batch = []
+        batch_bytes = 2
+        batch_number = 0
+
+        for document in documents:
+            document_bytes = len(json.dumps(document).encode('utf-8')) + 1
+
+            if batch and (len(batch) >= batch_size or batch_bytes + document_bytes > max_batch_bytes):
+                batch_number += 1
+                yield batch_number, batch, batch_bytes
+                batch = []
+                batch_bytes = 2
+
+            batch.append(document)
+            batch_bytes += document_bytes
+
+        if batch:
+            yield batch_number + 1, batch, batch_bytes
+
+    def _import_batch(self, batch):
+        """Imports the batch of documents into the data source, retrying the batch on the
+            transport failures and the retryable failed responses, e.g.; 5xx, as per the retry
+            policy of the commcell.
+
+            The batches rejected by the server, e.g.; with an errLogMessage, or a 4xx for a bad
+            document, are not retried, as they would be rejected again.
+
+            Args:
+                batch   (list)  --  documents to import
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        retry_policy = self._commcell_object.retry_policy
+        exception = None
+
+        for _ in retry_policy.attempts('Datasource.import_data'):
+            try:
+                flag, response = self._commcell_object._cvpysdk_object.make_request(
+                    'POST', self._datacube_import_data, batch
+                )
+            except RequestException as excp:
+                exception = excp
+                continue
+
+            if not flag and retry_policy.is_retryable(response):
+                exception = SDKException(
+                    'Response', '101', self._commcell_object._update_response_(response.text)
+                )
+                continue
+
+            return self._process_import_response(flag, response)
+
+        raise exception
+
+    def stream_import_data(self, documents, batch_size=1000, max_batch_bytes=8388608, max_workers=4,
+                           callback=None):
+        """Imports the documents into the data source in batches, over a bounded pool of
+            concurrent requests.
+
+            The documents are read from the iterable only as the batches are sent, so a generator
+            can be used to import any number of documents without holding them in memory.
+            Failed batches are retried as per the retry policy of the commcell, so the documents
+            should carry their unique key for the retries to be idempotent.
+
+            Args:
+                documents       (iterable)  --  documents (dict of key value pairs) to import
+
+                batch_size      (int)       --  maximum number of documents sent in a request
+
+                    default: 1000
+
+                max_batch_bytes (int)       --  maximum size of the JSON request body in bytes
+
+                    default: 8388608    (8 MB)
+
+                max_workers     (int)       --  maximum number of batches being sent at a time
+
+                    default: 4
+
+                callback        (callable)  --  function called with the statistics dict after
+                each batch completes, to report the progress
+
+                    default: None
+
+            Returns:
+                dict    -   statistics of the import
+
+                    {
+                        'documents': 100000,
+
+                        'bytes': 52428800,
+
+                        'batches': 100,
+
+                        'elapsed_time': 25.0,
+
+                        'docs_per_second': 4000.0,
+
+                        'bytes_per_second': 2097152.0,
+
+                        'failed_batches': [
+                            {
+                                'batch': 12,
+
+                                'documents': 1000,
+
+                                'error': 'error message'
+                            }
+                        ]
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise SDKException('Datacube', '101')
+
+        if not isinstance(max_batch_bytes, int) or max_batch_bytes < 1:
+            raise SDKException('Datacube', '101')
+
+        if callback is not None and not callable(callback):
+            raise SDKException('Datacube', '101')
+
+        stats = {
+            'documents': 0,
+            'bytes': 0,
+            'batches': 0,
+            'elapsed_time': 0.0,
+            'docs_per_second': 0.0,
+            'bytes_per_second': 0.0,
+            'failed_batches': []
+        }
+        start_time = time.monotonic()
+        runner = BulkOperationRunner(max_concurrency=max_workers)
+        batches = self._get_import_batches(documents, batch_size, max_batch_bytes)
+
+        for (batch_number, batch, batch_bytes), result in runner.run(
+                lambda batch_info: self._import_batch(batch_info[1]), batches
+        ):
+            stats['batches'] += 1
+
+            if isinstance(result, Exception):
+                stats['failed_batches'].append({
+                    'batch': batch_number,
+                    'documents': len(batch),
+                    'error': str(result)
+                })
+            else:
+                stats['documents'] += len(batch)
+                stats['bytes'] += batch_bytes
+
+            elapsed_time = time.monotonic() - start_time
+            stats['elapsed_time'] = elapsed_time
+
+            if elapsed_time > 0:
+                stats['docs_per_second'] = stats['documents'] / elapsed_time
+                stats['bytes_per_second'] = stats['bytes'] / elapsed_time
+
+            if callback:
+                callback(stats)
+
+        return stats
+
     def delete_content(self):
         """deletes the content of a data source from Data Cube.
            The data source itself is not deleted using this API.
@@ -38,12 +38,26 @@ DeduplicationEngines:
 
     _get_engines()              - returns all engines properties on commcell
 
+    _get_engine_stores()        - returns the stores of an engine with their properties
+
+    _get_store_substores()      - returns the substores of a store with their properties
+
+    _load_substores()           - fetches the substores of the given stores concurrently
+
+    _get_store_record()         - returns the compact record of a store
+
+    _get_substore_record()      - returns the compact record of a substore
+
     get()                       - returns list of all engines
 
     has_engine()                - checkes if a engine exisits for storage policy and copy name
 
     refresh()                   - refreshes all engine properties
 
+    get_ddb_topology()          - returns the engine/store/substore tree of all engines, fetched concurrently
+
+    refresh_ddb_topology()      - refreshes a topology, re-fetching substores only for changed stores
+
 DeduplicationEngine:
     __init__(commcell_object, storage_policy_name, copy_name)   - Initialise the DeduplicationEngine class instance
 
@@ -53,6 +67,8 @@ DeduplicationEngine:
 
     _initialize_policy_and_copy_id()    - Gets deduplication engine properties
 
+    _request_engine_properties()    - runs the qcommand fetching the deduplication engine properties
+
     _get_engine_properties()    - initializes deduplication engine properties
 
     _initialize_stores()        - initializes all the stores presnet in deduplication engine
@@ -74,6 +90,8 @@ Store:
 
     _initialize_store_properties()  - initializes store properties
 
+    _request_substores()        - runs the qcommand fetching the substores of a store
+
     _get_substores()            - gets all substores in a store along with properties
 
     _initialize_substores()     - initializes all substore properties
@@ -148,6 +166,7 @@ Substore:
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from .exception import SDKException
@@ -309,6 +328,197 @@ class DeduplicationEngines(object):
             'Storage', '102', f'No dedupe engine exists with name: {storage_policy_name}/{copy_name}'
         )
 
+    def _get_engine_stores(self, storage_policy_id, copy_id):
+        """Gets the stores of a deduplication engine along with their properties
+
+            Args:
+                storage_policy_id   (str)   --  storage policy id of the engine
+
+                copy_id             (str)   --  copy id of the engine
+
+            Returns:
+                list - properties of each store on the deduplication engine
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        engine_properties = DeduplicationEngine._request_engine_properties(
+            self._commcell_object, storage_policy_id, copy_id
+        )
+        return [
+            store for store in engine_properties.get('engines', [])
+            if str(store['copy']['id']) == str(copy_id)
+        ]
+
+    def _get_store_substores(self, store_id):
+        """Gets the substores of a deduplication store along with their properties
+
+            Args:
+                store_id    (int)   --  id of the deduplication store
+
+            Returns:
+                list - properties of each substore on the deduplication store
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        return Store._request_substores(self._commcell_object, store_id).get('subStoreList', [])
+
+    @staticmethod
+    def _get_store_record(store):
+        """Returns the compact record for the store properties received from the server"""
+        store_flags = store.get('storeFlags', 0)
+        return {
+            'store_id': store['storeId'],
+            'store_name': store.get('storeName'),
+            'storage_policy_name': store['sp']['name'],
+            'copy_name': store['copy']['name'],
+            'copy_id': store['copy']['id'],
+            'version': store.get('ddbVersion'),
+            'status': store.get('status'),
+            'sealed': bool(store.get('sealedTime')),
+            'store_flags': store_flags,
+            'dedupe_flags': store.get('dedupeFlags'),
+            'extended_flags': store.get('storeExtendedFlags'),
+            'pruning_enabled': store_flags & StoreFlags.IDX_SIDBSTORE_FLAGS_PRUNING_ENABLED.value != 0,
+            'under_maintenance': store_flags & StoreFlags.IDX_SIDBSTORE_FLAGS_DDB_UNDER_MAINTENANCE.value != 0,
+            'needs_resync': store_flags & StoreFlags.IDX_SIDBSTORE_FLAGS_DDB_NEEDS_AUTO_RESYNC.value != 0,
+            'total_app_size': store.get('totalAppSize'),
+            'total_data_size': store.get('totalDataSize'),
+            'substores': {}
+        }
+
+    @staticmethod
+    def _get_substore_record(substore):
+        """Returns the compact record for the substore properties received from the server"""
+        return {
+            'substore_id': substore['subStoreId'],
+            'path': substore.get('Path'),
+            'media_agent': substore.get('MediaAgent', {}).get('name'),
+            'media_agent_id': substore.get('MediaAgent', {}).get('id'),
+            'status': substore.get('status'),
+            'flags': substore.get('flags'),
+            'disk_free': substore.get('diskFree')
+        }
+
+    def _load_substores(self, stores, max_workers):
+        """Fetches the substores of the given store records concurrently and attaches them to the records"""
+        if not stores:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            substores_list = executor.map(
+                lambda store: self._get_store_substores(store['store_id']), stores
+            )
+
+            for store, substores in zip(stores, substores_list):
+                store['substores'] = {
+                    substore['subStoreId']: self._get_substore_record(substore) for substore in substores
+                }
+
+    def get_ddb_topology(self, max_workers=8):
+        """Builds the engine/store/substore tree for all the deduplication engines in the commcell.
+
+            The store properties of every engine, and then the substores of every store, are
+            fetched concurrently instead of instantiating DeduplicationEngine, Store and SubStore
+            objects for each level.
+
+            Args:
+                max_workers     (int)   --  maximum number of concurrent requests to the server
+
+                    default: 8
+
+            Returns:
+                dict - topology with (storage policy name, copy name) as key and the engine record as value
+
+                    {
+                        ('sp_name', 'copy_name'): {
+                            'storage_policy_id': '1',
+                            'copy_id': '2',
+                            'stores': {
+                                store_id: {
+                                    'store_name': ..., 'version': ..., 'status': ..., 'sealed': ...,
+                                    ...
+                                    'substores': {
+                                        substore_id: {'path': ..., 'media_agent': ..., ...}
+                                    }
+                                }
+                            }
+                        }
+                    }
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        return self.refresh_ddb_topology({}, max_workers)
+
+    def refresh_ddb_topology(self, topology, max_workers=8):
+        """Refreshes the topology returned by get_ddb_topology().
+
+            The engine list and the store properties of every engine are re-fetched, but the substores are re-fetched
+            only for the stores which are new, or whose version, status or flags have changed.
+
+            Args:
+                topology        (dict)  --  topology returned by get_ddb_topology()
+
+                max_workers     (int)   --  maximum number of concurrent requests to the server
+
+                    default: 8
+
+            Returns:
+                dict - refreshed topology of all the deduplication engines
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        self.refresh()
+        change_keys = ('version', 'status', 'sealed', 'store_flags', 'extended_flags')
+        engines = list(self._engines.items()) if self._engines else []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            engine_stores = executor.map(
+                lambda engine: self._get_engine_stores(*engine[1]), engines
+            )
+
+            new_topology = {}
+            changed_stores = []
+
+            for (engine, ids), stores in zip(engines, engine_stores):
+                previous_stores = topology.get(engine, {}).get('stores', {})
+                store_records = {}
+
+                for store in stores:
+                    record = self._get_store_record(store)
+                    previous = previous_stores.get(record['store_id'])
+
+                    if previous and all(previous[key] == record[key] for key in change_keys):
+                        record['substores'] = previous['substores']
+                    else:
+                        changed_stores.append(record)
+
+                    store_records[record['store_id']] = record
+
+                new_topology[engine] = {
+                    'storage_policy_id': ids[0],
+                    'copy_id': ids[1],
+                    'stores': store_records
+                }
+
+        self._load_substores(changed_stores, max_workers)
+        return new_topology
+
 
 class DeduplicationEngine(object):
     """Class to get all stores associated for deduplication engine"""
@@ -369,9 +579,17 @@ class DeduplicationEngine(object):
         self._storage_policy_id = policy_and_copy_id[0]
         self._copy_id = policy_and_copy_id[1]
 
-    def _get_engine_properties(self):
+    @staticmethod
+    def _request_engine_properties(commcell_object, storage_policy_id, copy_id):
         """
-        Gets deduplication engine properties
+        Runs the qcommand fetching the properties of the deduplication engine of the copy
+
+        Args:
+            commcell_object     (object)    --  instance of the Commcell class
+
+            storage_policy_id   (str)       --  storage policy id of the engine
+
+            copy_id             (str)       --  copy id of the engine
 
         Return:
              dict - engine properties for each store on deduplication engine
@@ -388,11 +606,11 @@ class DeduplicationEngine(object):
                     "propertyLevel": 20
                 },
                 "storagepolicy": {
-                    "storagePolicyId": self.storage_policy_id
+                    "storagePolicyId": storage_policy_id
                 },
                 "spCopy": {
-                    "copyId": self.copy_id,
-                    "storagePolicyId": self.storage_policy_id
+                    "copyId": copy_id,
+                    "storagePolicyId": storage_policy_id
                 },
                 "store": {
                     "type": 115
@@ -401,16 +619,31 @@ class DeduplicationEngine(object):
             }
         }
 
-        flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'POST', self._commcell_object._services['EXECUTE_QCOMMAND'], request_json
+        flag, response = commcell_object._cvpysdk_object.make_request(
+            'POST', commcell_object._services['EXECUTE_QCOMMAND'], request_json
         )
         if flag:
             if response and response.json():
                 return response.json()
             raise SDKException('Response', '102')
-        response_string = self._commcell_object._update_response_(response.text)
+        response_string = commcell_object._update_response_(response.text)
         raise SDKException('Response', '101', response_string)
 
+    def _get_engine_properties(self):
+        """
+        Gets deduplication engine properties
+
+        Return:
+             dict - engine properties for each store on deduplication engine
+
+        Raises:
+            SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        return self._request_engine_properties(self._commcell_object, self.storage_policy_id, self.copy_id)
+
     def _initialize_engine_properties(self):
         """initializes deduplication engine properties"""
         self._engine_properties = self._get_engine_properties()
@@ -542,9 +775,15 @@ class Store(object):
         self._store_flags = self._store_properties['storeFlags']
         self._initialize_substores()
 
-    def _get_substores(self):
+    @staticmethod
+    def _request_substores(commcell_object, store_id):
         """
-        Gets properties of all the substores in a deduplication store
+        Runs the qcommand fetching the substores of the deduplication store
+
+        Args:
+            commcell_object     (object)    --  instance of the Commcell class
+
+            store_id            (int)       --  id of the deduplication store
 
         Return:
              dict - store properties and substore list for each substore on deduplication store
@@ -558,20 +797,35 @@ class Store(object):
         request_json = {
             "EVGui_SubStoreListReq": {
                 "commcellId": 2,
-                "storeId": self.store_id
+                "storeId": store_id
             }
         }
 
-        flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'POST', self._commcell_object._services['EXECUTE_QCOMMAND'], request_json
+        flag, response = commcell_object._cvpysdk_object.make_request(
+            'POST', commcell_object._services['EXECUTE_QCOMMAND'], request_json
         )
         if flag:
             if response.json():
                 return response.json()
             raise SDKException('Response', '102')
-        response_string = self._commcell_object._update_response_(response.text)
+        response_string = commcell_object._update_response_(response.text)
         raise SDKException('Response', '101', response_string)
 
+    def _get_substores(self):
+        """
+        Gets properties of all the substores in a deduplication store
+
+        Return:
+             dict - store properties and substore list for each substore on deduplication store
+
+        Raises:
+            SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        return self._request_substores(self._commcell_object, self.store_id)
+
     def _initialize_substores(self):
         """initialisez all the substores present in a deduplication store"""
         substre_raw = self._get_substores()
@@ -913,7 +1167,8 @@ class Store(object):
                   </taskInfo>
                 </TMMsg_CreateTaskReq>"""
         flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'POST', self._commcell_object._services['EXECUTE_QCOMMAND'], request_xml
+            'POST', self._commcell_object._services['EXECUTE_QCOMMAND'], request_xml,
+            content_type='application/xml'
         )
         if flag:
             if response and response.json():
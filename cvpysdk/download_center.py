@@ -43,13 +43,24 @@ Following Operations can be performed on the Download Center:
 
 DownloadCenter:
 
-    __init__(commcell_object)   --  initializes a connection to the download center
+    __init__(commcell_object,
+             catalog_cache,
+             page_size,
+             catalog_cache_max_age)     --  initializes a connection to the download center
 
     __repr__()                  --  returns the string representation of an instance of this class
 
     _get_properties()           --  get the properties of the download center
 
-    _get_packages()             --  get the packages available at download center
+    _get_packages_page()        --  get a page of the packages available at download center
+
+    _read_catalog_cache()       --  reads the package catalog from the catalog cache file
+
+    _write_catalog_cache()      --  saves the package catalog to the catalog cache file
+
+    _get_packages()             --  get the packages available at download center, page by page
+
+    _get_package_platforms()    --  get the platforms and download types of the given package
 
     _process_category_request() --  executes the request on the server, and parses the response
 
@@ -115,6 +126,7 @@ and get the size of the file
 
 from xml.parsers.expat import ExpatError
 
+import json
 import os
 import time
 import xmltodict
@@ -125,12 +137,25 @@ from .exception import SDKException
 class DownloadCenter(object):
     """Class for doing operations on Download Center like upload or download product."""
 
-    def __init__(self, commcell_object):
+    def __init__(self, commcell_object, catalog_cache=None, page_size=500, catalog_cache_max_age=3600):
         """Initializes an instance of the DownloadCenter class.
 
             Args:
                 commcell_object     (object)    --  instance of the Commcell class
 
+                catalog_cache       (str)       --  path of the file to save the package catalog at,
+                and to reuse it from while it is not older than catalog_cache_max_age
+
+                    default: None
+
+                page_size           (int)       --  number of packages fetched per request
+
+                    default: 500
+
+                catalog_cache_max_age   (int)   --  seconds for which the saved package catalog is reused
+
+                    default: 3600
+
             Returns:
                 object  -   instance of the DownloadCenter class
 
@@ -140,6 +165,10 @@ class DownloadCenter(object):
         self._services = commcell_object._services
         self._update_response_ = commcell_object._update_response_
 
+        self._catalog_cache = catalog_cache
+        self._catalog_cache_max_age = catalog_cache_max_age
+        self._page_size = page_size
+
         self._response = None
         self.refresh()
 
@@ -159,7 +188,7 @@ class DownloadCenter(object):
         """
 
         flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services['GET_DC_DATA'], request_xml
+            'POST', self._services['GET_DC_DATA'], request_xml, content_type='application/xml'
         )
 
         if flag:
@@ -171,12 +200,19 @@ class DownloadCenter(object):
             response_string = self._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def _get_packages(self):
-        """Gets the list of all the Active packages available at the download center."""
+    def _get_packages_page(self, offset):
+        """Executes the search request for a page of the Active packages available at the download center.
 
+            Args:
+                offset      (int)   --  offset of the first package of the page
+
+            Returns:
+                (bool, object)  -   flag and the response received from the server
+
+        """
         request_xml = """
         <DM2ContentIndexing_CVSearchReq mode="2">
-            <searchProcessingInfo pageSize="1000000">
+            <searchProcessingInfo resultOffset="{0}" pageSize="{1}">
                 <queryParams param="ENABLE_DOWNLOADCENTER" value="true"/>
                 <queryParams param="GROUP_RESULTS_BY" value="PKG_ID"/>
                 <queryParams param="GROUP_LIMIT" value="50"/>
@@ -191,53 +227,137 @@ class DownloadCenter(object):
                 </facetRequest>
             </facetRequests>
         </DM2ContentIndexing_CVSearchReq>
+        """.format(offset, self._page_size)
+
+        return self._cvpysdk_object.make_request(
+            'POST', self._services['SEARCH_PACKAGES'], request_xml, content_type='application/xml'
+        )
+
+    def _read_catalog_cache(self):
+        """Returns the package catalog saved in the catalog cache file, if it is not older than
+            the catalog cache max age."""
+        if not self._catalog_cache or not os.path.isfile(self._catalog_cache):
+            return None
+
+        try:
+            with open(self._catalog_cache, 'r') as cache_file:
+                catalog = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - catalog.get('time', 0) > self._catalog_cache_max_age:
+            return None
+
+        return catalog
+
+    def _write_catalog_cache(self):
+        """Saves the package catalog to the catalog cache file, with the time it was fetched at."""
+        if not self._catalog_cache:
+            return
+
+        catalog = {
+            'time': int(time.time()),
+            'packages': self._packages
+        }
+
+        with open(self._catalog_cache, 'w') as cache_file:
+            json.dump(catalog, cache_file)
+
+    def _get_packages(self):
+        """Gets the list of all the Active packages available at the download center.
+
+            Packages are fetched one page at a time, and indexed by their name. The platforms of
+            a package are resolved only when they are needed, by _get_package_platforms().
+
+            If a catalog cache file is set, and the catalog saved to it is not older than the catalog
+            cache max age, the cached catalog is used. The search request does not support the
+            ETag / Last-Modified validators, so the cached catalog is not revalidated with the server.
+
+            The packages are marked as loaded only once all the pages are fetched, so that a
+            partially loaded catalog is fetched again on the next use.
         """
+        self._packages = {}
+        self._package_platforms = {}
 
-        root = 'DM2ContentIndexing_CVDownloadCenterResp'
+        cache = self._read_catalog_cache()
 
-        flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services['SEARCH_PACKAGES'], request_xml
-        )
+        if cache:
+            self._packages = cache['packages']
+            self._packages_loaded = True
+            return
+
+        offset = 0
+
+        while True:
+            flag, response = self._get_packages_page(offset)
+
+            if not flag:
+                response_string = self._update_response_(response.text)
+                raise SDKException('Response', '101', response_string)
 
-        if flag:
             try:
-                packages = response.json()['searchResult']['packages']
+                packages = response.json().get('searchResult', {}).get('packages', [])
+            except (ExpatError, ValueError):
+                raise SDKException('DownloadCenter', '101', response.text)
 
-                if isinstance(packages, dict):
-                    packages = [packages]
+            if isinstance(packages, dict):
+                packages = [packages]
 
-                for package in packages:
-                    name = package['name'].lower()
+            for package in packages:
+                platforms = package.get('platforms', [])
 
-                    self._packages[name] = {
-                        'id': package['packageId'],
-                        'description': package['description'],
-                        'platforms': {}
-                    }
+                if isinstance(platforms, dict):
+                    platforms = [platforms]
 
-                    platforms = package['platforms']
+                self._packages[package['name'].lower()] = {
+                    'id': package['packageId'],
+                    'description': package['description'],
+                    'platforms': [
+                        [platform['name'], platform['id'], platform['downloadType']['name']]
+                        for platform in platforms
+                    ]
+                }
 
-                    if isinstance(platforms, dict):
-                        platforms = [platforms]
+            if len(packages) < self._page_size:
+                break
 
-                    for platform in platforms:
-                        platform_name = platform['name']
-                        platform_id = platform['id']
-                        download_type = platform['downloadType']['name']
+            offset += len(packages)
 
-                        if platform_name not in self._packages[name]['platforms']:
-                            self._packages[name]['platforms'][platform_name] = {
-                                'id': platform_id,
-                                'download_type': [download_type]
-                            }
-                        else:
-                            self._packages[name]['platforms'][platform_name][
-                                'download_type'].append(download_type)
-            except ExpatError:
-                raise SDKException('DownloadCenter', '101', response.text)
-        else:
-            response_string = self._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
+        self._packages_loaded = True
+        self._write_catalog_cache()
+
+    def _get_package_platforms(self, package):
+        """Returns the platforms of the package, and the download types available for each of them.
+
+            Args:
+                package     (str)   --  name of the package, in lower case
+
+            Returns:
+                dict    -   platforms of the package
+
+                    {
+                        'platform_name': {
+                            'id': platform_id,
+                            'download_type': [download_type1, download_type2]
+                        }
+                    }
+
+        """
+        if package not in self._package_platforms:
+            platforms = {}
+
+            for platform_name, platform_id, download_type in self._packages[package]['platforms']:
+                if platform_name not in platforms:
+                    platforms[platform_name] = {
+                        'id': platform_id,
+                        'download_type': [download_type]
+                    }
+                else:
+                    platforms[platform_name]['download_type'].append(download_type)
+
+            self._package_platforms[package] = platforms
+
+        return self._package_platforms[package]
 
     def _process_category_request(self, operation, name, description=None, new_name=None):
         """Executes the request on the server, and process the response received from the server.
@@ -305,7 +425,7 @@ class DownloadCenter(object):
         """.format(operation_type, category_id, name, description)
 
         flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services[operations['service']], request_xml
+            'POST', self._services[operations['service']], request_xml, content_type='application/xml'
         )
 
         if flag:
@@ -410,7 +530,7 @@ class DownloadCenter(object):
         )
 
         flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services[operations['service']], request_xml
+            'POST', self._services[operations['service']], request_xml, content_type='application/xml'
         )
 
         if flag:
@@ -588,7 +708,7 @@ class DownloadCenter(object):
     @property
     def packages(self):
         """Returns the packages available for download at Download Center."""
-        if not self._packages:
+        if not self._packages_loaded:
             self._get_packages()
 
         return list(self._packages.keys())
@@ -603,7 +723,10 @@ class DownloadCenter(object):
                 bool    -   boolean specifying whether the package exists or not
 
         """
-        return self.packages and package.lower() in self.packages
+        if not self._packages_loaded:
+            self._get_packages()
+
+        return package.lower() in self._packages
 
     def sub_categories(self, category):
         """Returns the sub categories available for the specified category.
@@ -650,7 +773,7 @@ class DownloadCenter(object):
             'platforms': {}
         }
 
-        platforms = package_detail['platforms']
+        platforms = self._get_package_platforms(package)
 
         for platform in platforms:
             output['platforms'][platform] = platforms[platform]['download_type']
@@ -1096,7 +1219,7 @@ class DownloadCenter(object):
         xml = xml[xml.find('<App_'):]
 
         flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services['UPLOAD_PACKAGE'], xml
+            'POST', self._services['UPLOAD_PACKAGE'], xml, content_type='application/xml'
         )
 
         self.refresh()
@@ -1185,7 +1308,7 @@ class DownloadCenter(object):
                         if platform specified is not supported for the package
 
             """
-            platforms = self._packages[package]['platforms']
+            platforms = self._get_package_platforms(package)
             # check if the package has a single platform only, in case platform is not given
             if platform is None:
 
@@ -1233,7 +1356,7 @@ class DownloadCenter(object):
                         if download type specified is not available for the package
 
             """
-            download_types = self._packages[package]['platforms'][platform]['download_type']
+            download_types = self._get_package_platforms(package)[platform]['download_type']
             # check if the package has a single download type only,
             # in case download type is not given
             if download_type is None:
@@ -1287,7 +1410,8 @@ class DownloadCenter(object):
         flag, response = self._cvpysdk_object.make_request(
             'POST', self._services['DOWNLOAD_PACKAGE'], request_xml.format(
                 package_id, platform_id, download_type, request_id
-            )
+            ),
+            content_type='application/xml'
         )
 
         if flag:
@@ -1309,7 +1433,8 @@ class DownloadCenter(object):
                 'POST',
                 self._services['DOWNLOAD_VIA_STREAM'],
                 request_xml.format(package_id, platform_id, download_type, request_id),
-                stream=True
+                stream=True,
+                content_type='application/xml'
             )
 
             # download chunks of 1MB each
@@ -1383,6 +1508,8 @@ class DownloadCenter(object):
         self._download_types = {}
         self._vendors = {}
         self._platforms = {}
-        self._packages = {}
 
-        self._get_packages()
+        # packages are loaded on first use, and not with the rest of the properties
+        self._packages = {}
+        self._package_platforms = {}
+        self._packages_loaded = False
@@ -61,6 +61,8 @@ Event:
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+from urllib.parse import urlencode
+
 from .exception import SDKException
 
 
@@ -123,12 +125,7 @@ class Events(object):
         """
         events_request = self._commcell_object._services['GET_EVENTS']
         if query_params_dict:
-            events_request = events_request + '?'
-            for query_param in query_params_dict.keys():
-                if events_request[-1] != '?':
-                    events_request = events_request + '&'
-                events_request = events_request + query_param + \
-                    '=' + query_params_dict[query_param]
+            events_request = events_request + '?' + urlencode(query_params_dict)
 
         flag, response = self._commcell_object._cvpysdk_object.make_request(
             'GET', events_request)
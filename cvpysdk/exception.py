@@ -393,7 +393,10 @@ EXCEPTION_DICT = {
         '106': 'Export Set not found',
         '107': 'Invalid Application type provided',
         '108': 'Invalid export type provided',
-        '109': 'CosmosDB file download fail'
+        '109': 'CosmosDB file download fail',
+        '110': 'Invalid page size or batch size provided',
+        '111': 'Failed to download the exports',
+        '112': 'Export jobs did not finish within the timeout'
     },
     'Salesforce': {
         '101': 'Neither Sync Database enabled nor user provided database details for restore',
@@ -652,6 +655,18 @@ EXCEPTION_DICT = {
         '102': 'Given commcell does not have an active license',
         '103': 'Given request id is not in active requests',
         '104': 'Requested backupset is not available for recovery'
+    },
+    'BulkOperations': {
+        '101': 'Data type of the input(s) is not valid'
+    },
+    'RetryPolicy': {
+        '101': 'Data type or value of the input(s) is not valid'
+    },
+    'ChangeFeed': {
+        '101': 'Data type or value of the input(s) is not valid'
+    },
+    'CapacitySampler': {
+        '101': 'Data type or value of the input(s) is not valid'
     }
 }
 
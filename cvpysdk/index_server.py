@@ -16,12 +16,14 @@
 
 """File for performing index server related operations on the commcell
 
-IndexServers, IndexServer and _Roles are 3 classes defined in this file
+IndexServers, IndexServer, IndexNode, _QueryRouter and _Roles are the classes defined in this file
 
 IndexServers:   Class for representing all the index servers associated with the commcell
 
 IndexServer:    Class for a instance of a single index server of the commcell
 
+_QueryRouter:   Class for spreading the solr queries across the healthy index server nodes
+
 _Roles:         Class for storing all the cloud role details
 
 "IndexServerOSType" is the enum class used to represent os type of IS
@@ -106,6 +108,15 @@ IndexServer
 
     execute_solr_query()                --  Creates solr url based on input and executes it on solr on given core
 
+    enable_query_routing()              --  spreads the solr queries without a solr client across the healthy nodes
+
+    disable_query_routing()             --  sends the solr queries without a solr client to the first node
+
+    _iter_solr_cursor()                 --  yields the pages of the solr query using cursorMark deep paging
+
+    iter_solr_query()                   --  yields all the documents matching the solr query with bounded memory,
+                                            optionally querying ranges of a field in parallel
+
     get_index_node()                    --  returns an Index server node object for given node name
 
     get_os_info()                       --  returns the OS type for the Index server
@@ -158,6 +169,8 @@ IndexServer Attributes
 
     **fs_collection**                   --  Returns the multinode collection name of File System Index
 
+    **query_router**                    --  Returns the _QueryRouter used for the solr queries, if enabled
+
 
 IndexNode
 =========
@@ -188,6 +201,24 @@ IndexNode Attributes
 
     **jvm_memory**                      --  returns Solr JVM memory for the Index server Node
 
+_QueryRouter
+============
+
+    __init__()                          --  initializes the class with the index server object,
+                                            routing strategy and health check interval
+
+    _check_health()                     --  checks the health of the nodes using the health indicators
+
+    get_nodes()                         --  returns the healthy nodes in the order they should be queried
+
+    get_session()                       --  returns the persistent requests session of the node
+
+    record_success()                    --  records the latency of a successful query on the node
+
+    record_failure()                    --  marks the node unhealthy till the next health check
+
+    close()                             --  closes the sessions of all the nodes
+
 _Roles
 ======
 
@@ -207,10 +238,16 @@ _Roles Attributes
     **roles_data**                      --  returns the list of details of all cloud roles
     """
 import json
+import queue
+import threading
+import time
 
 import http.client as httplib
 from copy import deepcopy
+from urllib.parse import quote
 import enum
+import requests
+
 from .exception import SDKException
 from .datacube.constants import IndexServerConstants
 
@@ -664,6 +701,7 @@ class IndexServer(object):
             self._cloud_id = self._get_cloud_id()
         self._properties = None
         self._roles_obj = None
+        self._query_router = None
         self.plan_info = None
         self.os_type = None
         self.refresh()
@@ -1110,25 +1148,41 @@ class IndexServer(object):
 
                         if response is not success
         """
-        solr_url = f"solr/{core_name}/select?{self._create_solr_query(select_dict, attr_list, op_params)}"
+        solr_query = f"solr/{core_name}/select?{self._create_solr_query(select_dict, attr_list, op_params)}"
         if solr_client is None:
-            solr_url = f"{self.server_url[0]}/{solr_url}"
+            nodes = self._query_router.get_nodes() if self._query_router else [self.client_name[0]]
         else:
             if solr_client not in self.client_name:
                 raise SDKException('IndexServers', '104', 'client name not found in this index server')
-            server_url = self.server_url[self.client_name.index(solr_client)]
-            solr_url = f"{server_url}/{solr_url}"
-        flag, response = self._cvpysdk_object.make_request("GET", solr_url)
+            nodes = [solr_client]
+
+        for node in nodes:
+            solr_url = f"{self.server_url[self.client_name.index(node)]}/{solr_query}"
+            if not self._query_router:
+                flag, response = self._cvpysdk_object.make_request("GET", solr_url)
+                break
+
+            start_time = time.monotonic()
+            try:
+                flag, response = self._cvpysdk_object.make_request(
+                    "GET", solr_url, session=self._query_router.get_session(node)
+                )
+            except requests.exceptions.RequestException:
+                self._query_router.record_failure(node)
+                if node == nodes[-1]:
+                    raise
+                continue
+
+            if flag and response.json():
+                self._query_router.record_success(node, time.monotonic() - start_time)
+                break
+            self._query_router.record_failure(node)
+
         if flag and response.json():
             return response.json()
         elif response.status_code == httplib.FORBIDDEN:
             cmd = f"(Invoke-WebRequest -UseBasicParsing -uri \"{solr_url}\").content"
-            client_obj = None
-            if solr_client:
-                client_obj = self._commcell_obj.clients.get(solr_client)
-            else:
-                # if no client is passed, then take first client in index server cloud
-                client_obj = self._commcell_obj.clients.get(self.client_name[0])
+            client_obj = self._commcell_obj.clients.get(node)
             exit_code, output, error_message = client_obj.execute_script(script_type="PowerShell",
                                                                          script=cmd)
             if exit_code != 0:
@@ -1147,6 +1201,192 @@ class IndexServer(object):
                 raise SDKException('IndexServers', '104', f"Something went wrong while querying solr - {output}")
         raise SDKException('IndexServers', '104', "Something went wrong while querying solr")
 
+    def enable_query_routing(self, strategy='round_robin', health_check_interval=300):
+        """Spreads the solr queries run without a solr client across the healthy index server nodes,
+            using a persistent connection pool for each node.
+
+            Args:
+                strategy                (str)   --  strategy to pick the node for each query
+
+                    round_robin     -   nodes are picked in turn
+
+                    least_latency   -   node with the least average query latency is picked
+
+                    default: 'round_robin'
+
+                health_check_interval   (int)   --  interval in seconds after which the health
+                indicators of the nodes are checked again
+
+                    default: 300
+
+            Raises:
+                SDKException:
+                    if strategy is not valid
+        """
+        self.disable_query_routing()
+        self._query_router = _QueryRouter(self, strategy, health_check_interval)
+
+    def disable_query_routing(self):
+        """Sends the solr queries run without a solr client to the first index server node"""
+        if self._query_router:
+            self._query_router.close()
+        self._query_router = None
+
+    def _iter_solr_cursor(self, core_name, solr_client, select_dict, attr_list, op_params, batch_size, unique_key):
+        """Yields the pages of documents for the solr query, using the cursorMark deep paging of solr
+
+            Args:
+                Same as iter_solr_query()
+
+            Yields:
+                list    -   documents in each page of the result
+        """
+        op_params = dict(op_params or {})
+        sort = op_params.pop('sort', None)
+        sort = f"{sort},{unique_key} asc" if sort else f"{unique_key} asc"
+        op_params.pop('start', None)
+        op_params['rows'] = batch_size
+        op_params['sort'] = quote(sort, safe=',')
+        cursor_mark = '*'
+
+        while True:
+            op_params['cursorMark'] = quote(cursor_mark, safe='')
+            response = self.execute_solr_query(core_name, solr_client, select_dict, attr_list, dict(op_params))
+            documents = response.get('response', {}).get('docs', [])
+
+            if documents:
+                yield documents
+
+            next_cursor_mark = response.get('nextCursorMark')
+            if not documents or not next_cursor_mark or next_cursor_mark == cursor_mark:
+                return
+            cursor_mark = next_cursor_mark
+
+    def iter_solr_query(
+            self,
+            core_name,
+            solr_client=None,
+            select_dict=None,
+            attr_list=None,
+            op_params=None,
+            batch_size=1000,
+            unique_key='contentid',
+            shard_field=None,
+            shard_ranges=None):
+        """Yields all the documents matching the solr query, fetching them in batches using the
+            cursorMark deep paging of solr, so that only a few pages are held in memory at a time.
+
+            Args:
+                core_name               (str)           --  Core name/collection name where we want to query
+
+                solr_client             (str)           --  Index Server client name to execute solr query
+                                                                Default : None (picks first client on index server)
+
+                select_dict             (dictionary)    --  Dictionary containing search criteria and
+                                                            value. Acts as 'q' field in solr query
+
+                attr_list               (set)           --  Column names to be returned in results.
+                                                                Acts as 'fl' in solr query
+
+                op_params               (dictionary)    --  Other params and values for solr query.
+                                                            'start', 'rows' and 'cursorMark' are set by
+                                                            this method
+
+                batch_size              (int)           --  number of documents fetched in each request
+
+                                                                Default : 1000
+
+                unique_key              (str)           --  unique key field of the core, used as the
+                                                            tie breaker in the sort order of the cursor
+
+                                                                Default : 'contentid'
+
+                shard_field             (str)           --  numeric (or numeric hash) field to split the
+                                                            query on, to query the ranges in parallel
+
+                                                                Default : None (single cursor)
+
+                shard_ranges            (list)          --  list of (lower, upper) values of the shard_field,
+                                                            each range is queried by its own cursor in parallel.
+                                                            Lower value is inclusive and upper value is exclusive
+
+                                                                Example : [(0, 1000), (1000, 2000), (2000, '*')]
+
+            Yields:
+                dict    -   each document in the result
+
+            Raises:
+                SDKException:
+
+                        if input is not valid
+
+                        if unable to send request
+
+                        if response is not success
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise SDKException('IndexServers', '104', 'batch size should be a positive integer')
+
+        if not shard_field:
+            for documents in self._iter_solr_cursor(
+                    core_name, solr_client, select_dict, attr_list, op_params, batch_size, unique_key):
+                for document in documents:
+                    yield document
+            return
+
+        if not shard_ranges:
+            raise SDKException('IndexServers', '104', 'shard ranges are required to query the shards in parallel')
+
+        pages = queue.Queue(maxsize=len(shard_ranges) * 2)
+        stop_event = threading.Event()
+
+        def put_page(page):
+            """Puts the page on the queue, waiting while the queue is full unless the caller has stopped"""
+            while not stop_event.is_set():
+                try:
+                    pages.put(page, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def query_shard(lower, upper):
+            """Puts the pages of the shard on the queue, followed by None once the shard is complete"""
+            shard_params = dict(op_params or {})
+            filter_queries = shard_params.get('fq', [])
+            if not isinstance(filter_queries, list):
+                filter_queries = [filter_queries]
+            shard_params['fq'] = filter_queries + [quote(f"{shard_field}:[{lower} TO {upper}}}", safe=':')]
+
+            try:
+                for documents in self._iter_solr_cursor(
+                        core_name, solr_client, select_dict, attr_list, shard_params, batch_size, unique_key):
+                    if not put_page(documents):
+                        return
+                put_page(None)
+            except Exception as excp:
+                put_page(excp)
+
+        threads = [
+            threading.Thread(target=query_shard, args=shard_range, daemon=True) for shard_range in shard_ranges
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            completed_shards = 0
+            while completed_shards < len(threads):
+                page = pages.get()
+                if page is None:
+                    completed_shards += 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    for document in page:
+                        yield document
+        finally:
+            stop_event.set()
+
     def get_index_node(self, node_name):
         """Returns an Index server node object for given node name
             Args:
@@ -1209,6 +1449,11 @@ class IndexServer(object):
             query = f'&{key}={str(value)}'
         return query
 
+    @property
+    def query_router(self):
+        """Returns the _QueryRouter used for the solr queries, None if query routing is not enabled"""
+        return self._query_router
+
     @property
     def plan_name(self):
         """Returns the plan name associated with index server
@@ -1431,6 +1676,127 @@ class IndexNode(object):
         self.refresh()
 
 
+class _QueryRouter(object):
+    """Class for spreading the solr queries across the healthy nodes of an index server"""
+
+    _STRATEGIES = ('round_robin', 'least_latency')
+
+    def __init__(self, index_server_object, strategy='round_robin', health_check_interval=300):
+        """Initializes _QueryRouter class with the index server object
+
+            Args:
+                index_server_object     (object)    --  instance of IndexServer class
+
+                strategy                (str)       --  round_robin or least_latency
+
+                health_check_interval   (int)       --  seconds after which the node health is checked again
+
+            Returns:
+                object  -   instance of _QueryRouter class
+
+            Raises:
+                SDKException:
+                    if strategy is not valid
+        """
+        if strategy not in self._STRATEGIES:
+            raise SDKException('IndexServers', '104', f'routing strategy should be one of {self._STRATEGIES}')
+
+        self._index_server = index_server_object
+        self._strategy = strategy
+        self._health_check_interval = health_check_interval
+        self._nodes = list(index_server_object.client_name)
+        self._healthy = {}
+        self._latency = {node: None for node in self._nodes}
+        self._sessions = {}
+        self._next_index = 0
+        self._last_health_check = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Representation string for the instance of the _QueryRouter class."""
+        return f"_QueryRouter class instance with strategy: {self._strategy}"
+
+    def _check_health(self):
+        """Checks the health of each node using the health indicators of the index server node"""
+        healthy = {}
+        for node in self._nodes:
+            try:
+                self._index_server.get_health_indicators(node)
+                healthy[node] = True
+            except (SDKException, requests.exceptions.RequestException):
+                healthy[node] = False
+
+        with self._lock:
+            self._healthy = healthy
+            self._last_health_check = time.monotonic()
+
+    def get_nodes(self):
+        """Returns the nodes in the order they should be queried, healthy nodes first
+
+            Returns:
+                list    -   client names of the index server nodes
+        """
+        if (self._last_health_check is None or
+                time.monotonic() - self._last_health_check > self._health_check_interval):
+            self._check_health()
+
+        with self._lock:
+            healthy = [node for node in self._nodes if self._healthy.get(node)]
+            unhealthy = [node for node in self._nodes if not self._healthy.get(node)]
+
+            if self._strategy == 'least_latency':
+                healthy.sort(key=lambda node: self._latency[node] or 0)
+            elif healthy:
+                start = self._next_index % len(healthy)
+                healthy = healthy[start:] + healthy[:start]
+                self._next_index += 1
+
+        return healthy + unhealthy
+
+    def get_session(self, node):
+        """Returns the persistent requests session for the node
+
+            Args:
+                node    (str)   --  client name of the index server node
+
+            Returns:
+                object  -   requests.Session for the node
+        """
+        with self._lock:
+            if node not in self._sessions:
+                self._sessions[node] = requests.Session()
+            return self._sessions[node]
+
+    def record_success(self, node, latency):
+        """Records the latency of a successful query on the node
+
+            Args:
+                node        (str)   --  client name of the index server node
+
+                latency     (float) --  time taken by the query in seconds
+        """
+        with self._lock:
+            previous = self._latency[node]
+            self._latency[node] = latency if previous is None else 0.8 * previous + 0.2 * latency
+            self._healthy[node] = True
+
+    def record_failure(self, node):
+        """Marks the node unhealthy till the next health check
+
+            Args:
+                node        (str)   --  client name of the index server node
+        """
+        with self._lock:
+            self._healthy[node] = False
+
+    def close(self):
+        """Closes the sessions of all the nodes"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
 class _Roles(object):
     """Class for cloud roles data operations"""
 
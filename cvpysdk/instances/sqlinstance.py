@@ -18,11 +18,33 @@
 
 """File for operating on a SQL Server Instance.
 
-SQLServerInstance is the only class defined in this file.
+SQLRecoveryCatalog: Class for caching the backed up databases of a sql server instance,
+                       indexed by the database and the backup time
 
 SQLServerInstance: Derived class from Instance Base class, representing a sql server instance,
                        and to perform operations on that instance
 
+SQLRecoveryCatalog:
+
+    __init__()                      --  initializes the recovery catalog of the instance
+
+    __repr__()                      --  returns the string representation of the catalog
+
+    _check_ttl()                    --  clears the catalog if it is older than the TTL
+
+    _add_databases()                --  adds the databases returned by a browse to the index
+
+    _lookup()                       --  returns the latest backup of the database before the
+    time, if it is known from the browses done
+
+    get_databases()                 --  returns the databases backed up in the time range
+
+    get_latest_backup()             --  returns the latest backup of the database before the time
+
+    get_latest_backups()            --  returns the latest backups of the databases before the time
+
+    refresh()                       --  clears the catalog
+
 SQLServerInstance:
 
     _get_instance_properties()      --  gets the instance related properties of SQL instance.
@@ -87,6 +109,8 @@ SQLServerInstance:
 
 SQLServerInstance Attributes:
 
+    recovery_catalog        --  returns the recovery catalog of the instance
+
     mssql_instance_prop     --  returns the mssql instance properties
 
     ag_group_name           --  returns the Availability Group Name
@@ -106,6 +130,7 @@ import time
 import datetime
 import threading
 from base64 import b64encode
+from bisect import bisect_left, bisect_right
 
 from ..instance import Instance
 from ..exception import SDKException
@@ -115,6 +140,186 @@ from ..schedules import Schedules
 from ..schedules import SchedulePattern
 
 
+class SQLRecoveryCatalog(object):
+    """Class for caching the backed up databases of a SQL Server instance, indexed by the database
+        and the backup time, to find the latest backup of a database before a point in time
+        without browsing the instance for each database and time.
+
+        A browse up to a time T which returns a backup created at time C for a database tells that
+        the backup is the latest one of the database for any time between C and T. The catalog
+        keeps the backup times of each database sorted, along with the time until which each
+        backup is known to be the latest, and looks up a time with bisect.
+    """
+
+    def __init__(self, instance_object, ttl=300):
+        """Initializes the recovery catalog of the SQL Server instance.
+
+            Args:
+                instance_object (object)    --  instance of the SQLServerInstance class
+
+                ttl             (int)       --  time in seconds after which the catalog is cleared,
+                and the browses are done again
+
+                    default: 300
+        """
+        self._instance_object = instance_object
+        self._commcell_object = instance_object._commcell_object
+        self._lock = threading.Lock()
+        self.ttl = ttl
+
+        self.refresh()
+
+    def __repr__(self):
+        """Representation string for the instance of the SQLRecoveryCatalog class."""
+        return 'SQLRecoveryCatalog class instance for Instance: "{0}"'.format(
+            self._instance_object.instance_name
+        )
+
+    def _check_ttl(self):
+        """Clears the catalog if it was loaded before the TTL."""
+        if self.ttl is not None and time.time() - self._loaded_time > self.ttl:
+            self.refresh()
+
+    def _add_databases(self, databases, to_time):
+        """Adds the databases returned by a browse up to the time to the index.
+
+            Args:
+                databases   (list)  --  databases returned by the browse, with full details
+
+                to_time     (int)   --  time up to which the browse was done
+        """
+        with self._lock:
+            for database in databases:
+                database_name = database['databaseName'].lower()
+                created_time = int(database['createdTime'])
+
+                backup_times = self._backup_times.setdefault(database_name, [])
+                covered_until = self._covered_until.setdefault(database_name, [])
+                backups = self._backups.setdefault(database_name, [])
+
+                index = bisect_left(backup_times, created_time)
+
+                if index < len(backup_times) and backup_times[index] == created_time:
+                    covered_until[index] = max(covered_until[index], to_time)
+                    backups[index] = database
+                else:
+                    backup_times.insert(index, created_time)
+                    covered_until.insert(index, to_time)
+                    backups.insert(index, database)
+
+    def _lookup(self, database_name, point_in_time):
+        """Returns the latest backup of the database before the time, if it is known from the
+            browses done, None otherwise."""
+        database_name = database_name.lower()
+
+        # the parallel lists are updated one after the other by _add_databases()
+        with self._lock:
+            backup_times = self._backup_times.get(database_name)
+
+            if not backup_times:
+                return None
+
+            index = bisect_right(backup_times, point_in_time) - 1
+
+            if index >= 0 and point_in_time <= self._covered_until[database_name][index]:
+                return self._backups[database_name][index]
+
+            return None
+
+    def get_databases(self, from_time=0, to_time=None):
+        """Returns the databases backed up in the time range, with the details of the latest
+            backup of each database, browsing the instance only once for each time range.
+
+            Args:
+                from_time   (int)   --  start of the time range, as epoch
+
+                    default: 0
+
+                to_time     (int)   --  end of the time range, as epoch
+
+                    default: None   (current time)
+
+            Returns:
+                list    -   details of the databases, with the raw epoch times, as returned by
+                the browse with full details
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        self._check_ttl()
+        to_time = int(time.time()) if to_time is None else int(to_time)
+        cache_key = (int(from_time), to_time)
+
+        if cache_key not in self._browse_results:
+            databases = self._instance_object.browse_in_time(
+                from_date=int(from_time), to_date=to_time, full_details=True
+            )
+
+            # the browse returns empty lists of the names and details if no database is backed up
+            self._browse_results[cache_key] = databases if isinstance(databases, list) else []
+
+        return self._browse_results[cache_key]
+
+    def get_latest_backup(self, database_name, point_in_time=None):
+        """Returns the details of the latest backup of the database before the time.
+
+            Args:
+                database_name   (str)   --  name of the database
+
+                point_in_time   (int)   --  time as epoch
+
+                    default: None   (current time)
+
+            Returns:
+                dict    -   details of the database as returned by the browse, None if the
+                database was not backed up before the time
+        """
+        return self.get_latest_backups([database_name], point_in_time)[database_name]
+
+    def get_latest_backups(self, database_names, point_in_time=None):
+        """Returns the details of the latest backups of the databases before the time, with at
+            most a single browse for all the databases.
+
+            Args:
+                database_names  (list)  --  names of the databases
+
+                point_in_time   (int)   --  time as epoch
+
+                    default: None   (current time)
+
+            Returns:
+                dict    -   name of each database mapped to its details as returned by the
+                browse, None if the database was not backed up before the time
+        """
+        self._check_ttl()
+        point_in_time = int(time.time()) if point_in_time is None else int(point_in_time)
+
+        backups = {
+            database_name: self._lookup(database_name, point_in_time) for database_name in database_names
+        }
+
+        if any(backup is None for backup in backups.values()):
+            self.get_databases(to_time=point_in_time)
+
+            for database_name, backup in backups.items():
+                if backup is None:
+                    backups[database_name] = self._lookup(database_name, point_in_time)
+
+        return backups
+
+    def refresh(self):
+        """Clears the catalog, so that the instance is browsed again."""
+        with self._lock:
+            self._backup_times = {}
+            self._covered_until = {}
+            self._backups = {}
+            self._browse_results = {}
+            self._loaded_time = time.time()
+
+
 class SQLServerInstance(Instance):
     """Derived class from Instance Base class, representing a SQL Server instance,
         and to perform operations on that Instance."""
@@ -144,6 +349,18 @@ class SQLServerInstance(Instance):
         """Returns the list of protected databases"""
         return self._get_database_list()
 
+    @property
+    def recovery_catalog(self):
+        """Returns the recovery catalog of the instance, which caches the backed up databases
+            indexed by the database and the backup time.
+
+            Returns:
+                object  -   instance of the SQLRecoveryCatalog class
+        """
+        if self._recovery_catalog is None:
+            self._recovery_catalog = SQLRecoveryCatalog(self)
+        return self._recovery_catalog
+
     @property
     def mssql_instance_prop(self):
         """ getter for sql server instance properties """
@@ -177,6 +394,7 @@ class SQLServerInstance(Instance):
 
         self._ag_group_name = None
         self._ag_primary_replica = None
+        self._recovery_catalog = None
         self._ag_replicas_list = []
         self._ag_group_listener_list = []
 
@@ -563,6 +781,7 @@ class SQLServerInstance(Instance):
         else:
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
+
         return response.json()
 
     def _run_backup(self, subclient_name, return_list):
@@ -582,13 +801,19 @@ class SQLServerInstance(Instance):
         except SDKException as excp:
             return_list.append(excp)
 
-    def _process_browse_request(self, browse_request, get_full_details=False):
+    def _process_browse_request(self, browse_request, get_full_details=False, to_time=None):
         """Runs the SQL Instance Browse API with the request JSON provided for the operation
             specified, and returns the contents after parsing the response.
 
+            The databases returned are also added to the recovery catalog of the instance.
+
             Args:
                 browse_request (dict):  JSON request to be sent to Server
 
+                get_full_details (bool):    returns the databases with all the details
+
+                to_time (int):  time up to which the browse is done, current time if None
+
             Returns:
                 list - list of all databases
 
@@ -601,6 +826,7 @@ class SQLServerInstance(Instance):
 
                     if response is not success
         """
+        to_time = int(time.time()) if to_time is None else to_time
         flag, response = self._commcell_object._cvpysdk_object.make_request("GET", browse_request)
 
         full_result = []
@@ -609,6 +835,8 @@ class SQLServerInstance(Instance):
         if flag:
             if response.json():
                 if 'sqlDatabase' in response.json():
+                    self.recovery_catalog._add_databases(response.json()['sqlDatabase'], to_time)
+
                     # returns whole dict if requested
                     if get_full_details:
                         return response.json()["sqlDatabase"]
@@ -1173,7 +1401,7 @@ class SQLServerInstance(Instance):
 
         browse_request += '?fromTime={0}&toTime={1}'.format(from_date, to_date)
 
-        return self._process_browse_request(browse_request, full_details)
+        return self._process_browse_request(browse_request, full_details, to_time=to_date)
 
     def restore(
             self,
@@ -456,9 +456,23 @@ class JobController(object):
             Args:
                 request_json    (dict)  --  request that is to be sent to server
 
+                paging_info     (bool)  --  if True, the paging info of the response is returned
+                along with the jobs, as the jobs not visible are dropped after the server applies
+                the limit
+
+                    default: False
+
             Returns:
                 dict    -   dict containing details about all the retrieved jobs
 
+                tuple   -   (dict of the jobs, dict of the paging info), if paging_info is True
+
+                    {
+                        'count': number of jobs returned by the server, including the ones not visible,
+
+                        'total': total number of jobs without paging, None if not reported
+                    }
+
             Raises:
                 SDKException:
                     if response is empty
@@ -473,12 +487,16 @@ class JobController(object):
         )
 
         jobs_dict = {}
+        page_info = {'count': 0, 'total': None}
 
         if flag:
             try:
                 if response.json():
+                    page_info['total'] = response.json().get('totalRecordsWithoutPaging')
+
                     if 'jobs' in response.json():
                         all_jobs = response.json()['jobs']
+                        page_info['count'] = len(all_jobs)
 
                         for job in all_jobs:
                             if 'jobSummary' in job and job['jobSummary']['isVisible'] is True:
@@ -543,6 +561,9 @@ class JobController(object):
 
                                     }
 
+                    if options.get('paging_info'):
+                        return jobs_dict, page_info
+
                     return jobs_dict
 
                 else:
@@ -2045,26 +2066,44 @@ class Job(object):
     def _is_valid_job(self):
         """Checks if the job submitted with the job id is a valid job or not.
 
+            The job summary is requested for at most 10 attempts, at most 1.5 seconds apart, and
+            within the deadline of the retry policy. Each request is a single attempt, so that
+            the retries are not nested.
+
             Returns:
                 bool    -   boolean that represents whether the job is valid or not
 
         """
-        for _ in range(10):
+        response_exception = None
+
+        for _ in self._commcell_object.retry_policy.attempts('Job._is_valid_job', max_attempts=10, max_delay=1.5):
             try:
-                self._get_job_summary()
+                self._get_job_summary(max_attempts=1)
                 return True
             except SDKException as excp:
                 if excp.exception_module == 'Job' and excp.exception_id == '104':
-                    time.sleep(1.5)
+                    response_exception = None
+                    continue
+                elif excp.exception_module == 'Response' and excp.exception_id in ('101', '102'):
+                    # failures the job summary retries itself, when not called for a single attempt
+                    response_exception = excp
                     continue
                 else:
                     raise excp
 
+        if response_exception is not None:
+            raise response_exception
+
         return False
 
-    def _get_job_summary(self):
+    def _get_job_summary(self, max_attempts=None):
         """Gets the properties of this job.
 
+            Args:
+                max_attempts    (int)   --  maximum number of attempts, overrides the retry policy value
+
+                    default: None
+
             Returns:
                 dict    -   dict that contains the summary of this job
 
@@ -2077,32 +2116,31 @@ class Job(object):
                     if response is not success
 
         """
-        attempts = 0
-        while attempts < 5:  # Retrying to ignore the transient case when no jobs are found
+        exception = SDKException('Job', '104')
+
+        # Retrying to ignore the transient case when no jobs are found
+        for _ in self._commcell_object.retry_policy.attempts('Job._get_job_summary', max_attempts=max_attempts):
             flag, response = self._cvpysdk_object.make_request('GET', self._JOB)
-            attempts += 1
 
             if flag:
                 if response.json():
                     if response.json().get('totalRecordsWithoutPaging', 0) == 0:
-                        time.sleep(2**attempts)
+                        exception = SDKException('Job', '104')
                         continue
 
                     if 'jobs' in response.json():
                         for job in response.json()['jobs']:
                             return job['jobSummary']
                 else:
-                    if attempts > 4:
-                        raise SDKException('Response', '102')
-                    time.sleep(20)
+                    exception = SDKException('Response', '102')
 
             else:
-                if attempts > 4:
-                    response_string = self._update_response_(response.text)
-                    raise SDKException('Response', '101', response_string)
-                time.sleep(20)
+                exception = SDKException('Response', '101', self._update_response_(response.text))
+
+                if not self._commcell_object.retry_policy.is_retryable(response):
+                    break
 
-        raise SDKException('Job', '104')
+        raise exception
 
     def _get_job_details(self):
         """Gets the detailed properties of this job.
@@ -2124,11 +2162,11 @@ class Job(object):
             "showAttempt": True
         }
 
-        retry_count = 0
+        exception = SDKException('Response', '102')
 
-        while retry_count < 5:  # Retrying to ignore the transient case when job details are not found
+        # Retrying to ignore the transient case when job details are not found
+        for _ in self._commcell_object.retry_policy.attempts('Job._get_job_details'):
             flag, response = self._cvpysdk_object.make_request('POST', self._JOB_DETAILS, payload)
-            retry_count += 1
 
             if flag:
                 if response.json():
@@ -2146,16 +2184,14 @@ class Job(object):
                     else:
                         raise SDKException('Job', '106', 'Response JSON: {0}'.format(response.json()))
                 else:
-                    if retry_count > 4:
-                        raise SDKException('Response', '102')
-                    time.sleep(20)
+                    exception = SDKException('Response', '102')
             else:
-                if retry_count > 4:
-                    response_string = self._update_response_(response.text)
-                    raise SDKException('Response', '101', response_string)
-                time.sleep(20)
+                exception = SDKException('Response', '101', self._update_response_(response.text))
 
-        raise SDKException('Response', '102')
+                if not self._commcell_object.retry_policy.is_retryable(response):
+                    break
+
+        raise exception
 
     def _get_job_task_details(self):
         """Gets the task details of this job.
@@ -2172,11 +2208,11 @@ class Job(object):
                     if response is not success
 
         """
-        retry_count = 0
+        exception = SDKException('Response', '102')
 
-        while retry_count < 5:  # Retrying to ignore the transient case when job task details are not found
+        # Retrying to ignore the transient case when job task details are not found
+        for _ in self._commcell_object.retry_policy.attempts('Job._get_job_task_details'):
             flag, response = self._cvpysdk_object.make_request('GET', self._JOB_TASK_DETAILS % self.job_id)
-            retry_count += 1
 
             if flag:
                 if response.json():
@@ -2194,16 +2230,14 @@ class Job(object):
                     else:
                         raise SDKException('Job', '106', 'Response JSON: {0}'.format(response.json()))
                 else:
-                    if retry_count > 4:
-                        raise SDKException('Response', '102')
-                    time.sleep(20)
+                    exception = SDKException('Response', '102')
             else:
-                if retry_count > 4:
-                    response_string = self._update_response_(response.text)
-                    raise SDKException('Response', '101', response_string)
-                time.sleep(20)
+                exception = SDKException('Response', '101', self._update_response_(response.text))
+
+                if not self._commcell_object.retry_policy.is_retryable(response):
+                    break
 
-        raise SDKException('Response', '102')
+        raise exception
 
     def _initialize_job_properties(self):
         """Initializes the common properties for the job.
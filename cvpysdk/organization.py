@@ -77,6 +77,13 @@ Organizations
 
     get_organizations_cache()   --  Gets all the organizations present in CommcellEntityCache DB.
 
+    _get_cached_organizations() --  returns all the organizations in the cache, fetched page by page
+
+    _get_organization_record()  --  returns the compact inventory record of the organization
+
+    get_inventory()             --  returns the inventory records of all the organizations, fetching
+    their properties concurrently, and only for the organizations changed since the previous sweep
+
     has_organization()          --  checks whether the organization with given name exists or not
 
     add()                       --  adds a new organization to the commcell
@@ -333,9 +340,12 @@ RemoteOrganization Attributes
 
 import re
 import json
+import hashlib
+import time
 
 from datetime import datetime
 
+from .bulk_operations import BulkOperationRunner
 from .exception import SDKException
 from .constants import ENTITY_TYPE_MAP
 from .security.user import User
@@ -717,6 +727,203 @@ class Organizations:
         else:
             raise SDKException('Response', '102')
 
+    def _get_cached_organizations(self, page_size=500):
+        """Returns all the organizations in the CommcellEntityCache, fetched page by page.
+
+            Args:
+                page_size   (int)   --  number of organizations fetched per request
+
+                    default: 500
+
+            Returns:
+                dict    -   organizations cache, as returned by get_organizations_cache()
+        """
+        organizations = {}
+        start = 0
+
+        while True:
+            page = self.get_organizations_cache(limit=[start, page_size])
+            organizations.update(page)
+            start += page_size
+
+            if len(page) < page_size or 0 < self.filter_query_count <= start:
+                return organizations
+
+    def _get_organization_record(self, organization_id):
+        """Returns the compact inventory record of the organization, parsed from its properties,
+            without initializing the Organization object.
+
+            Args:
+                organization_id     (str)   --  id of the organization
+
+            Returns:
+                dict    -   inventory record of the organization
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', self._services['ORGANIZATION'] % organization_id
+        )
+
+        if not flag:
+            response_string = self._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+        if not (response.json() and 'organizationInfo' in response.json()):
+            raise SDKException('Response', '102')
+
+        organization_info = response.json()['organizationInfo']
+        organization = organization_info.get('organization', {})
+        organization_properties = organization_info.get('organizationProperties', {})
+        deactivate_options = organization.get('deactivateOptions', {})
+
+        return {
+            'id': str(organization_id),
+            'name': organization.get('connectName', ''),
+            'domain_name': organization.get('shortName', {}).get('domainName'),
+            'email_domain_names': organization.get('emailDomainNames', []),
+            'primary_domain': organization_properties.get('primaryDomain', ''),
+            'additional_domains': organization_properties.get('additionalDomains', []),
+            'plans': {
+                plan['plan']['planName'].lower(): plan['plan']['planId']
+                for plan in organization_info.get('planDetails', [])
+            },
+            'default_plans': [
+                plan['plan']['planName'] for plan in organization_properties.get('defaultPlans', [])
+            ],
+            'activity': {
+                'backup_disabled': deactivate_options.get('disableBackup'),
+                'restore_disabled': deactivate_options.get('disableRestore'),
+                'login_disabled': deactivate_options.get('disableLogin')
+            },
+            'limits': {
+                'machine_count': organization_properties.get('totalMachineCount'),
+                'server_count': organization_properties.get('serverCount'),
+                'user_count': organization_properties.get('userCount'),
+                'password_age_days': organization_properties.get('agePasswordDays', 0),
+                'session_timeout': organization_properties.get('loginSessionTimeoutInMinutes')
+            },
+            'reseller_enabled': organization_properties.get('canCreateCompanies'),
+            'auth_code_enabled': organization_properties.get('enableAuthCodeGen'),
+            'supported_solutions': organization_properties.get('supportedSolutions')
+        }
+
+    def get_inventory(self, previous=None, max_concurrency=10, max_age=3600, page_size=500):
+        """Returns the inventory records of all the organizations.
+
+            The organizations are listed from the CommcellEntityCache, and the properties are
+            fetched over a pool of at most max_concurrency workers. With the records of the
+            previous sweep, the properties are fetched again only for the organizations whose
+            cache entry changed since then, or whose record is older than max_age.
+
+            The cache entry has the name, status, contacts and parent company of the organization,
+            but not its plans, domains, limits or activity, so the changes to those are picked up
+            only once the record is older than max_age.
+
+            Args:
+                previous        (dict)  --  records returned by the previous sweep
+
+                    default: None   (the properties of all the organizations are fetched)
+
+                max_concurrency (int)   --  maximum number of properties fetched at a time
+
+                    default: 10
+
+                max_age         (int)   --  seconds after which a record is fetched again,
+                even if the cache entry of the organization is unchanged
+
+                    default: 3600
+
+                    if None, only the organizations whose cache entry changed are fetched, and
+                    the changes to the plans, domains, limits and activity are never picked up
+
+                page_size       (int)   --  number of organizations listed per request
+
+                    default: 500
+
+            Returns:
+                dict    -   organization name mapped to its record, with the keys returned by
+                _get_organization_record(), and
+
+                    {
+                        'GUID': <GUID of the organization>,
+
+                        'status': <status of the organization>,
+
+                        'parent_company': <name of the parent company>,
+
+                        'change_key': <hash of the cache entry of the organization>,
+
+                        'fetched_at': <time the properties were fetched>,
+
+                        'error': <error, if failed to fetch the properties>
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the inputs is not valid
+
+                    if failed to list the organizations
+        """
+        if not (previous is None or isinstance(previous, dict)):
+            raise SDKException('Organization', '101')
+
+        if not isinstance(page_size, int) or page_size < 1:
+            raise SDKException('Organization', '101')
+
+        previous = previous or {}
+        now = int(time.time())
+        inventory = {}
+        to_fetch = []
+
+        for name, organization in self._get_cached_organizations(page_size).items():
+            change_key = hashlib.sha1(
+                json.dumps(organization, sort_keys=True, default=str).encode('utf-8')
+            ).hexdigest()
+            record = previous.get(name)
+
+            if (record and not record.get('error') and record.get('change_key') == change_key and
+                    (max_age is None or now - record.get('fetched_at', 0) < max_age)):
+                inventory[name] = record
+                continue
+
+            inventory[name] = {
+                'id': str(organization.get('id')),
+                'name': name,
+                'GUID': organization.get('providerGUID'),
+                'status': organization.get('status'),
+                'parent_company': organization.get('parentCompany'),
+                'change_key': change_key
+            }
+            # keyed by the cache name, as the organizations of different commcells in the global
+            # scope can have the same id
+            to_fetch.append(name)
+
+        runner = BulkOperationRunner(max_concurrency=max_concurrency)
+
+        for name, record in runner.run(
+                lambda name: self._get_organization_record(inventory[name]['id']), to_fetch
+        ):
+            if isinstance(record, Exception):
+                inventory[name]['error'] = str(record)
+                continue
+
+            record.update({
+                'name': name,
+                'GUID': inventory[name]['GUID'],
+                'status': inventory[name]['status'],
+                'parent_company': inventory[name]['parent_company'],
+                'change_key': inventory[name]['change_key'],
+                'fetched_at': int(time.time())
+            })
+            inventory[name] = record
+
+        return inventory
+
     @property
     def all_organizations_cache(self):
         """Returns the dictionary consisting of all the organizations cache present in mongoDB
@@ -72,6 +72,8 @@ Plans
 
     get_plans_cache()           --  Returns plan cache in response
 
+    get_plans_report()          --  Returns the projected fields of all the plans, page by page
+
 Attributes
 ----------
 
@@ -90,8 +92,24 @@ Plan
 
     _get_plan_id()              -- method to get the plan id, if not specified in __init__
 
+    __getattr__()               -- parses the lazily loaded property groups of the plan on first access
+
     _get_plan_properties()      -- get the properties of this plan
 
+    _parse_storage_copies()     -- parses the storage copies of the plan
+
+    _parse_auto_created_entities()  -- parses the client group and user group of the laptop plan
+
+    _parse_inheritance()        -- parses the override restrictions of the plan
+
+    _parse_dc_plan_props()      -- parses the data classification properties of the plan
+
+    _parse_security_associations()  -- parses the security associations of the plan
+
+    _parse_storage_resources()  -- parses the backup destination regions and resources of the plan
+
+    _parse_v4_plan_properties() -- fetches the V4 properties of the server plan
+
     _update_plan_props()        -- method to update plan properties
 
     _get_associated_entities()  -- method to get list of entities associated to a plan
@@ -823,6 +841,70 @@ class Plans(object):
         else:
             raise SDKException("Plan", "102", "Failed to get plans summary")
 
+    def get_plans_report(self, fields=None, page_size=500, **kwargs) -> list:
+        """Returns the projected fields of all the plans, fetched page by page from the plans cache,
+            without initializing the Plan objects.
+
+            Args:
+                fields      (list)  --  columns to return for each plan, e.g.; ['rpoInMinutes', 'numCopies']
+                                        valid columns are the keys of valid_columns
+
+                    default: None   (all the columns)
+
+                page_size   (int)   --  number of plans fetched per request
+
+                    default: 500
+
+                **kwargs    (dict)  --  sort, search and fq options, as accepted by get_plans_cache()
+
+            Returns:
+                list    -   dict of the projected fields for each plan
+
+                    [
+                        {
+                            'planName': 'plan1',
+
+                            'planId': 1,
+
+                            'rpoInMinutes': 1440
+                        }
+                    ]
+
+            Raises:
+                SDKException:
+                    if invalid column name is passed
+
+                    if response is not success
+        """
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise SDKException('Plan', '101')
+
+        kwargs.pop('limit', None)
+        kwargs['fl'] = fields
+        report = []
+        start = 0
+
+        while True:
+            plans = self.get_plans_cache(limit=[start, page_size], **kwargs)
+
+            for plan_config in plans.values():
+                if fields:
+                    projected = {'planName': plan_config['planName'], 'planId': plan_config['planId']}
+
+                    for field in fields:
+                        projected[field] = plan_config.get('resourcePool' if field == 'storage' else field)
+
+                    plan_config = projected
+
+                report.append(plan_config)
+
+            start += page_size
+
+            if len(plans) < page_size or 0 < self.filter_query_count <= start:
+                break
+
+        return report
+
     @property
     def all_plans(self):
         """Returns the dictionary consisting of all the plans added to the Commcell.
@@ -2046,6 +2128,23 @@ class Plans(object):
 class Plan(object):
     """Class for performing operations for a specific Plan."""
 
+    # attributes parsed from the plan properties only on first access, mapped to the method parsing them
+    _LAZY_ATTRIBUTES = {
+        '_all_copies': '_parse_storage_copies',
+        '_storage_copies': '_parse_storage_copies',
+        '_client_group': '_parse_auto_created_entities',
+        '_user_group': '_parse_auto_created_entities',
+        '_override_entities': '_parse_inheritance',
+        '_dc_plan_props': '_parse_dc_plan_props',
+        '_applicable_solutions': '_parse_dc_plan_props',
+        '_security_associations': '_parse_security_associations',
+        '_provider_domain_name': '_parse_security_associations',
+        '_region_id': '_parse_storage_resources',
+        '_resources': '_parse_storage_resources',
+        '_associated_entities': '_get_associated_entities',
+        '_v4_plan_properties': '_parse_v4_plan_properties'
+    }
+
     def __init__(self, commcell_object, plan_name, plan_id=None):
         """Initialize the Plan class instance.
 
@@ -2090,34 +2189,31 @@ class Plan(object):
         self._full_operation_window = None
         self._plan_type = None
         self._subtype = None
-        self._security_associations = {}
-        self._provider_domain_name = None
-        self._resources = None
         self._storage_pool = None
         self._child_policies = {
             'storagePolicy': None,
             'schedulePolicy': {},
             'subclientPolicyIds': []
         }
-        self._storage_copies = {}
-        self._all_copies = None
-        self._user_group = None
-        self._client_group = None
-        self._override_entities = None
         self._parent_plan_name = None
         self._addons = []
-        self._associated_entities = {}
-        self._dc_plan_props = {}
         self._plan_entity_type = 158
-        self._region_id = []
-        self._applicable_solutions = []
-        self._v4_plan_properties = {}
         self.refresh()
         self.plan_v4_helper = _PayloadGeneratorPlanV4(commcell=self._commcell_object)
         self._data_schedule_policy = None
         self._log_schedule_policy = None
         self._snap_schedule_policy = None
 
+    def __getattr__(self, attribute):
+        """Parses the group of the plan properties the attribute belongs to, on first access"""
+        parser = Plan._LAZY_ATTRIBUTES.get(attribute)
+
+        if parser is None or self.__dict__.get('_plan_properties') is None:
+            raise AttributeError("'Plan' object has no attribute '{0}'".format(attribute))
+
+        getattr(self, parser)()
+        return self.__dict__[attribute]
+
     def __repr__(self):
         """String representation of the instance of this class."""
         representation_string = 'Plan class instance for plan: "{0}", of Commcell: "{1}"'
@@ -2132,8 +2228,16 @@ class Plan(object):
             Returns:
                 str - id associated with this plan
         """
-        plans = Plans(self._commcell_object)
-        return plans.get(self.plan_name).plan_id
+        plans = self._commcell_object.plans
+
+        if not plans.has_plan(self._plan_name):
+            # the plan may have been created after the plans of the commcell were listed
+            plans.refresh()
+
+            if not plans.has_plan(self._plan_name):
+                raise SDKException('Plan', '102', 'No plan exists with name: {0}'.format(self._plan_name))
+
+        return str(plans.all_plans[self._plan_name])
 
     def _get_v4_plan_properties(self) -> Dict:
         """Gets the properties of this plan from V4 API
@@ -2190,50 +2294,6 @@ class Plan(object):
                 if 'subtype' in self._plan_properties['summary']:
                     self._subtype = self._plan_properties['summary']['subtype']
 
-                if 'storage' in self._plan_properties:
-                    if 'copy' in self._plan_properties['storage']:
-                        self._all_copies = self._plan_properties.get('storage',{}).get('copy',[])
-                        for copy in self._plan_properties['storage']['copy']:
-                            if 'useGlobalPolicy' in copy:
-                                storage_pool_name = copy['useGlobalPolicy']['storagePolicyName'].lower()
-                            else:
-                                storage_pool_name = copy['library']['libraryName'].lower()
-                            self._storage_copies[copy['StoragePolicyCopy']['copyName']] = {
-                                'storagePool': storage_pool_name,
-                                'retainBackupDataForDays': copy[
-                                    'retentionRules']['retainBackupDataForDays'],
-                                'isDefault': False,
-                                'isSnapCopy': False,
-                            }
-                            if 'extendedRetentionRuleOne' in copy['retentionRules']:
-                                self._storage_copies[
-                                    copy['StoragePolicyCopy']['copyName']]['extendedRetention'] = (
-                                        1,
-                                        True,
-                                        copy['retentionRules']['extendedRetentionRuleOne']['rule'],
-                                        copy['retentionRules']['extendedRetentionRuleOne']['endDays'],
-                                        copy['retentionRules']['extendedRetentionRuleOne']['graceDays']
-                                    ) 
-                            if copy['isDefault'] == 1:
-                                self._storage_copies[
-                                    copy['StoragePolicyCopy']['copyName']]['isDefault'] = True
-
-                            if copy['isSnapCopy'] == 1:
-                                self._storage_copies[
-                                    copy['StoragePolicyCopy']['copyName']]['isSnapCopy'] = True
-
-                if self._subtype == 33554439:
-                    if 'clientGroup' in self._plan_properties['autoCreatedEntities']:
-                        self._commcell_object.client_groups.refresh()
-                        self._client_group = self._commcell_object.client_groups.get(
-                            self._plan_properties['autoCreatedEntities']['clientGroup'][
-                                'clientGroupName']
-                        )
-
-                    if 'localUserGroup' in self._plan_properties['autoCreatedEntities']:
-                        self._user_group = self._plan_properties['autoCreatedEntities'][
-                            'localUserGroup']['userGroupName']
-
                 if self._plan_properties['operationWindow']['ruleId'] != 0:
                     self._operation_window = self._plan_properties['operationWindow']
                 else:
@@ -2244,86 +2304,12 @@ class Plan(object):
                 else:
                     self._full_operation_window = None
 
-                if 'laptop' in self._plan_properties:
-                    if 'backupContent' in self._plan_properties['laptop']['content']:
-                        self._child_policies['subclientPolicyIds'].clear()
-                        for ida in self._plan_properties['laptop']['content']['backupContent']:
-                            if ida['subClientPolicy'].get('backupSetEntity'):
-                                self._child_policies['subclientPolicyIds'].append(
-                                    ida['subClientPolicy']['backupSetEntity']['backupsetId']
-                                )
-
-                if ('inheritance' in self._plan_properties and
-                        not self._plan_properties['inheritance']['isSealed']):
-                    temp_dict = self._plan_properties['inheritance']
-                    del temp_dict['isSealed']
-                    if 'enforcedEntities' not in temp_dict:
-                        temp_dict['enforcedEntities'] = []
-                    if 'privateEntities' not in temp_dict:
-                        temp_dict['privateEntities'] = []
-                    self._override_entities = temp_dict
-
                 if 'parent' in self._plan_properties['summary']:
                     self._parent_plan_name = self._plan_properties['summary']['parent']['planName']
 
-                if 'eePolicy' in self._plan_properties:
-                    extraction_policy = self._plan_properties['eePolicy']
-                    if 'policyEntity' in extraction_policy:
-                        self._dc_plan_props['eePolicyId'] = extraction_policy['policyEntity']['policyId']
-                    if 'detail' in extraction_policy:
-                        self._dc_plan_props['eePolicy'] = extraction_policy['detail']['eePolicy']
-
-                if 'ciPolicy' in self._plan_properties:
-                    ci_policy = self._plan_properties['ciPolicy']
-                    if 'policyEntity' in ci_policy:
-                        self._dc_plan_props['ciPolicyId'] = ci_policy['policyEntity']['policyId']
-                    if 'detail' in ci_policy:
-                        self._dc_plan_props['ciPolicy'] = ci_policy['detail']['ciPolicy']
-
-                if 'eDiscoveryInfo' in self._plan_properties:
-                    if 'analyticsIndexServer' in self._plan_properties['eDiscoveryInfo']:
-                        self._dc_plan_props['analyticsIndexServer'] = self._plan_properties['eDiscoveryInfo']['analyticsIndexServer']
-
-                if 'options' in self._plan_properties:
-                    plan_options = self._plan_properties['options']
-                    if 'targetApps' in plan_options:
-                        self._dc_plan_props['targetApps'] = plan_options['targetApps']
-
-                    if 'supportedWorkloads' in plan_options:
-                        self._applicable_solutions = [soln['solutionName'] for soln in plan_options['supportedWorkloads'].get('solutions', [])]
-
-                if 'securityAssociations' in self._plan_properties:
-                    self._security_associations = {}
-                    for association in self._plan_properties['securityAssociations'].get('associations', []):
-                        temp_key = None
-                        if 'externalGroupName' in association['userOrGroup'][0]:
-                            temp_key = '{0}\\{1}'.format(
-                                    association['userOrGroup'][0]['providerDomainName'],
-                                    association['userOrGroup'][0]['externalGroupName']
-                                )
-                        elif 'userGroupName' in association['userOrGroup'][0]:
-                            temp_key = association['userOrGroup'][0]['userGroupName']
-                        else:
-                            temp_key = association['userOrGroup'][0]['userName']
-                        if 'role' in association['properties']:
-                            if temp_key in self._security_associations:
-                                self._security_associations[temp_key].append(
-                                    association['properties']['role']['roleName']
-                                )
-                            else:
-                                self._security_associations[temp_key] = [association['properties']['role']['roleName']]
-                    if 'tagWithCompany' in self._plan_properties.get('securityAssociations'):
-                        self._provider_domain_name = self._plan_properties.get('securityAssociations', {}).\
-                            get('tagWithCompany', {}).get('providerDomainName')
-
-                if "storageRules" in self._plan_properties:
-                    self._region_id = [x["regions"]["region"][0]["regionId"]
-                                       for x in self._plan_properties["storageRules"]["rules"]]
-
-                if 'storageResourcePoolMap' in self._plan_properties:
-                    self._resources = self._plan_properties.get('storageResourcePoolMap', {})[0].get('resources')
-
-                self._get_associated_entities()
+                # the other property groups are parsed again on first access
+                for attribute in self._LAZY_ATTRIBUTES:
+                    self.__dict__.pop(attribute, None)
 
                 return self._plan_properties
             else:
@@ -2332,6 +2318,156 @@ class Plan(object):
             response_string = self._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
+    def _parse_storage_copies(self):
+        """Parses the storage copies of the plan from the plan properties"""
+        self._all_copies = None
+        self._storage_copies = {}
+
+        if 'copy' not in self._plan_properties.get('storage', {}):
+            return
+
+        self._all_copies = self._plan_properties['storage']['copy']
+
+        for copy in self._all_copies:
+            if 'useGlobalPolicy' in copy:
+                storage_pool_name = copy['useGlobalPolicy']['storagePolicyName'].lower()
+            else:
+                storage_pool_name = copy['library']['libraryName'].lower()
+            self._storage_copies[copy['StoragePolicyCopy']['copyName']] = {
+                'storagePool': storage_pool_name,
+                'retainBackupDataForDays': copy[
+                    'retentionRules']['retainBackupDataForDays'],
+                'isDefault': False,
+                'isSnapCopy': False,
+            }
+            if 'extendedRetentionRuleOne' in copy['retentionRules']:
+                self._storage_copies[
+                    copy['StoragePolicyCopy']['copyName']]['extendedRetention'] = (
+                        1,
+                        True,
+                        copy['retentionRules']['extendedRetentionRuleOne']['rule'],
+                        copy['retentionRules']['extendedRetentionRuleOne']['endDays'],
+                        copy['retentionRules']['extendedRetentionRuleOne']['graceDays']
+                    )
+            if copy['isDefault'] == 1:
+                self._storage_copies[
+                    copy['StoragePolicyCopy']['copyName']]['isDefault'] = True
+
+            if copy['isSnapCopy'] == 1:
+                self._storage_copies[
+                    copy['StoragePolicyCopy']['copyName']]['isSnapCopy'] = True
+
+    def _parse_auto_created_entities(self):
+        """Parses the client group and user group created for the laptop plan, as name and id references"""
+        self._client_group = None
+        self._user_group = None
+
+        if self._subtype != 33554439:
+            return
+
+        auto_created_entities = self._plan_properties.get('autoCreatedEntities', {})
+
+        if 'clientGroup' in auto_created_entities:
+            self._client_group = {
+                'clientGroupName': auto_created_entities['clientGroup'].get('clientGroupName'),
+                'clientGroupId': auto_created_entities['clientGroup'].get('clientGroupId')
+            }
+
+        if 'localUserGroup' in auto_created_entities:
+            self._user_group = auto_created_entities['localUserGroup']['userGroupName']
+
+    def _parse_inheritance(self):
+        """Parses the override restrictions of the plan from the plan properties"""
+        self._override_entities = None
+        inheritance = self._plan_properties.get('inheritance')
+
+        if inheritance and not inheritance['isSealed']:
+            temp_dict = dict(inheritance)
+            del temp_dict['isSealed']
+            if 'enforcedEntities' not in temp_dict:
+                temp_dict['enforcedEntities'] = []
+            if 'privateEntities' not in temp_dict:
+                temp_dict['privateEntities'] = []
+            self._override_entities = temp_dict
+
+    def _parse_dc_plan_props(self):
+        """Parses the data classification properties and applicable solutions of the plan"""
+        self._dc_plan_props = {}
+        self._applicable_solutions = []
+
+        if 'eePolicy' in self._plan_properties:
+            extraction_policy = self._plan_properties['eePolicy']
+            if 'policyEntity' in extraction_policy:
+                self._dc_plan_props['eePolicyId'] = extraction_policy['policyEntity']['policyId']
+            if 'detail' in extraction_policy:
+                self._dc_plan_props['eePolicy'] = extraction_policy['detail']['eePolicy']
+
+        if 'ciPolicy' in self._plan_properties:
+            ci_policy = self._plan_properties['ciPolicy']
+            if 'policyEntity' in ci_policy:
+                self._dc_plan_props['ciPolicyId'] = ci_policy['policyEntity']['policyId']
+            if 'detail' in ci_policy:
+                self._dc_plan_props['ciPolicy'] = ci_policy['detail']['ciPolicy']
+
+        if 'eDiscoveryInfo' in self._plan_properties:
+            if 'analyticsIndexServer' in self._plan_properties['eDiscoveryInfo']:
+                self._dc_plan_props['analyticsIndexServer'] = self._plan_properties['eDiscoveryInfo']['analyticsIndexServer']
+
+        if 'options' in self._plan_properties:
+            plan_options = self._plan_properties['options']
+            if 'targetApps' in plan_options:
+                self._dc_plan_props['targetApps'] = plan_options['targetApps']
+
+            if 'supportedWorkloads' in plan_options:
+                self._applicable_solutions = [soln['solutionName'] for soln in plan_options['supportedWorkloads'].get('solutions', [])]
+
+    def _parse_security_associations(self):
+        """Parses the security associations and the company of the plan from the plan properties"""
+        self._security_associations = {}
+        self._provider_domain_name = None
+
+        if 'securityAssociations' in self._plan_properties:
+            for association in self._plan_properties['securityAssociations'].get('associations', []):
+                temp_key = None
+                if 'externalGroupName' in association['userOrGroup'][0]:
+                    temp_key = '{0}\\{1}'.format(
+                            association['userOrGroup'][0]['providerDomainName'],
+                            association['userOrGroup'][0]['externalGroupName']
+                        )
+                elif 'userGroupName' in association['userOrGroup'][0]:
+                    temp_key = association['userOrGroup'][0]['userGroupName']
+                else:
+                    temp_key = association['userOrGroup'][0]['userName']
+                if 'role' in association['properties']:
+                    if temp_key in self._security_associations:
+                        self._security_associations[temp_key].append(
+                            association['properties']['role']['roleName']
+                        )
+                    else:
+                        self._security_associations[temp_key] = [association['properties']['role']['roleName']]
+            if 'tagWithCompany' in self._plan_properties.get('securityAssociations'):
+                self._provider_domain_name = self._plan_properties.get('securityAssociations', {}).\
+                    get('tagWithCompany', {}).get('providerDomainName')
+
+    def _parse_storage_resources(self):
+        """Parses the backup destination regions and storage resources of the plan"""
+        self._region_id = []
+        self._resources = None
+
+        if "storageRules" in self._plan_properties:
+            self._region_id = [x["regions"]["region"][0]["regionId"]
+                               for x in self._plan_properties["storageRules"]["rules"]]
+
+        if 'storageResourcePoolMap' in self._plan_properties:
+            self._resources = self._plan_properties.get('storageResourcePoolMap', {})[0].get('resources')
+
+    def _parse_v4_plan_properties(self):
+        """Fetches the properties of the server plan from V4 API"""
+        self._v4_plan_properties = {}
+
+        if self._subtype == 33554437:
+            self._get_v4_plan_properties()
+
     def derive_and_add(self,
                        plan_name,
                        storage_pool_name=None,
@@ -3235,6 +3371,7 @@ class Plan(object):
 
                     if response is not success
         """
+        self._associated_entities = {}
         request_url = self._services['ASSOCIATED_ENTITIES'] % (self._plan_id)
         flag, response = self._cvpysdk_object.make_request(
             'GET', request_url
@@ -3712,10 +3849,6 @@ class Plan(object):
         """Refresh the properties of the Plan."""
         self._properties = self._get_plan_properties()
 
-        # fetch v4 properties for server plans
-        if self.subtype == 33554437:
-            self._v4_plan_properties = self._get_v4_plan_properties()
-
         # lazy loading of properties
         self._data_schedule_policy = None
         self._log_schedule_policy = None
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Main file for the retry policy used by the SDK to retry the requests on transient failures.
+
+An instance of the RetryPolicy class is available for each commcell as `commcell.retry_policy`,
+and can be tuned, or replaced, to control how long the SDK waits on transient failures.
+
+RetryPolicy:
+    __init__(max_attempts,
+             base_delay,
+             max_delay,
+             multiplier,
+             jitter,
+             deadline,
+             retryable_status_codes)    --  initialize object of the RetryPolicy class
+
+    __repr__()                          --  returns the string representation of the policy
+
+    _record()                           --  updates the metrics of the given operation
+
+    get_delay()                         --  returns the jittered backoff delay for the attempt
+
+    is_retryable()                      --  checks if the failed response can be retried
+
+    attempts()                          --  yields the attempt numbers, sleeping between the attempts
+
+    reset_metrics()                     --  clears the metrics collected by the policy
+
+Attributes
+----------
+
+    **metrics**     --  returns the number of calls, attempts, retries, exhausted calls and
+    the time slept for each operation retried by the policy
+
+Usage
+=====
+
+    >>> for attempt in commcell.retry_policy.attempts('Clients._get_clients'):
+    ...     flag, response = commcell._cvpysdk_object.make_request('GET', url)
+    ...     if flag:
+    ...         break
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import random
+import threading
+import time
+
+from .exception import SDKException
+
+
+class RetryPolicy(object):
+    """Class for retrying an operation with jittered exponential backoff and an overall deadline."""
+
+    def __init__(
+            self,
+            max_attempts=5,
+            base_delay=1.0,
+            max_delay=30.0,
+            multiplier=2.0,
+            jitter=0.5,
+            deadline=300.0,
+            retryable_status_codes=(408, 429, 500, 502, 503, 504)):
+        """Initialize object of the RetryPolicy class.
+
+            Args:
+                max_attempts            (int)   --  maximum number of attempts for an operation
+
+                    default: 5
+
+                base_delay              (float) --  delay in seconds before the first retry
+
+                    default: 1.0
+
+                max_delay               (float) --  maximum delay in seconds between two attempts
+
+                    default: 30.0
+
+                multiplier              (float) --  factor by which the delay grows after each retry
+
+                    default: 2.0
+
+                jitter                  (float) --  fraction of the delay, between 0 and 1, which is
+                randomized to spread out the retries from concurrent callers
+
+                    default: 0.5
+
+                deadline                (float) --  maximum time in seconds spent on an operation,
+                after which no more attempts are made
+
+                    default: 300.0
+
+                retryable_status_codes  (tuple) --  HTTP status codes of the failed responses which
+                are retried
+
+                    default: (408, 429, 500, 502, 503, 504)
+
+            Raises:
+                SDKException:
+                    if type or value of the inputs is not valid
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise SDKException('RetryPolicy', '101')
+
+        for value in (base_delay, max_delay, multiplier, deadline):
+            if not isinstance(value, (int, float)) or value < 0:
+                raise SDKException('RetryPolicy', '101')
+
+        if not isinstance(jitter, (int, float)) or not 0 <= jitter <= 1:
+            raise SDKException('RetryPolicy', '101')
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retryable_status_codes = set(retryable_status_codes)
+
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Representation string for the instance of the RetryPolicy class."""
+        return "RetryPolicy class instance with max attempts: {0} and deadline: {1}s".format(
+            self.max_attempts, self.deadline
+        )
+
+    def _record(self, operation, **counters):
+        """Adds the given counters to the metrics of the operation.
+
+            Args:
+                operation   (str)   --  name of the operation
+
+                **counters          --  value to add to each of the metrics of the operation
+        """
+        with self._lock:
+            metrics = self._metrics.setdefault(operation, {
+                'calls': 0,
+                'attempts': 0,
+                'retries': 0,
+                'exhausted': 0,
+                'sleep_time': 0.0
+            })
+
+            for counter, value in counters.items():
+                metrics[counter] += value
+
+    def get_delay(self, retry, base_delay=None, max_delay=None):
+        """Returns the delay before the given retry, with the jitter applied.
+
+            Args:
+                retry       (int)   --  number of the retry, starting from 1
+
+                base_delay  (float) --  delay before the first retry, overrides the policy value
+
+                    default: None
+
+                max_delay   (float) --  maximum delay between two attempts, overrides the policy value
+
+                    default: None
+
+            Returns:
+                float   -   delay in seconds
+        """
+        base_delay = self.base_delay if base_delay is None else base_delay
+        max_delay = self.max_delay if max_delay is None else max_delay
+
+        delay = min(max_delay, base_delay * (self.multiplier ** (retry - 1)))
+        return delay * (1 - self.jitter * random.random())
+
+    def is_retryable(self, response):
+        """Checks if the request for the failed response can be retried.
+
+            Args:
+                response    (object)    --  response received for the failed request
+
+            Returns:
+                bool    -   True if the status code of the response is retryable, or the response
+                does not have a status code
+        """
+        status_code = getattr(response, 'status_code', None)
+        return status_code is None or status_code in self.retryable_status_codes
+
+    def attempts(self, operation, max_attempts=None, base_delay=None, max_delay=None, deadline=None):
+        """Yields the attempt numbers for the operation, sleeping with jittered exponential backoff
+            before each retry.
+
+            The caller breaks out of the loop, or returns, once the operation succeeds.
+            No more attempts are yielded once the maximum attempts are made, or the next retry
+            would exceed the deadline.
+
+            Args:
+                operation       (str)   --  name of the operation, used for the metrics
+
+                max_attempts    (int)   --  maximum number of attempts, overrides the policy value
+
+                    default: None
+
+                base_delay      (float) --  delay before the first retry, overrides the policy value
+
+                    default: None
+
+                max_delay       (float) --  maximum delay between two attempts, overrides the policy value
+
+                    default: None
+
+                deadline        (float) --  maximum time spent on the operation, overrides the policy value
+
+                    default: None
+
+            Yields:
+                int     -   number of the attempt, starting from 1
+        """
+        max_attempts = self.max_attempts if max_attempts is None else max_attempts
+        deadline = self.deadline if deadline is None else deadline
+        start_time = time.monotonic()
+
+        self._record(operation, calls=1, attempts=1)
+        yield 1
+
+        for attempt in range(2, max_attempts + 1):
+            delay = self.get_delay(attempt - 1, base_delay, max_delay)
+
+            if time.monotonic() - start_time + delay > deadline:
+                break
+
+            time.sleep(delay)
+            self._record(operation, attempts=1, retries=1, sleep_time=delay)
+            yield attempt
+
+        self._record(operation, exhausted=1)
+
+    @property
+    def metrics(self):
+        """Returns the metrics of the operations retried by this policy
+
+            dict - consists of the metrics of each operation
+
+                {
+                    'operation_name': {
+                        'calls': 10,
+                        'attempts': 12,
+                        'retries': 2,
+                        'exhausted': 0,
+                        'sleep_time': 3.1
+                    }
+                }
+        """
+        with self._lock:
+            return {operation: dict(metrics) for operation, metrics in self._metrics.items()}
+
+    def reset_metrics(self):
+        """Clears the metrics collected by this policy"""
+        with self._lock:
+            self._metrics = {}
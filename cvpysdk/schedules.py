@@ -55,6 +55,34 @@ SchedulePattern:
                                                                             pattern provided
 
 
+ScheduleForecast: Class for predicting the run times of the schedules, from their patterns
+
+ScheduleForecast:
+    __init__(schedules)                             --  initialise object of the ScheduleForecast
+                                                        class
+
+    _get_days(start_date, end_date)                 --  returns the calendar details of each day
+                                                        in the date range
+
+    _relative_match(pattern, day)                   --  checks if the day is the relative day of the
+                                                        month set in the pattern
+
+    _runs_on(pattern, day, start_day)               --  checks if the pattern runs on the day
+
+    _day_times(pattern)                             --  returns the run times of the pattern in a day
+
+    _expand(pattern, start_time, end_time, days)    --  returns the run times of the pattern in the
+                                                        time window
+
+    occurrences(start_time, end_time)               --  returns the run times of all the schedules
+                                                        in the time window
+
+    hourly_load(start_time, end_time)               --  returns the number of runs in each hour of
+                                                        the time window
+
+    hotspots(start_time, end_time, top)             --  returns the hours with the most runs in the
+                                                        time window
+
 Schedules: Initializes instance of all schedules for a commcell entity.
 
 Schedules:
@@ -76,6 +104,8 @@ Schedules:
 
     refresh()                       --  refresh the schedules associated with the commcell entity
 
+    get_forecast()                  --  returns the forecast of the schedules of the commcell entity
+
 
 Schedule: Class for performing operations for a specific Schedule.
 
@@ -154,7 +184,8 @@ Schedule:
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
-from datetime import datetime
+from datetime import datetime, timedelta
+from collections import Counter
 import calendar
 from .exception import SDKException
 
@@ -994,6 +1025,311 @@ class SchedulePattern:
         return task_req
 
 
+class ScheduleForecast:
+    """Class for predicting the run times of the schedules, from their patterns.
+
+        Times are epoch seconds in the schedule time zone, as stored in the schedule pattern.
+    """
+
+    _day_seconds = 24 * 60 * 60
+
+    def __init__(self, schedules):
+        """Initialise the ScheduleForecast class instance.
+
+            Args:
+                schedules   (dict)  --  schedules with their patterns, as returned by
+                Schedules._get_schedules()
+
+                    {
+                        schedule_id: {
+                            'schedule_name': schedule_name,
+                            'pattern': schedule pattern json
+                        }
+                    }
+        """
+        self._schedules = schedules
+
+    def __repr__(self):
+        """Representation string for the instance of the ScheduleForecast class."""
+        return "ScheduleForecast class instance for {0} schedules".format(len(self._schedules))
+
+    @staticmethod
+    def _get_days(start_date, end_date):
+        """Returns the calendar details of each day in the date range, computed once and shared by
+            all the schedule patterns.
+
+            Args:
+                start_date  (date)  --  first day of the range
+
+                end_date    (date)  --  last day of the range
+
+            Returns:
+                list - dict with the calendar details of each day in the range
+        """
+        days = []
+        year, month = start_date.year, start_date.month
+
+        while (year, month) <= (end_date.year, end_date.month):
+            _, days_in_month = calendar.monthrange(year, month)
+            month_days = []
+            counts = Counter()
+
+            for day_number in range(1, days_in_month + 1):
+                date = datetime(year, month, day_number)
+                # relative weekday of the schedule pattern, 1 - sunday to 7 - saturday
+                weekday = (date.weekday() + 1) % 7 + 1
+                day_kind = 'weekend_day' if weekday in (1, 7) else 'weekday'
+                counts[weekday] += 1
+                counts[day_kind] += 1
+                month_days.append({
+                    'date': date.date(),
+                    'epoch': calendar.timegm(date.timetuple()),
+                    'day': day_number,
+                    'month': month,
+                    'weekday': weekday,
+                    'weekday_bit': 1 << (weekday - 1),
+                    'day_kind': day_kind,
+                    'weekday_nth': counts[weekday],
+                    'day_kind_nth': counts[day_kind]
+                })
+
+            for day in month_days:
+                day['last_day'] = day['day'] == days_in_month
+                day['weekday_last'] = day['weekday_nth'] == counts[day['weekday']]
+                day['day_kind_last'] = day['day_kind_nth'] == counts[day['day_kind']]
+                if start_date <= day['date'] <= end_date:
+                    days.append(day)
+
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        return days
+
+    @staticmethod
+    def _relative_match(pattern, day):
+        """Checks if the day is the relative day of the month set in the pattern,
+            e.g.; second weekday, last sunday"""
+        relative_day = pattern.get('freq_relative_interval', 1)
+        relative_weekday = pattern.get('freq_interval', 1)
+
+        if relative_weekday == 8:
+            nth, last = day['day'], day['last_day']
+        elif relative_weekday in (9, 10):
+            if day['day_kind'] != SchedulePattern._relative_weekday[relative_weekday]:
+                return False
+            nth, last = day['day_kind_nth'], day['day_kind_last']
+        else:
+            if day['weekday'] != relative_weekday:
+                return False
+            nth, last = day['weekday_nth'], day['weekday_last']
+
+        return last if relative_day == 5 else nth == relative_day
+
+    @staticmethod
+    def _runs_on(pattern, day, start_day):
+        """Checks if the schedule pattern runs on the day.
+
+            Args:
+                pattern     (dict)  --  schedule pattern json
+
+                day         (dict)  --  calendar details of the day, as returned by _get_days()
+
+                start_day   (date)  --  active start date of the pattern
+
+            Returns:
+                bool - True if the pattern runs on the day
+        """
+        freq_type = pattern.get('freq_type')
+        recurrence = pattern.get('freq_recurrence_factor') or 1
+        months = (day['date'].year - start_day.year) * 12 + day['month'] - start_day.month
+
+        if freq_type == 4:
+            runs = (day['date'] - start_day).days % recurrence == 0
+        elif freq_type == 8:
+            week_start = start_day - timedelta(days=(start_day.weekday() + 1) % 7)
+            runs = (bool(pattern.get('freq_interval', 0) & day['weekday_bit'])
+                    and ((day['date'] - week_start).days // 7) % recurrence == 0)
+        elif freq_type == 16:
+            on_day = pattern.get('freq_interval', 1)
+            runs = ((day['day'] == on_day or (day['last_day'] and on_day > day['day']))
+                    and months % recurrence == 0)
+        elif freq_type == 32:
+            runs = ScheduleForecast._relative_match(pattern, day) and months % recurrence == 0
+        elif freq_type == 64:
+            on_day = pattern.get('freq_interval', 1)
+            runs = (day['month'] == recurrence
+                    and (day['day'] == on_day or (day['last_day'] and on_day > day['day'])))
+        elif freq_type == 128:
+            runs = day['month'] == recurrence and ScheduleForecast._relative_match(pattern, day)
+        elif freq_type == 4096:
+            runs = True
+        else:
+            return False
+
+        if not runs:
+            return False
+
+        for repeat_pattern in pattern.get('repeatPattern', []):
+            if repeat_pattern.get('exception') and repeat_pattern.get('onDayNumber', 0) & (1 << (day['day'] - 1)):
+                return False
+
+        return True
+
+    @staticmethod
+    def _day_times(pattern):
+        """Returns the run times of the schedule pattern in a day, as seconds from the start of the day.
+
+            Args:
+                pattern     (dict)  --  schedule pattern json
+
+            Returns:
+                list - seconds from the start of the day of each run
+        """
+        start_time = pattern.get('active_start_time', 0)
+
+        if pattern.get('freq_type') == 4096:
+            # continuous schedules start the next job the interval after the previous job completes
+            interval = (pattern.get('freq_interval') or 30) * 60
+            return list(range(0, ScheduleForecast._day_seconds, interval))
+
+        interval = pattern.get('freq_subday_interval', 0)
+        if not interval:
+            return [start_time]
+
+        end_time = pattern.get('active_end_time') or ScheduleForecast._day_seconds - 1
+        return list(range(start_time, end_time + 1, interval))
+
+    @staticmethod
+    def _expand(pattern, start_time, end_time, days=None):
+        """Returns the run times of the schedule pattern in the time window.
+
+            Args:
+                pattern     (dict)  --  schedule pattern json
+
+                start_time  (int)   --  start of the window, epoch seconds
+
+                end_time    (int)   --  end of the window, epoch seconds
+
+                days        (list)  --  calendar details of the days of the window, as returned by
+                _get_days(), to be shared by the patterns
+
+                    default: None
+
+            Returns:
+                list - epoch seconds of each run in the window
+        """
+        active_start = pattern.get('active_start_date', 0)
+        active_end = pattern.get('active_end_date', 0)
+        max_runs = pattern.get('active_end_occurence', 0)
+
+        if pattern.get('freq_type') == 1:
+            run_time = active_start + pattern.get('active_start_time', 0)
+            return [run_time] if start_time <= run_time < end_time else []
+
+        # runs before the window count against the end occurrence, so the runs are counted from the start
+        window_start = active_start if max_runs else max(start_time, active_start)
+        window_end = min(end_time, active_end + ScheduleForecast._day_seconds) if active_end else end_time
+        if window_start >= window_end:
+            return []
+
+        start_day = datetime.utcfromtimestamp(active_start).date()
+        first_day = datetime.utcfromtimestamp(window_start).date()
+        last_day = datetime.utcfromtimestamp(window_end - 1).date()
+
+        if days is None or not days or days[0]['date'] > first_day or days[-1]['date'] < last_day:
+            days = ScheduleForecast._get_days(first_day, last_day)
+
+        day_times = ScheduleForecast._day_times(pattern)
+        runs = []
+
+        for day in days:
+            if day['date'] < first_day or day['date'] > last_day:
+                continue
+
+            if not ScheduleForecast._runs_on(pattern, day, start_day):
+                continue
+
+            runs.extend(
+                day['epoch'] + day_time for day_time in day_times
+                if window_start <= day['epoch'] + day_time < window_end
+            )
+
+        if max_runs:
+            runs = runs[:max_runs]
+
+        return [run_time for run_time in runs if run_time >= start_time]
+
+    def occurrences(self, start_time, end_time):
+        """Returns the run times of all the schedules in the time window.
+
+            Args:
+                start_time  (int)   --  start of the window, epoch seconds
+
+                end_time    (int)   --  end of the window, epoch seconds
+
+            Returns:
+                list - (run time, schedule id) of each run in the window, sorted by the run time
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid
+        """
+        if not (isinstance(start_time, int) and isinstance(end_time, int)):
+            raise SDKException('Schedules', '102')
+
+        if start_time >= end_time:
+            return []
+
+        days = self._get_days(
+            datetime.utcfromtimestamp(start_time).date(), datetime.utcfromtimestamp(end_time - 1).date()
+        )
+        runs = []
+
+        for schedule_id, schedule in self._schedules.items():
+            runs.extend(
+                (run_time, schedule_id)
+                for run_time in self._expand(schedule.get('pattern', {}), start_time, end_time, days)
+            )
+
+        return sorted(runs)
+
+    def hourly_load(self, start_time, end_time):
+        """Returns the number of schedule runs in each hour of the time window.
+
+            Args:
+                start_time  (int)   --  start of the window, epoch seconds
+
+                end_time    (int)   --  end of the window, epoch seconds
+
+            Returns:
+                dict - number of runs for the epoch seconds of the start of each hour with a run
+
+                    {
+                        1700002800: 12,
+                        1700006400: 48
+                    }
+        """
+        return dict(sorted(Counter(
+            run_time - run_time % 3600 for run_time, _ in self.occurrences(start_time, end_time)
+        ).items()))
+
+    def hotspots(self, start_time, end_time, top=10):
+        """Returns the hours with the most schedule runs in the time window.
+
+            Args:
+                start_time  (int)   --  start of the window, epoch seconds
+
+                end_time    (int)   --  end of the window, epoch seconds
+
+                top         (int)   --  number of hours to return
+
+                    default: 10
+
+            Returns:
+                list - (epoch seconds of the start of the hour, number of runs), busiest hour first
+        """
+        return Counter(self.hourly_load(start_time, end_time)).most_common(top)
+
+
 class Schedules:
     """Class for getting the schedules of a commcell entity."""
 
@@ -1149,13 +1485,17 @@ class Schedules:
                          "schedule_id": {
                                 'task_id': task_id,
                                 'schedule_name': schedule_name,
-                                'description': description
+                                'description': description,
+                                'task_flags': task_flags,
+                                'pattern': schedule pattern json
                             }
 
                          "schedule_id": {
                                 'task_id': task_id,
                                 'schedule_name': schedule_name,
-                                'description': description
+                                'description': description,
+                                'task_flags': task_flags,
+                                'pattern': schedule pattern json
                             }
                     }
 
@@ -1191,7 +1531,8 @@ class Schedules:
                                 'task_id': task_id,
                                 'schedule_name': subtask_name,
                                 'description': description,
-                                'task_flags': task_flags
+                                'task_flags': task_flags,
+                                'pattern': subtask.get('pattern', {})
                             }
 
                 return subtask_dict
@@ -1378,6 +1719,26 @@ class Schedules:
         """Refresh the Schedules associated with the Client / Agent / Backupset / Subclient."""
         self.schedules = self._get_schedules()
 
+    def get_forecast(self, include_disabled=False):
+        """Returns the forecast of the schedules associated with the commcell entity, built from the
+            schedule patterns already fetched, without a request for each schedule.
+
+            Args:
+                include_disabled    (bool)  --  whether to forecast the disabled schedules as well
+
+                    default: False
+
+            Returns:
+                object - instance of the ScheduleForecast class for the schedules
+        """
+        schedules = {
+            schedule_id: schedule for schedule_id, schedule in self.schedules.items()
+            if include_disabled or not (
+                isinstance(schedule['task_flags'], dict) and schedule['task_flags'].get('disabled')
+            )
+        }
+        return ScheduleForecast(schedules)
+
 
 class Schedule:
     """Class for performing operations for a specific Schedule."""
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for auditing the effective permissions of the users on the commcell.
+
+SecuritySnapshot is the only class defined in this file.
+
+SecuritySnapshot:   Class for loading the users, user groups, roles and security associations of
+the commcell in one pass, and answering the effective permission queries from an in-memory index
+
+SecuritySnapshot:
+    __init__(commcell_object,
+             max_concurrency)   --  initialize object of the SecuritySnapshot class
+
+    __repr__()                  --  returns the string representation of the snapshot
+
+    _get_properties()           --  returns the properties of the user, user group or role
+
+    _get_external_group_name()  --  returns the domain qualified name of the external user group
+
+    _get_entity_key()           --  returns the type and name of the entity of an association
+
+    _parse_role()               --  adds the permissions of the role to the snapshot
+
+    _parse_associations()       --  adds the security associations of the user or user group
+
+    _build_index()              --  builds the index of the grants by entity and by user / user group
+
+    load()                      --  loads the users, user groups and roles of the commcell
+
+    save()                      --  saves the snapshot to the file
+
+    load_from_file()            --  loads the snapshot from the file
+
+    get_user_groups()           --  returns the user groups the user is a member of
+
+    _get_user_permissions()     --  returns the permissions of the user on each entity and the commcell
+
+    get_effective_permissions() --  returns the permissions of the user on each entity
+
+    has_permission()            --  checks if the user has the permission on the entity
+
+    get_users_with_permission() --  returns the users having the permission on the entity
+
+Attributes
+----------
+
+    **load_time**   --  returns the time the snapshot was loaded from the commcell
+
+Snapshot file
+=============
+
+    The snapshot is a gzip compressed JSON file, with the names in lower case
+
+        {
+            'time': 1700000000,
+
+            'roles': {
+                'role1': ['restore', 'browse']
+            },
+
+            'members': {
+                'user_group1': ['user1']
+            },
+
+            'grants': [
+                ['usergroup', 'user_group1', 'clientName', 'client1', 'role1', []]
+            ]
+        }
+
+Usage
+=====
+
+    >>> snapshot = commcell.get_security_snapshot()
+
+    >>> snapshot.has_permission('user1', 'restore', 'clientName', 'client1')
+
+    >>> snapshot.get_users_with_permission('restore', 'clientName', 'client1')
+
+    >>> snapshot.save('security_snapshot.json.gz')
+
+**Note** Permissions on the commcell apply to all the entities. Permissions on a client group
+are returned for the client group only, and not for each of the clients in it.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import gzip
+import json
+import os
+import time
+
+from ..bulk_operations import BulkOperationRunner
+from ..exception import SDKException
+
+
+class SecuritySnapshot(object):
+    """Class for auditing the effective permissions of the users on the commcell."""
+
+    # entity types whose permissions apply to all the entities of the commcell
+    COMMCELL_ENTITY_TYPES = ('commCellName',)
+
+    def __init__(self, commcell_object, max_concurrency=10):
+        """Initialize object of the SecuritySnapshot class.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                max_concurrency     (int)       --  maximum number of properties fetched at a time
+
+                    default: 10
+
+            Raises:
+                SDKException:
+                    if type or value of the input is not valid
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise SDKException('Security', '101')
+
+        self._commcell_object = commcell_object
+        self._max_concurrency = max_concurrency
+        self._load_time = None
+
+        self._roles = {}
+        self._members = {}
+        self._grants = []
+
+        self._user_groups = {}
+        self._entity_index = {}
+        self._principal_index = {}
+        self._effective_permissions = {}
+
+    def __repr__(self):
+        """Representation string for the instance of the SecuritySnapshot class."""
+        return "SecuritySnapshot class instance for Commcell: '{0}'".format(
+            self._commcell_object.commserv_name
+        )
+
+    def _get_properties(self, item):
+        """Returns the properties of the user, user group or role.
+
+            Args:
+                item    (tuple) --  (kind of the entity, name, id), where kind is one of
+                user / usergroup / role
+
+            Returns:
+                dict    -   properties of the user, user group or role
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        kind, _, entity_id = item
+        service, response_key = {
+            'user': ('USER', 'users'),
+            'usergroup': ('USERGROUP', 'userGroups'),
+            'role': ('ROLE', 'roleProperties')
+        }[kind]
+
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'GET', self._commcell_object._services[service] % entity_id
+        )
+
+        if flag:
+            if response.json() and response.json().get(response_key):
+                return response.json()[response_key][0]
+            raise SDKException('Response', '102')
+
+        response_string = self._commcell_object._update_response_(response.text)
+        raise SDKException('Response', '101', response_string)
+
+    @staticmethod
+    def _get_external_group_name(user_group):
+        """Returns the name of the external user group as domain\\group, in lower case, the same
+            as the name of the user group in the user groups of the commcell."""
+        if user_group.get('providerDomainName'):
+            return '{0}\\{1}'.format(user_group['providerDomainName'], user_group['externalGroupName']).lower()
+
+        return user_group['externalGroupName'].lower()
+
+    @staticmethod
+    def _get_entity_key(entity):
+        """Returns the type and name of the entity of a security association, e.g.;
+            ('clientName', 'client1'), or None if the entity is not named."""
+        for key, value in entity.items():
+            if not key.endswith('Name') or key in ('displayName', 'providerDomainName'):
+                continue
+
+            if not isinstance(value, str) or not value:
+                continue
+
+            if key == 'externalGroupName':
+                return key, SecuritySnapshot._get_external_group_name(entity)
+
+            return key, value.lower()
+
+        return None
+
+    def _parse_role(self, role_properties):
+        """Adds the permissions and categories of the role to the snapshot."""
+        role_name = role_properties.get('role', {}).get('roleName', '').lower()
+        permissions = set()
+
+        for permission in role_properties.get('categoryPermission', {}).get('categoriesPermissionList', []):
+            if 'permissionName' in permission:
+                permissions.add(permission['permissionName'].lower())
+            elif 'categoryName' in permission:
+                permissions.add(permission['categoryName'].lower())
+
+        self._roles[role_name] = sorted(permissions)
+
+    def _parse_associations(self, kind, name, properties):
+        """Adds the security associations of the user or user group to the snapshot.
+
+            Args:
+                kind        (str)   --  user / usergroup
+
+                name        (str)   --  name of the user or user group
+
+                properties  (dict)  --  properties of the user or user group
+        """
+        for association in properties.get('securityAssociations', {}).get('associations', []):
+            association_properties = association.get('properties', {})
+            role_name = association_properties.get('role', {}).get('roleName')
+            permissions = []
+
+            for key in ('categoryPermission', 'permissions'):
+                permission_list = association_properties.get(key, [])
+
+                if isinstance(permission_list, dict):
+                    permission_list = permission_list.get('categoriesPermissionList', [])
+
+                for permission in permission_list:
+                    permission_name = permission.get('permissionName') or permission.get('categoryName')
+
+                    if permission_name:
+                        permissions.append(permission_name.lower())
+
+            for entity in association.get('entities', {}).get('entity', []):
+                entity_key = self._get_entity_key(entity)
+
+                if entity_key is not None:
+                    self._grants.append([
+                        kind,
+                        name,
+                        entity_key[0],
+                        entity_key[1],
+                        role_name.lower() if role_name else None,
+                        permissions
+                    ])
+
+    def _build_index(self):
+        """Builds the index of the permissions granted on each entity to each user and user
+            group, and the user groups of each user."""
+        self._user_groups = {}
+        self._entity_index = {}
+        self._principal_index = {}
+        self._effective_permissions = {}
+
+        for user_group, users in self._members.items():
+            for user in users:
+                self._user_groups.setdefault(user, set()).add(user_group)
+
+        for kind, name, entity_type, entity_name, role_name, permissions in self._grants:
+            granted = set(permissions)
+
+            if role_name is not None:
+                granted.update(self._roles.get(role_name, []))
+
+            entity_key = (entity_type, entity_name)
+            principal = (kind, name)
+
+            self._entity_index.setdefault(entity_key, {}).setdefault(principal, set()).update(granted)
+            self._principal_index.setdefault(principal, {}).setdefault(entity_key, set()).update(granted)
+
+    def load(self):
+        """Loads the users, user groups and roles of the commcell, fetching their properties
+            concurrently, and builds the index.
+
+            Raises:
+                SDKException:
+                    if failed to get the properties of any of the users, user groups or roles
+        """
+        items = []
+        items.extend(('role', name, role_id) for name, role_id in self._commcell_object.roles.all_roles.items())
+        items.extend(('user', name, user_id) for name, user_id in self._commcell_object.users.all_users.items())
+        items.extend(
+            ('usergroup', name, user_group_id)
+            for name, user_group_id in self._commcell_object.user_groups.all_user_groups.items()
+        )
+
+        self._roles = {}
+        self._members = {}
+        self._grants = []
+        failed = []
+
+        runner = BulkOperationRunner(max_concurrency=self._max_concurrency)
+
+        for item, properties in runner.run(self._get_properties, items):
+            kind, name, _ = item
+
+            if isinstance(properties, Exception):
+                failed.append('{0} {1}: {2}'.format(kind, name, properties))
+                continue
+
+            if kind == 'role':
+                self._parse_role(properties)
+                continue
+
+            self._parse_associations(kind, name.lower(), properties)
+
+            if kind == 'user':
+                for user_group in properties.get('associatedUserGroups', []):
+                    self._members.setdefault(user_group['userGroupName'].lower(), set()).add(name.lower())
+
+                for user_group in properties.get('associatedExternalUserGroups', []):
+                    self._members.setdefault(
+                        self._get_external_group_name(user_group), set()
+                    ).add(name.lower())
+            else:
+                for user in properties.get('users', []):
+                    self._members.setdefault(name.lower(), set()).add(user['userName'].lower())
+
+        if failed:
+            raise SDKException(
+                'Security', '102', 'Failed to load the security snapshot\n{0}'.format('\n'.join(failed))
+            )
+
+        self._load_time = int(time.time())
+        self._build_index()
+
+    def save(self, snapshot_file):
+        """Saves the snapshot to the gzip compressed JSON file.
+
+            Args:
+                snapshot_file   (str)   --  path of the file to save the snapshot to
+        """
+        temp_file = '{0}.tmp'.format(snapshot_file)
+
+        with gzip.open(temp_file, 'wt', encoding='utf-8') as file_object:
+            json.dump({
+                'time': self._load_time,
+                'roles': self._roles,
+                'members': {user_group: sorted(users) for user_group, users in self._members.items()},
+                'grants': self._grants
+            }, file_object, separators=(',', ':'))
+
+        os.replace(temp_file, snapshot_file)
+
+    def load_from_file(self, snapshot_file):
+        """Loads the snapshot saved to the file, and builds the index.
+
+            Args:
+                snapshot_file   (str)   --  path of the snapshot file
+
+            Raises:
+                SDKException:
+                    if the snapshot file is not valid
+        """
+        try:
+            with gzip.open(snapshot_file, 'rt', encoding='utf-8') as file_object:
+                snapshot = json.load(file_object)
+        except (OSError, ValueError) as excp:
+            raise SDKException('Security', '102', 'Invalid security snapshot file: {0}'.format(excp))
+
+        self._load_time = snapshot.get('time')
+        self._roles = snapshot.get('roles', {})
+        self._members = {user_group: set(users) for user_group, users in snapshot.get('members', {}).items()}
+        self._grants = snapshot.get('grants', [])
+        self._build_index()
+
+    def get_user_groups(self, user_name):
+        """Returns the user groups the user is a member of.
+
+            Args:
+                user_name   (str)   --  name of the user
+
+            Returns:
+                set     -   names of the user groups
+        """
+        return set(self._user_groups.get(user_name.lower(), set()))
+
+    def _get_user_permissions(self, user_name):
+        """Returns the permissions granted to the user, directly and through its user groups,
+            on each entity, and on the commcell."""
+        user_name = user_name.lower()
+
+        if user_name in self._effective_permissions:
+            return self._effective_permissions[user_name]
+
+        entity_permissions = {}
+        commcell_permissions = set()
+        principals = [('user', user_name)]
+        principals.extend(('usergroup', user_group) for user_group in self._user_groups.get(user_name, ()))
+
+        for principal in principals:
+            for entity_key, permissions in self._principal_index.get(principal, {}).items():
+                entity_permissions.setdefault(entity_key, set()).update(permissions)
+
+                if entity_key[0] in self.COMMCELL_ENTITY_TYPES:
+                    commcell_permissions.update(permissions)
+
+        self._effective_permissions[user_name] = (entity_permissions, commcell_permissions)
+        return self._effective_permissions[user_name]
+
+    def get_effective_permissions(self, user_name):
+        """Returns the permissions of the user on each entity, granted directly to the user and
+            through the user groups it is a member of.
+
+            Args:
+                user_name   (str)   --  name of the user
+
+            Returns:
+                dict    -   (entity type, entity name) mapped to the set of permissions
+
+                    {
+                        ('clientName', 'client1'): {'restore', 'browse'}
+                    }
+        """
+        entity_permissions, _ = self._get_user_permissions(user_name)
+        return {entity_key: set(permissions) for entity_key, permissions in entity_permissions.items()}
+
+    def has_permission(self, user_name, permission, entity_type, entity_name):
+        """Checks if the user has the permission on the entity, or on the commcell.
+
+            Args:
+                user_name   (str)   --  name of the user
+
+                permission  (str)   --  name of the permission, e.g.; Restore
+
+                entity_type (str)   --  type of the entity, as in the security associations,
+                e.g.; clientName, clientGroupName, planName
+
+                entity_name (str)   --  name of the entity
+
+            Returns:
+                bool    -   True if the user has the permission on the entity
+        """
+        entity_permissions, commcell_permissions = self._get_user_permissions(user_name)
+        permission = permission.lower()
+
+        if permission in commcell_permissions:
+            return True
+
+        return permission in entity_permissions.get((entity_type, entity_name.lower()), ())
+
+    def get_users_with_permission(self, permission, entity_type, entity_name):
+        """Returns the users having the permission on the entity, or on the commcell, directly
+            or through the user groups they are members of.
+
+            Args:
+                permission  (str)   --  name of the permission, e.g.; Restore
+
+                entity_type (str)   --  type of the entity, as in the security associations,
+                e.g.; clientName, clientGroupName, planName
+
+                entity_name (str)   --  name of the entity
+
+            Returns:
+                set     -   names of the users
+        """
+        permission = permission.lower()
+        entity_keys = [(entity_type, entity_name.lower())]
+        entity_keys.extend(
+            entity_key for entity_key in self._entity_index if entity_key[0] in self.COMMCELL_ENTITY_TYPES
+        )
+        users = set()
+
+        for entity_key in entity_keys:
+            for (kind, name), permissions in self._entity_index.get(entity_key, {}).items():
+                if permission not in permissions:
+                    continue
+
+                if kind == 'user':
+                    users.add(name)
+                else:
+                    users.update(self._members.get(name, ()))
+
+        return users
+
+    @property
+    def load_time(self):
+        """Returns the time the snapshot was loaded from the commcell."""
+        return self._load_time
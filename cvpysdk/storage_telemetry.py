@@ -0,0 +1,566 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Main file for sampling the capacity of the storage of the commcell over time.
+
+CapacitySeries and StorageCapacitySampler are the classes defined in this file.
+
+CapacitySeries:         Fixed-size ring buffer of the capacity and free space samples of a
+storage entity, with the growth rate and time to full projections
+
+StorageCapacitySampler: Class for sampling the capacity, free space and health of all the
+storage pools, disk libraries, mount paths and media agents at an interval
+
+A StorageCapacitySampler instance for the commcell is returned by `commcell.get_capacity_sampler()`.
+
+CapacitySeries:
+    __init__(size)              --  initialize object of the CapacitySeries class
+
+    __repr__()                  --  returns the string representation of the series
+
+    __len__()                   --  returns the number of samples in the series
+
+    append()                    --  adds the sample, overwriting the oldest one if the series is full
+
+    samples()                   --  returns the samples, from the oldest to the latest
+
+    growth_rate()               --  returns the growth of the used space per second
+
+    time_to_full()              --  returns the seconds left before the free space runs out
+
+Attributes
+----------
+
+    **latest**      --  returns the latest sample of the series
+
+StorageCapacitySampler:
+    __init__(commcell_object,
+             interval,
+             history,
+             max_concurrency)   --  initialize object of the StorageCapacitySampler class
+
+    __repr__()                  --  returns the string representation of the sampler
+
+    _get_number()               --  returns the first of the keys present in the dict, as a float
+
+    _get_storage_pool_samples() --  returns the capacity and status of all the storage pools
+
+    _get_library_samples()      --  returns the capacity of all the disk libraries and mount paths
+
+    _get_media_agent_samples()  --  returns the status of all the media agents
+
+    sample()                    --  samples all the storage entities once, and adds the samples to the series
+
+    run()                       --  samples the storage entities at the interval, and yields the samples
+
+    get_series()                --  returns the series of samples of the storage entity
+
+    get_projections()           --  returns the latest capacity, growth rate and time to full
+    of all the storage entities
+
+Sample record
+=============
+
+    Each sample maps the type and name of the storage entity to its capacity, free space and
+    health, with the capacity and free space in MB, as reported by the server
+
+        {
+            ('storage_pool', 'pool1'): {
+                'capacity': 1048576.0,
+
+                'free': 524288.0,
+
+                'health': 'Online'
+            },
+
+            ('mount_path', '[ma1] /mnt/disk1'): {...}
+        }
+
+Usage
+=====
+
+    >>> sampler = commcell.get_capacity_sampler(interval=600, history=144)
+
+    >>> for sample in sampler.run(max_samples=6):
+    ...     pass
+
+    >>> sampler.get_projections()[('storage_pool', 'pool1')]['time_to_full']
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import re
+import time
+
+from array import array
+
+from .bulk_operations import BulkOperationRunner
+from .exception import SDKException
+
+
+class CapacitySeries(object):
+    """Fixed-size ring buffer of the capacity and free space samples of a storage entity."""
+
+    def __init__(self, size=288):
+        """Initialize object of the CapacitySeries class.
+
+            Args:
+                size    (int)   --  maximum number of samples kept, older samples are overwritten
+
+                    default: 288    (one day of samples taken every 5 minutes)
+
+            Raises:
+                SDKException:
+                    if size is not a positive integer
+        """
+        if not isinstance(size, int) or size < 1:
+            raise SDKException('CapacitySampler', '101')
+
+        self._size = size
+        self._times = array('d', [0.0]) * size
+        self._capacity = array('d', [0.0]) * size
+        self._free = array('d', [0.0]) * size
+        self._start = 0
+        self._count = 0
+
+    def __repr__(self):
+        """Representation string for the instance of the CapacitySeries class."""
+        return "CapacitySeries class instance with {0} of {1} samples".format(self._count, self._size)
+
+    def __len__(self):
+        """Returns the number of samples in the series."""
+        return self._count
+
+    def append(self, timestamp, capacity, free):
+        """Adds the sample to the series, overwriting the oldest sample if the series is full.
+
+            Args:
+                timestamp   (float) --  time of the sample
+
+                capacity    (float) --  total capacity of the storage entity
+
+                free        (float) --  free space of the storage entity
+        """
+        index = (self._start + self._count) % self._size
+
+        self._times[index] = timestamp
+        self._capacity[index] = capacity
+        self._free[index] = free
+
+        if self._count < self._size:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self._size
+
+    def samples(self):
+        """Returns the samples of the series, from the oldest to the latest.
+
+            Returns:
+                list    -   list of (timestamp, capacity, free) tuples
+        """
+        indexes = ((self._start + offset) % self._size for offset in range(self._count))
+        return [(self._times[index], self._capacity[index], self._free[index]) for index in indexes]
+
+    def growth_rate(self):
+        """Returns the growth of the used space per second, as the least squares slope of the
+            used space over all the samples of the series.
+
+            Returns:
+                float   -   growth of the used space per second, negative if the used space shrinks
+
+                None    -   if the series has less than two samples, or all of them at the same time
+        """
+        if self._count < 2:
+            return None
+
+        samples = self.samples()
+        mean_time = sum(sample[0] for sample in samples) / self._count
+        mean_used = sum(sample[1] - sample[2] for sample in samples) / self._count
+
+        covariance = 0.0
+        variance = 0.0
+
+        for timestamp, capacity, free in samples:
+            covariance += (timestamp - mean_time) * (capacity - free - mean_used)
+            variance += (timestamp - mean_time) ** 2
+
+        if not variance:
+            return None
+
+        return covariance / variance
+
+    def time_to_full(self):
+        """Returns the seconds left before the free space runs out, at the current growth rate.
+
+            Returns:
+                float   -   seconds left before the storage entity is full, 0 if it is full already
+
+                None    -   if the used space is not growing, or there are not enough samples
+        """
+        latest = self.latest
+
+        if latest is None:
+            return None
+
+        if latest[2] <= 0:
+            return 0.0
+
+        growth_rate = self.growth_rate()
+
+        if not growth_rate or growth_rate <= 0:
+            return None
+
+        return latest[2] / growth_rate
+
+    @property
+    def latest(self):
+        """Returns the latest (timestamp, capacity, free) sample, or None if the series is empty."""
+        if not self._count:
+            return None
+
+        index = (self._start + self._count - 1) % self._size
+        return self._times[index], self._capacity[index], self._free[index]
+
+
+class StorageCapacitySampler(object):
+    """Class for sampling the capacity, free space and health of the storage of the commcell."""
+
+    def __init__(self, commcell_object, interval=300, history=288, max_concurrency=4):
+        """Initialize object of the StorageCapacitySampler class.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                interval            (float)     --  time in seconds between two samples
+
+                    default: 300
+
+                history             (int)       --  number of samples kept for each storage entity
+
+                    default: 288
+
+                max_concurrency     (int)       --  maximum number of library properties fetched at a time
+
+                    default: 4
+
+            Raises:
+                SDKException:
+                    if type or value of the inputs is not valid
+        """
+        if not isinstance(interval, (int, float)) or interval < 0:
+            raise SDKException('CapacitySampler', '101')
+
+        if not isinstance(history, int) or history < 1:
+            raise SDKException('CapacitySampler', '101')
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise SDKException('CapacitySampler', '101')
+
+        self._commcell_object = commcell_object
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._services = commcell_object._services
+        self._update_response_ = commcell_object._update_response_
+
+        self._interval = interval
+        self._history = history
+        self._max_concurrency = max_concurrency
+
+        self._series = {}
+        self._health = {}
+
+    def __repr__(self):
+        """Representation string for the instance of the StorageCapacitySampler class."""
+        return "StorageCapacitySampler class instance for Commcell: '{0}'".format(
+            self._commcell_object.commserv_name
+        )
+
+    @staticmethod
+    def _get_number(dictionary, *keys):
+        """Returns the value of the first of the keys present in the dict, as a float, or None."""
+        for key in keys:
+            if dictionary.get(key) is not None:
+                try:
+                    return float(dictionary[key])
+                except (TypeError, ValueError):
+                    return None
+
+        return None
+
+    def _get_storage_pool_samples(self):
+        """Returns the capacity, free space and status of all the storage pools, from the list of
+            the storage pools.
+
+            Returns:
+                dict    -   ('storage_pool', name) mapped to the sample of the storage pool
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        headers = self._commcell_object._headers.copy()
+        headers['Accept'] = 'application/json'
+
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', self._services['STORAGE_POOL'], headers=headers
+        )
+
+        if not flag:
+            response_string = self._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+        storage_pool_list = (response.json() or {}).get('storagePoolList') or []
+
+        if not isinstance(storage_pool_list, list):
+            storage_pool_list = [storage_pool_list]
+
+        samples = {}
+
+        for pool in storage_pool_list:
+            name = pool.get('storagePoolEntity', {}).get('storagePoolName', '').lower()
+            samples[('storage_pool', name)] = {
+                'capacity': self._get_number(pool, 'totalCapacity'),
+                'free': self._get_number(pool, 'totalFreeSpace'),
+                'health': pool.get('status')
+            }
+
+        return samples
+
+    def _get_library_properties(self, library_id):
+        """Returns the properties of the disk library, with the list of its mount paths.
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', self._services['GET_LIBRARY_PROPERTIES'] % library_id
+        )
+
+        if not flag:
+            response_string = self._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+        if not (response.json() and 'libraryInfo' in response.json()):
+            raise SDKException('Response', '102')
+
+        return response.json()['libraryInfo']
+
+    def _get_library_samples(self):
+        """Returns the capacity and free space of all the disk libraries and their mount paths,
+            fetching the properties of the libraries concurrently. The capacity of a library and
+            of a media agent is the sum of the capacity of their mount paths, and None if they
+            have no mount paths.
+
+            Returns:
+                dict    -   (entity type, name) mapped to the sample of the library, mount path
+                or media agent
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request('GET', self._services['LIBRARY'])
+
+        if not flag:
+            response_string = self._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+        libraries = {
+            str(library['entityInfo']['id']): library['entityInfo']['name'].lower()
+            for library in (response.json() or {}).get('response', [])
+        }
+
+        samples = {}
+        runner = BulkOperationRunner(max_concurrency=self._max_concurrency)
+
+        for library_id, properties in runner.run(self._get_library_properties, list(libraries)):
+            if isinstance(properties, Exception):
+                samples[('library', libraries[library_id])] = {
+                    'capacity': None,
+                    'free': None,
+                    'health': str(properties)
+                }
+                continue
+
+            # capacity stays None for a library without mount paths, instead of being reported full
+            library_sample = {'capacity': None, 'free': None, 'health': 'Online'}
+
+            for mount_path in properties.get('MountPathList', []):
+                summary = mount_path.get('mountPathSummary', {})
+                mount_path_name = mount_path.get('mountPathName', '')
+                is_offline = bool(summary.get('isOffline') or mount_path.get('isOffline'))
+                mount_path_sample = {
+                    'capacity': self._get_number(summary, 'totalSpace', 'totalCapacity'),
+                    'free': self._get_number(summary, 'freeSpace', 'totalFreeSpace'),
+                    'health': 'Offline' if is_offline else 'Online'
+                }
+                samples[('mount_path', mount_path_name.lower())] = mount_path_sample
+
+                if is_offline:
+                    library_sample['health'] = 'Degraded'
+
+                media_agent = re.match(r'\[(.+?)\]', mount_path_name)
+                owners = [library_sample]
+
+                if media_agent:
+                    owners.append(samples.setdefault(
+                        ('media_agent', media_agent.group(1).lower()),
+                        {'capacity': None, 'free': None, 'health': None}
+                    ))
+
+                for owner in owners:
+                    for key in ('capacity', 'free'):
+                        if mount_path_sample[key] is not None:
+                            owner[key] = (owner[key] or 0.0) + mount_path_sample[key]
+
+            samples[('library', libraries[library_id])] = library_sample
+
+        return samples
+
+    def _get_media_agent_samples(self):
+        """Returns the status of all the media agents, from the list of the media agents.
+
+            Returns:
+                dict    -   ('media_agent', name) mapped to the status of the media agent
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request('GET', self._services['GET_MEDIA_AGENTS'])
+
+        if not flag:
+            response_string = self._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+        samples = {}
+
+        for media_agent in (response.json() or {}).get('mediaAgentList', []):
+            name = media_agent['mediaAgent']['mediaAgentName'].lower()
+            samples[('media_agent', name)] = 'Online' if media_agent.get('status') == 1 else 'Offline'
+
+        return samples
+
+    def sample(self):
+        """Samples all the storage entities once, and adds the samples to their series.
+
+            Returns:
+                dict    -   (entity type, name) mapped to the sample of the storage entity
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        timestamp = time.time()
+        samples = self._get_storage_pool_samples()
+        samples.update(self._get_library_samples())
+
+        for media_agent, health in self._get_media_agent_samples().items():
+            samples.setdefault(media_agent, {'capacity': None, 'free': None, 'health': None})['health'] = health
+
+        for entity, entity_sample in samples.items():
+            self._health[entity] = entity_sample['health']
+
+            if entity_sample['capacity'] is None or entity_sample['free'] is None:
+                continue
+
+            if entity not in self._series:
+                self._series[entity] = CapacitySeries(self._history)
+
+            self._series[entity].append(timestamp, entity_sample['capacity'], entity_sample['free'])
+
+        return samples
+
+    def run(self, max_samples=None):
+        """Samples the storage entities at the interval, and yields the samples.
+
+            Args:
+                max_samples     (int)   --  number of samples after which to stop sampling
+
+                    default: None   (sample until the caller stops iterating)
+
+            Yields:
+                dict    -   (entity type, name) mapped to the sample of the storage entity
+        """
+        samples = 0
+
+        while max_samples is None or samples < max_samples:
+            start_time = time.monotonic()
+
+            yield self.sample()
+
+            samples += 1
+
+            if max_samples is not None and samples >= max_samples:
+                break
+
+            time.sleep(max(0, self._interval - (time.monotonic() - start_time)))
+
+    def get_series(self, entity_type, name):
+        """Returns the series of samples of the storage entity.
+
+            Args:
+                entity_type     (str)   --  storage_pool / library / mount_path / media_agent
+
+                name            (str)   --  name of the storage entity
+
+            Returns:
+                object  -   instance of the CapacitySeries class, None if the entity is not sampled
+        """
+        return self._series.get((entity_type, name.lower()))
+
+    def get_projections(self):
+        """Returns the latest capacity and free space, growth rate and time to full of all the
+            sampled storage entities.
+
+            Returns:
+                dict    -   (entity type, name) mapped to the projection of the storage entity
+
+                    {
+                        ('storage_pool', 'pool1'): {
+                            'capacity': 1048576.0,
+
+                            'free': 524288.0,
+
+                            'health': 'Online',
+
+                            'growth_rate': 0.5,         # MB per second
+
+                            'time_to_full': 1048576.0   # seconds, None if not growing
+                        }
+                    }
+        """
+        projections = {}
+
+        for entity, health in self._health.items():
+            series = self._series.get(entity)
+            latest = series.latest if series else None
+
+            projections[entity] = {
+                'capacity': latest[1] if latest else None,
+                'free': latest[2] if latest else None,
+                'health': health,
+                'growth_rate': series.growth_rate() if series else None,
+                'time_to_full': series.time_to_full() if series else None
+            }
+
+        return projections
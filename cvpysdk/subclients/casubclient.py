@@ -27,7 +27,9 @@ Note: GoogleSubclient class is used for OneDrive subclient too.
 
 CloudAppsSubclient:
 
-    __new__()   --  Method to create object based on specific cloud apps instance type
+    __new__()               --  Method to create object based on specific cloud apps instance type
+
+    get_discovery_pager()   --  Returns the pager for the cloud discovery of the client
 
 """
 
@@ -35,6 +37,7 @@ from __future__ import unicode_literals
 
 from ..subclient import Subclient
 from ..exception import SDKException
+from .cloudapps.discovery_pager import CloudDiscoveryPager
 
 
 class CloudAppsSubclient(Subclient):
@@ -83,3 +86,28 @@ class CloudAppsSubclient(Subclient):
             raise SDKException('Subclient', '112')
 
         return object.__new__(instance_type)
+
+    def get_discovery_pager(self, discover_type=None, page_size=500, max_concurrency=4):
+        """Returns the pager for the discovered users, groups, sites or folders of the client,
+            which fetches the pages concurrently, and saves a snapshot to compute the changes.
+
+            Args:
+                discover_type   (int)   --  eDiscover type of the records, e.g.;
+                8 - Users, 5 - Groups, 25 - Shared Drives
+
+                    default: None   (default discovery of the client)
+
+                page_size       (int)   --  number of records fetched per page
+
+                    default: 500
+
+                max_concurrency (int)   --  maximum number of pages fetched at a time
+
+                    default: 4
+
+            Returns:
+                object  -   instance of the CloudDiscoveryPager class
+        """
+        return CloudDiscoveryPager(
+            self, discover_type=discover_type, page_size=page_size, max_concurrency=max_concurrency
+        )
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for paging through the cloud discovery of a Cloud Apps client.
+
+CloudDiscoveryPager is the only class defined in this file.
+
+CloudDiscoveryPager:    Class for fetching the pages of the discovered users, groups, sites or
+folders of a Cloud Apps client concurrently, yielding the records in order, and for saving a
+compact snapshot of the discovery to compute the changes since the last run
+
+CloudDiscoveryPager:
+    __init__(subclient_object,
+             discover_type,
+             page_size,
+             max_concurrency,
+             app_type)          --  initialize object of the CloudDiscoveryPager class
+
+    __repr__()                  --  returns the string representation of the pager
+
+    _discovery_url()            --  returns the cloud discovery URL of the client
+
+    _get_page()                 --  returns the records on the page of the discovery
+
+    _get_record_key()           --  returns the key identifying the discovered record
+
+    _get_fingerprint()          --  returns the hash of the discovered record
+
+    iter_records()              --  yields the discovered records, fetching the pages concurrently
+
+    get_records()               --  returns the list of all the discovered records
+
+    save_snapshot()             --  saves the compact snapshot of the discovery to the file
+
+    load_snapshot()             --  loads the compact snapshot of the discovery from the file
+
+    get_delta()                 --  returns the records added, modified and removed since the snapshot
+
+Attributes
+----------
+
+    **total_records**   --  returns the total number of records reported by the discovery
+
+Snapshot file
+=============
+
+    The snapshot is a gzip compressed JSON file, with only the key, hash and name of each record
+
+        {
+            'discover_type': 8,
+
+            'time': 1700000000,
+
+            'records': {
+                'user1@example.com': ['hash', 'User 1']
+            }
+        }
+
+Usage
+=====
+
+    >>> pager = subclient.get_discovery_pager(discover_type=8)
+
+    >>> for user in pager.iter_records():
+    ...     print(user['smtpAddress'])
+
+    >>> delta = pager.get_delta('users_snapshot.json.gz')
+
+"""
+
+from __future__ import unicode_literals
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ...constants import AppIDAType
+from ...exception import SDKException
+
+
+class CloudDiscoveryPager(object):
+    """Class for paging through the cloud discovery of a Cloud Apps client."""
+
+    # keys of the records in the discovery response, for the different discover types
+    RECORD_TYPES = ('userAccounts', 'groups', 'folders', 'sites')
+
+    def __init__(
+            self,
+            subclient_object,
+            discover_type=None,
+            page_size=500,
+            max_concurrency=4,
+            app_type=None):
+        """Initialize object of the CloudDiscoveryPager class.
+
+            Args:
+                subclient_object    (object)    --  instance of the subclient of the client
+
+                discover_type       (int)       --  eDiscover type of the records, e.g.;
+                8 - Users, 5 - Groups, 25 - Shared Drives
+
+                    default: None   (default discovery of the client)
+
+                page_size           (int)       --  number of records fetched per page
+
+                    default: 500
+
+                max_concurrency     (int)       --  maximum number of pages fetched at a time
+
+                    default: 4
+
+                app_type            (int)       --  application type passed to the discovery
+
+                    default: None   (cloud apps)
+
+            Raises:
+                SDKException:
+                    if type or value of the inputs is not valid
+        """
+        if not (isinstance(page_size, int) and page_size > 0 and
+                isinstance(max_concurrency, int) and max_concurrency > 0):
+            raise SDKException('Subclient', '101')
+
+        self._subclient_object = subclient_object
+        self._cvpysdk_object = subclient_object._cvpysdk_object
+        self._services = subclient_object._services
+        self._update_response_ = subclient_object._update_response_
+
+        self._discover_type = discover_type
+        self._page_size = page_size
+        self._max_concurrency = max_concurrency
+        self._app_type = AppIDAType.CLOUD_APP.value if app_type is None else app_type
+        self._total_records = None
+
+    def __repr__(self):
+        """Representation string for the instance of the CloudDiscoveryPager class."""
+        return "CloudDiscoveryPager class instance for Subclient: '{0}'".format(
+            self._subclient_object.subclient_name
+        )
+
+    def _discovery_url(self):
+        """Returns the cloud discovery URL of the client."""
+        url = self._services['CLOUD_DISCOVERY'] % (
+            self._subclient_object._instance_object.instance_id,
+            self._subclient_object._client_object.client_id,
+            self._app_type
+        )
+
+        if self._discover_type is not None:
+            url = '{0}&eDiscoverType={1}'.format(url, self._discover_type)
+
+        return url
+
+    def _get_page(self, offset):
+        """Returns the records on the page of the discovery.
+
+            Args:
+                offset  (int)   --  number of the page, starting from 0
+
+            Returns:
+                tuple   -   (list of the records on the page, total number of the records discovered,
+                -1 if it is not reported)
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', '{0}&pageSize={1}&offset={2}'.format(self._discovery_url(), self._page_size, offset)
+        )
+
+        if not flag:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
+        response_json = response.json() if response and response.text else {}
+        total_records = response_json.get('pagingInfo', {}).get('totalRecords', -1)
+
+        for record_type in self.RECORD_TYPES:
+            if record_type in response_json:
+                return response_json[record_type], total_records
+
+        return [], total_records
+
+    @staticmethod
+    def _get_record_key(record):
+        """Returns the key identifying the discovered user, group, site or folder."""
+        return (
+            record.get('smtpAddress') or record.get('user', {}).get('userGUID') or
+            record.get('folderId') or record.get('id') or record.get('name')
+        )
+
+    @staticmethod
+    def _get_fingerprint(record):
+        """Returns the hash of the discovered record, to detect the records modified since the snapshot."""
+        return hashlib.sha1(json.dumps(record, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def iter_records(self):
+        """Yields the discovered records, in the order of the discovery.
+
+            The first page is fetched to get the total number of the records, and the remaining
+            pages are then fetched concurrently, at most max_concurrency pages at a time. If the
+            total is not reported, the pages are fetched one by one until a short page is returned.
+
+            Yields:
+                dict    -   discovered user, group, site or folder
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        records, total_records = self._get_page(0)
+        self._total_records = total_records
+
+        for record in records:
+            yield record
+
+        if len(records) < self._page_size:
+            return
+
+        if total_records < 0:
+            offset = 1
+
+            while True:
+                records, _ = self._get_page(offset)
+
+                for record in records:
+                    yield record
+
+                if len(records) < self._page_size:
+                    return
+
+                offset += 1
+
+        total_pages = (total_records + self._page_size - 1) // self._page_size
+        pages = iter(range(1, total_pages))
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            pending = deque()
+
+            for offset in pages:
+                pending.append(executor.submit(self._get_page, offset))
+
+                if len(pending) < self._max_concurrency:
+                    continue
+
+                for record in pending.popleft().result()[0]:
+                    yield record
+
+            while pending:
+                for record in pending.popleft().result()[0]:
+                    yield record
+
+    def get_records(self):
+        """Returns the list of all the discovered records.
+
+            Returns:
+                list    -   discovered users, groups, sites or folders
+        """
+        return list(self.iter_records())
+
+    def save_snapshot(self, snapshot_file, records=None):
+        """Saves the compact snapshot of the discovery to the file.
+
+            Args:
+                snapshot_file   (str)   --  path of the file to save the snapshot to
+
+                records         (list)  --  discovered records to save
+
+                    default: None   (the discovery is fetched)
+
+            Returns:
+                dict    -   key of each record mapped to its hash and name
+        """
+        records = self.iter_records() if records is None else records
+        snapshot = {}
+
+        for record in records:
+            snapshot[self._get_record_key(record)] = [
+                self._get_fingerprint(record),
+                record.get('displayName') or record.get('name') or record.get('folderName', '')
+            ]
+
+        temp_file = '{0}.tmp'.format(snapshot_file)
+        with gzip.open(temp_file, 'wt', encoding='utf-8') as file_object:
+            json.dump({
+                'discover_type': self._discover_type,
+                'time': int(time.time()),
+                'records': snapshot
+            }, file_object, separators=(',', ':'))
+
+        os.replace(temp_file, snapshot_file)
+        return snapshot
+
+    def load_snapshot(self, snapshot_file):
+        """Loads the compact snapshot of the discovery from the file.
+
+            Args:
+                snapshot_file   (str)   --  path of the snapshot file
+
+            Returns:
+                dict    -   key of each record mapped to its hash and name, empty if the snapshot
+                file does not exist, or is for another discover type
+        """
+        if not os.path.isfile(snapshot_file):
+            return {}
+
+        try:
+            with gzip.open(snapshot_file, 'rt', encoding='utf-8') as file_object:
+                snapshot = json.load(file_object)
+        except (OSError, ValueError):
+            return {}
+
+        if snapshot.get('discover_type') != self._discover_type:
+            return {}
+
+        return snapshot.get('records', {})
+
+    def get_delta(self, snapshot_file, update_snapshot=True):
+        """Returns the records added, modified and removed since the snapshot was saved.
+
+            Args:
+                snapshot_file   (str)   --  path of the snapshot file
+
+                update_snapshot (bool)  --  saves the current discovery as the snapshot
+
+                    default: True
+
+            Returns:
+                dict    -   changes since the snapshot
+
+                    {
+                        'added': [records],
+
+                        'modified': [records],
+
+                        'removed': [keys of the records]
+                    }
+        """
+        previous = self.load_snapshot(snapshot_file)
+        records = []
+        delta = {
+            'added': [],
+            'modified': [],
+            'removed': []
+        }
+
+        for record in self.iter_records():
+            records.append(record)
+            key = self._get_record_key(record)
+
+            if key not in previous:
+                delta['added'].append(record)
+            elif previous.pop(key)[0] != self._get_fingerprint(record):
+                delta['modified'].append(record)
+
+        delta['removed'] = list(previous)
+
+        if update_snapshot:
+            self.save_snapshot(snapshot_file, records)
+
+        return delta
+
+    @property
+    def total_records(self):
+        """Returns the total number of records reported by the last discovery fetched."""
+        return self._total_records
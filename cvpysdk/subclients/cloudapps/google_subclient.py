@@ -67,6 +67,8 @@ GoogleSubclient:
 
     browse_content()                    --  Fetches discovered content based on discovery type
 
+    _wait_for_discovery()               --  Waits for the discovery of the client to complete
+
     verify_groups_discovery()           --  Verifies that groups discovery is complete
 
     search_for_shareddrive()            --  Searches for a specific shared drive details from discovered list
@@ -87,7 +89,6 @@ GoogleSubclient:
 
 from __future__ import unicode_literals
 from ...exception import SDKException
-import time
 from ..casubclient import CloudAppsSubclient
 from ...constants import AppIDAType
 from . import google_constants as constants
@@ -633,51 +634,21 @@ class GoogleSubclient(CloudAppsSubclient):
                         if response is not success
         """
         # Wait for sometime unitl disco discovery completes before checking actual content.
-        attempt = 0
-        while attempt < 5:
-            flag, response = self._cvpysdk_object.make_request('GET', (
-                    self._services['GOOGLE_DISCOVERY_OVERVIEW'] % (self._backupset_object.backupset_id)))
-            if response.json()['office365ClientOverview']['summary']['discoverState']['discoveryProgress'] == 100:
-                break
-            attempt += 1
-            time.sleep(10)
+        self._wait_for_discovery()
 
-        browse_content = (self._services['CLOUD_DISCOVERY'] % (self._instance_object.instance_id,
-                                                               self._client_object.client_id,
-                                                               AppIDAType.CLOUD_APP.value))
+        return self.get_discovery_pager(discover_type=discovery_type).get_records()
 
-        # determines the number of accounts to return in response
-        page_size = 500
-        offset = 0
+    def _wait_for_discovery(self):
+        """Polls the discovery progress of the client, with increasing intervals, until it completes
+            or the attempts are exhausted."""
+        for _ in self._commcell_object.retry_policy.attempts(
+                'google_discovery_progress', max_attempts=6, base_delay=2, max_delay=10, deadline=60):
+            flag, response = self._cvpysdk_object.make_request('GET', (
+                    self._services['GOOGLE_DISCOVERY_OVERVIEW'] % (self._backupset_object.backupset_id)))
 
-        records = []
-        while True:
-            discover_query = f'{browse_content}&pageSize={page_size}&offset={offset}&eDiscoverType={discovery_type}'
-            flag, response = self._cvpysdk_object.make_request('GET', discover_query)
-            offset += 1
-            if flag:
-                if response and response.json():
-                    if discovery_type == 8:
-                        if 'userAccounts' in response.json():
-                            curr_records = response.json().get('userAccounts', [])
-                            records.extend(curr_records)
-                            if len(curr_records) < page_size:
-                                break
-                    elif discovery_type == 25:
-                        if 'folders' in response.json():
-                            curr_records = response.json().get('folders', [])
-                            records.extend(curr_records)
-                            if len(curr_records) < page_size:
-                                break
-                    elif discovery_type == 5:
-                        if 'groups' in response.json():
-                            curr_groups = response.json().get('groups', [])
-                            records.extend(curr_groups)
-                            if len(curr_groups) < page_size:
-                                break
-            else:
-                raise SDKException('Response', '101', self._update_response_(response.text))
-        return records
+            if flag and response.json().get('office365ClientOverview', {}).get('summary', {}).get(
+                    'discoverState', {}).get('discoveryProgress') == 100:
+                break
 
     def verify_groups_discovery(self):
         """ Verifies that groups discovery is complete
@@ -698,30 +669,7 @@ class GoogleSubclient(CloudAppsSubclient):
 
                         if response received does not contain pagining info
         """
-        browse_content = (self._services['CLOUD_DISCOVERY'] % (self._instance_object.instance_id,
-                                                               self._client_object.client_id,
-                                                               AppIDAType.CLOUD_APP.value))
-
-        # determines the number of accounts to return in response
-        page_size = 500
-        offset = 0
-
-        groups = []
-        while True:
-            discover_query = f'{browse_content}&pageSize={page_size}&offset={offset}&eDiscoverType=5'
-            flag, response = self._cvpysdk_object.make_request('GET', discover_query)
-            offset += 1
-
-            if flag:
-                if response and response.json():
-                    if 'groups' in response.json():
-                        curr_groups = response.json().get('groups', [])
-                        groups.extend(curr_groups)
-                        if len(curr_groups) < page_size:
-                            break
-            else:
-                raise SDKException('Response', '101', self._update_response_(response.text))
-        return groups
+        return self.get_discovery_pager(discover_type=5).get_records()
 
     def verify_shareddrive_discovery(self):
         """ Verifies all shared drives discovery completed.
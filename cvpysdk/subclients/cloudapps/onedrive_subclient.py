@@ -54,6 +54,10 @@ OneDriveSubclient:
 
     _get_user_guids()                                                   --  Retrieve GUIDs for users specified
 
+    user_resolver()                                                     --  Resolver for the users discovered on the client
+
+    refresh()                                                           --  Refresh the properties of the subclient
+
     _task_json_for_onedrive_backup()                                    --  Json for onedrive backup for selected users
 
     _association_users_json()                                           --  user association
@@ -107,6 +111,7 @@ import time
 from ..casubclient import CloudAppsSubclient
 from ...constants import AppIDAType
 from .onedrive_constants import OneDriveConstants
+from .user_resolver import CloudAppsUserResolver
 import re
 
 
@@ -717,14 +722,19 @@ class OneDriveSubclient(CloudAppsSubclient):
 
         user_accounts = []
 
+        # Get user details
+        discovered_users, unresolved_users = self.user_resolver.resolve(users)
+        if unresolved_users:
+            error_string = 'Either discovery is not complete or users are not available in discovered data: {0}'
+            raise SDKException('Subclient', '102', error_string.format(', '.join(unresolved_users)))
+
         for user_id in users:
-            # Get user details
-            user_response = self.search_for_user(user_id)
-            display_name = user_response[0].get('displayName')
-            user_guid = user_response[0].get('user').get('userGUID')
-            is_auto_discovered_user = user_response[0].get(
+            user_response = discovered_users[user_id]
+            display_name = user_response.get('displayName')
+            user_guid = user_response.get('user').get('userGUID')
+            is_auto_discovered_user = user_response.get(
                 'isAutoDiscoveredUser')
-            is_super_admin = user_response[0].get('isSuperAdmin')
+            is_super_admin = user_response.get('isSuperAdmin')
 
             user_accounts.append({
                 "displayName": display_name,
@@ -1114,15 +1124,28 @@ class OneDriveSubclient(CloudAppsSubclient):
                 SDKException:
                     if user details couldn't be found in discovered data
         """
-        user_guid_list = []
-        for user_id in users:
-            user = self.search_for_user(user_id)
-            if len(user) != 0 and user[0].get('user', {}).get('userGUID') is not None:
-                user_guid_list.append(user[0].get('user').get('userGUID'))
-            else:
-                raise SDKException('Subclient', '102',
-                                   'User details not found in discovered data')
-        return user_guid_list
+        user_guids, unresolved_users = self.user_resolver.resolve_guids(users)
+        if unresolved_users:
+            raise SDKException('Subclient', '102',
+                               'User details not found in discovered data')
+        return [user_guids[user_id] for user_id in users]
+
+    @property
+    def user_resolver(self):
+        """Returns the resolver for the users discovered on the client, which loads the whole
+            discovery once for large lists of users, and searches concurrently for the others.
+
+            Returns:
+                object  -   instance of the CloudAppsUserResolver class
+        """
+        if self._user_resolver is None:
+            self._user_resolver = CloudAppsUserResolver(self)
+        return self._user_resolver
+
+    def refresh(self):
+        """Refresh the properties of the OneDrive Subclient."""
+        super(OneDriveSubclient, self).refresh()
+        self._user_resolver = None
 
     def process_index_retention_rules(self, index_app_type_id, index_server_client_name):
         """
@@ -25,6 +25,7 @@ and to perform operations on that subclient
 TeamsSubclient:
     _json_subclient_entity()    --  Get subclientEntity json for teams association operation
     discover()                  --  Launches Discovery and returns the discovered teams.
+    _get_discovered_accounts()  --  Returns the discovered accounts of the teams or users, from a single discovery.
     content()                   --  Add teams, discover() must be called before teams added using this method.
     backup()                    --  Backup a single or mulitple teams.
     out_of_place_restore()      --  Restore a single team or multiple teams.
@@ -68,6 +69,7 @@ TeamsSubclient:
 from __future__ import unicode_literals
 from ...exception import SDKException
 from ..casubclient import CloudAppsSubclient
+from .user_resolver import CloudAppsUserResolver
 
 import time
 from copy import copy, deepcopy
@@ -117,6 +119,32 @@ class TeamsSubclient(CloudAppsSubclient):
 
         return self._instance_object.discover(discovery_type, refresh_cache=refresh_cache)
 
+    def _get_discovered_accounts(self, entities, discovery_type):
+        """Returns the discovered accounts of the teams or users, from a single discovery.
+
+            Args:
+                entities        (list)  --  email IDs of the teams or users
+
+                discovery_type  (int)   --  type of the discovery
+
+            Returns:
+                list    --  discovered accounts of the entities, in the same order
+
+            Raises:
+                SDKException:
+                    if any of the entities is not discovered
+        """
+        resolver = CloudAppsUserResolver(self, discover_type=discovery_type)
+        resolver.load_accounts(self.discover(discovery_type=discovery_type).values())
+
+        accounts, unresolved = resolver.resolve(entities)
+        if unresolved:
+            raise SDKException(
+                'Subclient', '102', 'Not found in discovered data: {0}'.format(', '.join(unresolved))
+            )
+
+        return [accounts[entity] for entity in entities]
+
     def content(self, entities, o365_plan,  discovery_type):
         """Add teams, discover() must be called before teams added using this method.
             Args:
@@ -158,8 +186,7 @@ class TeamsSubclient(CloudAppsSubclient):
             is_team_instance = True
             if isinstance(entities[0], str):
                 is_team_instance = False
-                discovered_teams = self.discover(discovery_type=const.ClOUD_APP_EDISCOVER_TYPE['Teams'])
-                entities = [discovered_teams[team] for team in entities]
+                entities = self._get_discovered_accounts(entities, const.ClOUD_APP_EDISCOVER_TYPE['Teams'])
             for team in entities:
                 user_json = copy(const.ADD_USER_JSON)
                 user_json['_type_'] = 13 if is_team_instance else team['user']['_type_']
@@ -175,8 +202,7 @@ class TeamsSubclient(CloudAppsSubclient):
             request_json['cloudAppAssociation']['cloudAppDiscoverinfo']['userAccounts'] = useraccounts
 
         elif discovery_type.value == 28:
-            discovered_teams = self.discover(discovery_type=const.ClOUD_APP_EDISCOVER_TYPE['Users'])
-            entities = [discovered_teams[team] for team in entities]
+            entities = self._get_discovered_accounts(entities, const.ClOUD_APP_EDISCOVER_TYPE['Users'])
             for user in entities:
                 user_json = copy(const.ADD_USER_JSON)
                 user_json['_type_'] = user['user']['_type_']
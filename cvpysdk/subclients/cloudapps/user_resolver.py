@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for resolving the users, teams and sites of an Office 365 client to their discovered accounts.
+
+CloudAppsUserResolver is the only class defined in this file.
+
+CloudAppsUserResolver:  Class for resolving the SMTP addresses of the accounts to the discovered
+accounts, either from an index of the whole discovery, loaded once page by page, or with
+concurrent searches, when only a few accounts are resolved
+
+CloudAppsUserResolver:
+    __init__(subclient_object,
+             app_type,
+             discover_type,
+             page_size,
+             max_concurrency,
+             search_threshold)  --  initialize object of the CloudAppsUserResolver class
+
+    __repr__()                  --  returns the string representation of the resolver
+
+    _discovery_url()            --  returns the cloud discovery URL of the client
+
+    _search()                   --  searches the discovery for the account
+
+    _index_accounts()           --  adds the accounts to the index
+
+    load_index()                --  loads the whole discovery, page by page, into the index
+
+    load_accounts()             --  adds the accounts discovered by the caller to the index
+
+    resolve()                   --  returns the discovered accounts for the SMTP addresses,
+                                    and the SMTP addresses not discovered
+
+    resolve_guids()             --  returns the GUIDs of the accounts for the SMTP addresses,
+                                    and the SMTP addresses not discovered
+
+    refresh()                   --  clears the index, so that the discovery is loaded again
+
+Attributes
+----------
+
+    **is_indexed**      --  returns True if the whole discovery is loaded into the index
+
+Usage
+=====
+
+    >>> resolver = CloudAppsUserResolver(onedrive_subclient)
+
+    >>> guids, unresolved = resolver.resolve_guids(['user1@example.com', 'user2@example.com'])
+
+"""
+
+from __future__ import unicode_literals
+
+from ...bulk_operations import BulkOperationRunner
+from .discovery_pager import CloudDiscoveryPager
+from ...constants import AppIDAType
+from ...exception import SDKException
+
+
+class CloudAppsUserResolver(object):
+    """Class for resolving the SMTP addresses of the accounts of an Office 365 client to the
+        discovered accounts."""
+
+    def __init__(
+            self,
+            subclient_object,
+            app_type=None,
+            discover_type=None,
+            page_size=500,
+            max_concurrency=10,
+            search_threshold=50):
+        """Initialize object of the CloudAppsUserResolver class.
+
+            Args:
+                subclient_object    (object)    --  instance of the subclient of the client
+
+                app_type            (int)       --  application type passed to the discovery
+
+                    default: None   (cloud apps)
+
+                discover_type       (int)       --  eDiscover type of the accounts, e.g.; users,
+                teams or sites
+
+                    default: None   (default discovery of the client)
+
+                page_size           (int)       --  number of accounts fetched per page of the discovery
+
+                    default: 500
+
+                max_concurrency     (int)       --  maximum number of searches running at a time
+
+                    default: 10
+
+                search_threshold    (int)       --  number of accounts from which the whole
+                discovery is loaded, instead of searching for each of the accounts
+
+                    default: 50
+
+            Raises:
+                SDKException:
+                    if type or value of the inputs is not valid
+        """
+        if not (isinstance(page_size, int) and page_size > 0 and
+                isinstance(search_threshold, int) and search_threshold >= 0):
+            raise SDKException('Subclient', '101')
+
+        self._subclient_object = subclient_object
+        self._cvpysdk_object = subclient_object._cvpysdk_object
+        self._services = subclient_object._services
+        self._update_response_ = subclient_object._update_response_
+
+        self._app_type = AppIDAType.CLOUD_APP.value if app_type is None else app_type
+        self._discover_type = discover_type
+        self._page_size = page_size
+        self._max_concurrency = max_concurrency
+        self._search_threshold = search_threshold
+
+        self._index = {}
+        self._is_indexed = False
+
+    def __repr__(self):
+        """Representation string for the instance of the CloudAppsUserResolver class."""
+        return "CloudAppsUserResolver class instance for Subclient: '{0}'".format(
+            self._subclient_object.subclient_name
+        )
+
+    def _discovery_url(self):
+        """Returns the cloud discovery URL of the client."""
+        url = self._services['CLOUD_DISCOVERY'] % (
+            self._subclient_object._instance_object.instance_id,
+            self._subclient_object._client_object.client_id,
+            self._app_type
+        )
+
+        if self._discover_type is not None:
+            url = '{0}&eDiscoverType={1}'.format(url, self._discover_type)
+
+        return url
+
+    def _search(self, smtp_address):
+        """Searches the discovery for the account with the SMTP address.
+
+            Args:
+                smtp_address    (str)   --  SMTP address of the account
+
+            Returns:
+                dict    -   discovered account, None if the account is not discovered
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', '{0}&search={1}'.format(self._discovery_url(), smtp_address)
+        )
+
+        if not flag:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
+        user_accounts = response.json().get('userAccounts', []) if response and response.text else []
+
+        for account in user_accounts:
+            if str(account.get('smtpAddress', '')).lower() == smtp_address.lower():
+                return account
+
+        # the search also matches on the display name, so an inexact match is used only if it is the only one
+        return user_accounts[0] if len(user_accounts) == 1 else None
+
+    def _index_accounts(self, accounts):
+        """Adds the accounts to the index, by the SMTP address and the GUID of each account."""
+        for account in accounts:
+            if account.get('smtpAddress'):
+                self._index[account['smtpAddress'].lower()] = account
+
+            if account.get('user', {}).get('userGUID'):
+                self._index[account['user']['userGUID'].lower()] = account
+
+    def load_index(self):
+        """Loads the whole discovery of the client, page by page, into the index.
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        pager = CloudDiscoveryPager(
+            self._subclient_object,
+            discover_type=self._discover_type,
+            page_size=self._page_size,
+            app_type=self._app_type
+        )
+
+        for account in pager.iter_records():
+            self._index_accounts([account])
+
+        self._is_indexed = True
+
+    def load_accounts(self, accounts):
+        """Adds the accounts discovered by the caller to the index, and marks the index as loaded,
+            e.g.; when the caller has already fetched the whole discovery.
+
+            Args:
+                accounts    (list)  --  discovered accounts
+        """
+        self._index_accounts(accounts)
+        self._is_indexed = True
+
+    def resolve(self, smtp_addresses):
+        """Returns the discovered accounts for the SMTP addresses, and the SMTP addresses which
+            are not discovered.
+
+            The accounts are looked up in the index if it is loaded, or if the number of the
+            SMTP addresses is at least the search threshold, in which case the whole discovery
+            is loaded once. Otherwise, the SMTP addresses are searched for concurrently.
+
+            Args:
+                smtp_addresses  (list)  --  SMTP addresses of the accounts
+
+            Returns:
+                tuple   -   (dict of the SMTP address mapped to the discovered account,
+                list of the SMTP addresses not discovered)
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid
+
+                    if response is not success
+        """
+        if not isinstance(smtp_addresses, list):
+            raise SDKException('Subclient', '101')
+
+        accounts = {}
+        to_search = []
+
+        if not self._is_indexed and len(smtp_addresses) >= self._search_threshold:
+            self.load_index()
+
+        for smtp_address in smtp_addresses:
+            account = self._index.get(smtp_address.lower())
+
+            if account is not None:
+                accounts[smtp_address] = account
+            elif not self._is_indexed:
+                to_search.append(smtp_address)
+
+        if to_search:
+            runner = BulkOperationRunner(max_concurrency=self._max_concurrency)
+
+            for smtp_address, account in runner.run(self._search, to_search):
+                if isinstance(account, Exception):
+                    raise account
+
+                if account is not None:
+                    accounts[smtp_address] = account
+                    self._index_accounts([account])
+
+        unresolved = [smtp_address for smtp_address in smtp_addresses if smtp_address not in accounts]
+        return accounts, unresolved
+
+    def resolve_guids(self, smtp_addresses):
+        """Returns the GUIDs of the accounts for the SMTP addresses, and the SMTP addresses which
+            are not discovered.
+
+            Args:
+                smtp_addresses  (list)  --  SMTP addresses of the accounts
+
+            Returns:
+                tuple   -   (dict of the SMTP address mapped to the GUID of the account,
+                list of the SMTP addresses not discovered)
+
+            Raises:
+                SDKException:
+                    if type of the input is not valid
+
+                    if response is not success
+        """
+        accounts, unresolved = self.resolve(smtp_addresses)
+        guids = {}
+
+        for smtp_address, account in accounts.items():
+            user_guid = account.get('user', {}).get('userGUID')
+
+            if user_guid is None:
+                unresolved.append(smtp_address)
+            else:
+                guids[smtp_address] = user_guid
+
+        return guids, unresolved
+
+    def refresh(self):
+        """Clears the index, so that the discovery is loaded again on the next resolve."""
+        self._index = {}
+        self._is_indexed = False
+
+    @property
+    def is_indexed(self):
+        """Returns True if the whole discovery is loaded into the index."""
+        return self._is_indexed
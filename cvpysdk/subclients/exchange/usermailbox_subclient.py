@@ -36,6 +36,12 @@ UsermailboxSubclient:
     _task_json_for_backup()             --  JSON for backup task for Exchange User mailbox Subclient
     _backup_generic_items_json()        --  JSON to backup generic items
     _search_user()                      --  Searches for the user in the discovered users list
+    _search_users()                     --  Searches for the users concurrently, and merges the
+                                            matches into the discovered users
+    _get_discovery_keys()               --  Returns the keys the discovered entity is indexed by
+    _get_discovery_index()              --  Returns the index of the discovered entities, built
+                                            once per discovery snapshot
+    _find_discovered()                  --  Returns the discovered entities matching the names
 
 Content Association Methods:
 ==============================
@@ -80,6 +86,12 @@ Browse/ Restore/ Backup Methods:
     restore_in_place_syntex()           --  runs an in-place restore for the Syntex client
     find_mailbox()                      --  Performs search operation of a mailbox in browse
 
+Discovery Methods:
+==============================
+
+    refresh_discovery()                 --  Reloads the discovered entities and their index,
+                                            without reloading the subclient properties
+
 
 
 User Mailbox Subclient Instance Attributes:
@@ -96,6 +108,7 @@ from ...exception import SDKException
 from ..exchsubclient import ExchangeSubclient
 from ...subclient import Subclients
 from ...backupset import Backupsets
+from ...bulk_operations import BulkOperationRunner
 from .constants import ExchangeConstants
 
 import time
@@ -110,6 +123,13 @@ class UsermailboxSubclient(ExchangeSubclient):
 
     """
 
+    # properties of the discovered entities indexed for each discover type
+    _DISCOVERY_KEYS = {
+        'User': ('smtpAdrress', 'aliasName'),
+        'Database': ('databaseName',),
+        'AD Group': ('adGroupName',)
+    }
+
     def __init__(self, backupset_object, subclient_name, subclient_id=None):
         """Initialize the Instance object for the given UserMailbox Subclient.
 
@@ -457,7 +477,7 @@ class UsermailboxSubclient(ExchangeSubclient):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def _search_user(self, user, retry_attempts=0):
+    def _search_user(self, user):
         """Searches for the user in the discovered users list .
             Args:
                 user (str)              -   alias name/smtp address of the user to search for
@@ -465,26 +485,153 @@ class UsermailboxSubclient(ExchangeSubclient):
                 list    -   list of discovered users matching the search
 
         """
-        flag, response = self._commcell_object._cvpysdk_object.make_request('GET', f"{self._SEARCH}&search={user}")
+        # the results might take some time depending on domains
+        for _ in self._commcell_object.retry_policy.attempts(
+                'exchange_user_search', max_attempts=12, base_delay=10, max_delay=10, deadline=150):
+            flag, response = self._commcell_object._cvpysdk_object.make_request(
+                'GET', f"{self._SEARCH}&search={user}"
+            )
 
-        if flag:
-            if response and response.json():
-                search_content = response.json()
+            if not flag:
+                response_string = self._commcell_object._update_response_(response.text)
+                raise SDKException('Response', '101', response_string)
 
-                _error_code = search_content.get('resp', {}).get('errorCode', 0)
-                if _error_code == 469762468 or _error_code == 469762470:
-                    # if search_content.get('resp', {}).get('errorCode', 0) == 469762468:
-                    time.sleep(10)  # the results might take some time depending on domains
-                    if retry_attempts > 10:
-                        raise SDKException('Subclient', '102', 'Failed to perform search and discovery.')
-                    return self._search_user(user, retry_attempts=retry_attempts + 1)
+            if not (response and response.json()):
+                raise SDKException('Response', '102')
+
+            search_content = response.json()
+            _error_code = search_content.get('resp', {}).get('errorCode', 0)
 
+            if _error_code not in (469762468, 469762470):
                 return search_content.get('discoverInfo', {}).get('mailBoxes', [])
+
+        raise SDKException('Subclient', '102', 'Failed to perform search and discovery.')
+
+    def _search_users(self, users, max_concurrency=5):
+        """Searches for the users concurrently, and merges the matching users into the
+            discovered users, so that the next lookups for them are served from the index.
+
+            Args:
+                users           (list)  --  alias names/smtp addresses of the users to search for
+
+                max_concurrency (int)   --  maximum number of searches running at a time
+
+                    default: 5
+
+            Returns:
+                dict    -   user name mapped to the list of discovered users matching the search
+
+            Raises:
+                SDKException:
+                    if the search failed for any of the users
+        """
+        results = {}
+        runner = BulkOperationRunner(max_concurrency=max_concurrency)
+
+        for user, result in runner.run(self._search_user, users):
+            if isinstance(result, Exception):
+                raise result
+
+            results[user] = result
+
+        if not isinstance(self._discover_users, list):
+            self._discover_users = []
+
+        index = self._get_discovery_index('User')
+        for user in users:
+            for mb_item in results[user]:
+                keys = self._get_discovery_keys('User', mb_item)
+
+                if any(mb_item in index.get(key, []) for key in keys):
+                    continue
+
+                self._discover_users.append(mb_item)
+                for key in keys:
+                    index.setdefault(key, []).append(mb_item)
+
+        return results
+
+    def _get_discovery_keys(self, discover_type, entity):
+        """Returns the lower case keys the discovered entity is indexed by.
+
+            Args:
+                discover_type   (str)   --  type of the discovered entity
+
+                    Valid values: User / Database / AD Group
+
+                entity          (dict)  --  discovered entity
+
+            Returns:
+                list    -   keys of the entity
+        """
+        keys = [
+            entity[key].lower() for key in self._DISCOVERY_KEYS[discover_type]
+            if isinstance(entity.get(key), str) and entity[key]
+        ]
+
+        if discover_type == 'User' and entity.get('user', {}).get('userGUID'):
+            keys.append(entity['user']['userGUID'].lower())
+
+        return list(set(keys))
+
+    def _get_discovery_index(self, discover_type):
+        """Returns the index of the discovered entities of the type, built once per discovery
+            snapshot instead of scanning the discovered entities for each name.
+
+            Users are indexed by the SMTP address, alias name and user GUID, databases by the
+            database name and AD groups by the AD group name.
+
+            Args:
+                discover_type   (str)   --  type of the discovered entity
+
+                    Valid values: User / Database / AD Group
+
+            Returns:
+                dict    -   lower case key mapped to the list of discovered entities with the key
+        """
+        if discover_type not in self._discovery_index:
+            discovered = {
+                'User': self._discover_users,
+                'Database': self._discover_databases,
+                'AD Group': self._discover_adgroups
+            }[discover_type]
+
+            index = {}
+            for entity in discovered if isinstance(discovered, list) else []:
+                for key in self._get_discovery_keys(discover_type, entity):
+                    index.setdefault(key, []).append(entity)
+
+            self._discovery_index[discover_type] = index
+
+        return self._discovery_index[discover_type]
+
+    def _find_discovered(self, discover_type, names):
+        """Returns the discovered entities matching the names.
+
+            Args:
+                discover_type   (str)   --  type of the discovered entity
+
+                    Valid values: User / Database / AD Group
+
+                names           (list)  --  names of the entities to look up
+
+            Returns:
+                tuple   -   (dict of name mapped to the list of matching entities,
+                list of names not discovered)
+        """
+        index = self._get_discovery_index(discover_type)
+        found = {}
+        missing = []
+
+        for name in names:
+            entities = index.get(name.lower())
+
+            if entities:
+                found[name] = entities
             else:
-                raise SDKException('Response', '102')
-        else:
-            response_string = self._commcell_object._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
+                missing.append(name)
+
+        return found, missing
 
     def _get_discover_database(self):
         """Gets the discovered databases from the Subclient .
@@ -834,44 +981,42 @@ class UsermailboxSubclient(ExchangeSubclient):
         if not (isinstance(subclient_content['mailboxNames'], list)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_users = self.discover_users
+        found_users, to_search_users = self._find_discovered('User', subclient_content['mailboxNames'])
 
+        try:
             for mailbox_item in subclient_content['mailboxNames']:
+                if mailbox_item not in found_users:
+                    continue
 
-                for mb_item in discover_users:
-
-                    if mailbox_item.lower() == mb_item['aliasName'].lower() or \
-                            mailbox_item.lower() == mb_item['smtpAdrress'].lower():
-                        mailbox_dict = {
-                            'smtpAdrress': mb_item['smtpAdrress'],
-                            'aliasName': mb_item['aliasName'],
-                            'mailBoxType': mb_item['mailBoxType'],
-                            'displayName': mb_item['displayName'],
-                            'exchangeServer': mb_item['exchangeServer'],
-                            'isAutoDiscoveredUser': mb_item['isAutoDiscoveredUser'],
-                            "associated": False,
-                            'databaseName': mb_item['databaseName'],
-                            "exchangeVersion": mb_item['exchangeVersion'],
-                            # "msExchRecipientTypeDetails": mb_item['msExchRecipientTypeDetails'],
-                            'user': {
-                                '_type_': 13,
-                                'userGUID': mb_item['user']['userGUID']
-                            }
-                        }
-                        users.append(mailbox_dict)
-                        break
+                mb_item = found_users[mailbox_item][0]
+                mailbox_dict = {
+                    'smtpAdrress': mb_item['smtpAdrress'],
+                    'aliasName': mb_item['aliasName'],
+                    'mailBoxType': mb_item['mailBoxType'],
+                    'displayName': mb_item['displayName'],
+                    'exchangeServer': mb_item['exchangeServer'],
+                    'isAutoDiscoveredUser': mb_item['isAutoDiscoveredUser'],
+                    "associated": False,
+                    'databaseName': mb_item['databaseName'],
+                    "exchangeVersion": mb_item['exchangeVersion'],
+                    # "msExchRecipientTypeDetails": mb_item['msExchRecipientTypeDetails'],
+                    'user': {
+                        '_type_': 13,
+                        'userGUID': mb_item['user']['userGUID']
+                    }
+                }
+                users.append(mailbox_dict)
 
         except KeyError as err:
             raise SDKException('Subclient', '102', '{} not given in content'.format(err))
 
-        if len(users) != len(subclient_content['mailboxNames']):
-            to_search_user = [s_user for s_user in subclient_content['mailboxNames']
-                              if not any(s_user == f_user['smtpAdrress'] for f_user in users)]
-            for mailbox_item in to_search_user:
-                search_users = self._search_user(mailbox_item)
-                if len(search_users) != 0:
-                    users.append(search_users[0])
+        if to_search_users:
+            # users not in the discovery snapshot are searched on the server, in parallel
+            search_results = self._search_users(to_search_users)
+
+            for mailbox_item in to_search_users:
+                if search_results[mailbox_item]:
+                    users.append(search_results[mailbox_item][0])
 
         discover_info = {
             "discoverByType": 1,
@@ -1061,20 +1206,18 @@ class UsermailboxSubclient(ExchangeSubclient):
                 isinstance(subclient_content['is_auto_discover_user'], bool)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_databases = self.discover_databases
+        found_databases, _ = self._find_discovered('Database', subclient_content['databaseNames'])
 
+        try:
             for database_item in subclient_content['databaseNames']:
 
-                for db_item in discover_databases:
-
-                    if database_item.lower() == db_item['databaseName'].lower():
-                        database_dict = {
-                            'exchangeServer': db_item['exchangeServer'],
-                            "associated": False,
-                            'databaseName': db_item['databaseName'],
-                        }
-                        databases.append(database_dict)
+                for db_item in found_databases.get(database_item, []):
+                    database_dict = {
+                        'exchangeServer': db_item['exchangeServer'],
+                        "associated": False,
+                        'databaseName': db_item['databaseName'],
+                    }
+                    databases.append(database_dict)
 
         except KeyError as err:
             raise SDKException('Subclient', '102', '{} not given in content'.format(err))
@@ -1128,18 +1271,16 @@ class UsermailboxSubclient(ExchangeSubclient):
                 isinstance(subclient_content['is_auto_discover_user'], bool)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_adgroups = self.discover_adgroups
+        found_adgroups, _ = self._find_discovered('AD Group', subclient_content['adGroupNames'])
 
+        try:
             for adgroup_item in subclient_content['adGroupNames']:
 
-                for ad_item in discover_adgroups:
-
-                    if adgroup_item.lower() == ad_item['adGroupName'].lower():
-                        adgroup_dict = {
-                            'adGroupName': ad_item['adGroupName'],
-                        }
-                        adgroups.append(adgroup_dict)
+                for ad_item in found_adgroups.get(adgroup_item, []):
+                    adgroup_dict = {
+                        'adGroupName': ad_item['adGroupName'],
+                    }
+                    adgroups.append(adgroup_dict)
 
         except KeyError as err:
             raise SDKException('Subclient', '102', '{} not given in content'.format(err))
@@ -1214,32 +1355,30 @@ class UsermailboxSubclient(ExchangeSubclient):
         if not (isinstance(subclient_content['mailboxNames'], list)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_users = self.discover_users
+        found_users, _ = self._find_discovered('User', subclient_content['mailboxNames'])
 
+        try:
             for mailbox_item in subclient_content['mailboxNames']:
+                if mailbox_item not in found_users:
+                    continue
 
-                for mb_item in discover_users:
-
-                    if mailbox_item.lower() == mb_item['aliasName'].lower():
-                        mailbox_dict = {
-                            'smtpAdrress': mb_item['smtpAdrress'],
-                            'aliasName': mb_item['aliasName'],
-                            'mailBoxType': mb_item['mailBoxType'],
-                            'displayName': mb_item['displayName'],
-                            'exchangeServer': mb_item['exchangeServer'],
-                            'isAutoDiscoveredUser': mb_item['isAutoDiscoveredUser'],
-                            "associated": False,
-                            'databaseName': mb_item['databaseName'],
-                            "exchangeVersion": mb_item['exchangeVersion'],
-                            "exchangeServer": mb_item['exchangeServer'],
-                            'user': {
-                                '_type_': 13,
-                                'userGUID': mb_item['user']['userGUID']
-                            }
-                        }
-                        users.append(mailbox_dict)
-                        break
+                mb_item = found_users[mailbox_item][0]
+                mailbox_dict = {
+                    'smtpAdrress': mb_item['smtpAdrress'],
+                    'aliasName': mb_item['aliasName'],
+                    'mailBoxType': mb_item['mailBoxType'],
+                    'displayName': mb_item['displayName'],
+                    'exchangeServer': mb_item['exchangeServer'],
+                    'isAutoDiscoveredUser': mb_item['isAutoDiscoveredUser'],
+                    "associated": False,
+                    'databaseName': mb_item['databaseName'],
+                    "exchangeVersion": mb_item['exchangeVersion'],
+                    'user': {
+                        '_type_': 13,
+                        'userGUID': mb_item['user']['userGUID']
+                    }
+                }
+                users.append(mailbox_dict)
 
         except KeyError as err:
             raise SDKException('Subclient', '102', '{} not given in content'.format(err))
@@ -1338,20 +1477,18 @@ class UsermailboxSubclient(ExchangeSubclient):
                 isinstance(subclient_content['is_auto_discover_user'], bool)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_databases = self.discover_databases
+        found_databases, _ = self._find_discovered('Database', subclient_content['databaseNames'])
 
+        try:
             for database_item in subclient_content['databaseNames']:
 
-                for db_item in discover_databases:
-
-                    if database_item.lower() == db_item['databaseName'].lower():
-                        database_dict = {
-                            'exchangeServer': db_item['exchangeServer'],
-                            "associated": False,
-                            'databaseName': db_item['databaseName'],
-                        }
-                        databases.append(database_dict)
+                for db_item in found_databases.get(database_item, []):
+                    database_dict = {
+                        'exchangeServer': db_item['exchangeServer'],
+                        "associated": False,
+                        'databaseName': db_item['databaseName'],
+                    }
+                    databases.append(database_dict)
 
         except KeyError as err:
             raise SDKException('Subclient', '102', '{} not given in content'.format(err))
@@ -1406,19 +1543,17 @@ class UsermailboxSubclient(ExchangeSubclient):
                 isinstance(subclient_content['is_auto_discover_user'], bool)):
             raise SDKException('Subclient', '101')
 
-        try:
-            discover_adgroups = self.discover_adgroups
+        found_adgroups, _ = self._find_discovered('AD Group', subclient_content['adGroupNames'])
 
+        try:
             for adgroup_item in subclient_content['adGroupNames']:
 
-                for ad_item in discover_adgroups:
-
-                    if adgroup_item.lower() == ad_item['adGroupName'].lower():
-                        adgroup_dict = {
-                            "associated": False,
-                            'adGroupName': ad_item['adGroupName'],
-                        }
-                        adgroups.append(adgroup_dict)
+                for ad_item in found_adgroups.get(adgroup_item, []):
+                    adgroup_dict = {
+                        "associated": False,
+                        'adGroupName': ad_item['adGroupName'],
+                    }
+                    adgroups.append(adgroup_dict)
 
         except KeyError as err:
             raise SDKException('Subclient', '102', '{} not given in content'.format(err))
@@ -1816,12 +1951,51 @@ class UsermailboxSubclient(ExchangeSubclient):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
+    def refresh_discovery(self, discover_types=None, refresh_cache=False):
+        """Reloads the discovered entities of the types, and rebuilds only their index, without
+            reloading the subclient properties and associations.
+
+            Args:
+                discover_types  (list)  --  types of the discovered entities to reload
+
+                    Valid values: User / Database / AD Group
+
+                    default: None   (all the types)
+
+                refresh_cache   (bool)  --  if True, the users are discovered again on the server,
+                otherwise the discovery cached on the server is returned
+
+                    default: False
+
+            Raises:
+                SDKException:
+                    if type of the discover types is not valid
+        """
+        if discover_types is None:
+            discover_types = list(self._DISCOVERY_KEYS)
+
+        if not isinstance(discover_types, list) or not set(discover_types).issubset(self._DISCOVERY_KEYS):
+            raise SDKException('Subclient', '101')
+
+        if 'User' in discover_types:
+            self._discover_users = self._get_discover_users(use_without_refresh_url=not refresh_cache)
+
+        if 'Database' in discover_types:
+            self._discover_databases = self._get_discover_database()
+
+        if 'AD Group' in discover_types:
+            self._discover_adgroups = self._get_discover_adgroups()
+
+        for discover_type in discover_types:
+            self._discovery_index.pop(discover_type, None)
+
     def refresh(self):
         """Refresh the User Mailbox Subclient."""
         self._get_subclient_properties()
         self._discover_users = self._get_discover_users()
         self._discover_databases = self._get_discover_database()
         self._discover_adgroups = self._get_discover_adgroups()
+        self._discovery_index = {}
         self._users, self._o365groups = self._get_user_assocaitions()
         self._databases = self._get_database_associations()
         self._adgroups = self._get_adgroup_assocaitions()
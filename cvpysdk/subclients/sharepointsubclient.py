@@ -55,6 +55,8 @@ SharepointSubclient:
 
     browse_for_content()                --  returns the user association content
 
+    site_resolver()                     --  returns the resolver for the sites discovered on the client
+
     associate_site_collections_and_webs()-- associates the specified site collections/webs
 
     delete_data()                       --  delete backed up data from sharepoint clients
@@ -91,6 +93,7 @@ from ..subclient import Subclient
 from ..exception import SDKException
 from ..constants import SQLDefines
 from ..constants import SharepointDefines
+from .cloudapps.user_resolver import CloudAppsUserResolver
 
 
 class SharepointSuperSubclient(Subclient):
@@ -938,6 +941,25 @@ class SharepointSubclient(SharepointSuperSubclient):
         else:
             raise SDKException('Subclient', '102', 'Method not supported for SharePoint On-Premise Instance')
 
+    @property
+    def site_resolver(self):
+        """Returns the resolver for the sites discovered on the SharePoint Online client, to get the
+            user accounts of the sites to pass to update_sites_association_properties()
+
+            Returns:
+                object  -   instance of the CloudAppsUserResolver class
+
+            Raises:
+                SDKException:
+                    if the method is called by SharePoint On-Premise Instance
+        """
+        if not self._backupset_object.is_sharepoint_online_instance:
+            raise SDKException('Subclient', '102', 'Method not supported for SharePoint On-Premise Instance')
+
+        if getattr(self, '_site_resolver', None) is None:
+            self._site_resolver = CloudAppsUserResolver(self, app_type=int(self._agent_object.agent_id))
+        return self._site_resolver
+
     def update_sites_association_properties(self, site_user_accounts_list, operation, plan_id=None):
         """Updates the association properties of site
 
@@ -294,33 +294,34 @@ class KubernetesVirtualServerSubclient(VirtualServerSubclient):
         self._json_vcenter_instance(restore_option)
 
         _new_name_dict = restore_option.get('restore_new_name', {})
-        for _each_vm_to_restore in restore_option['vm_to_restore']:
-            restore_option["new_name"] = _new_name_dict.get(_each_vm_to_restore, _each_vm_to_restore)
-            namespace_app_map = restore_option.get('namespace_app_map', {})
-            datacenter = restore_option.get('datacenter', None)
-
-            if not namespace_app_map:
-                # FOR : Full Application Restores Restores
-                # If namespace_app_map is not passed the it is a full application restore
-                # so 'datacenter' should be passed. Nothing to do here
-                pass
-
-            elif _each_vm_to_restore in namespace_app_map:
-                # FOR : Namespace Level Restore
-                # If _each_vm_to_restore is in namespace_app_map which means it's an application
-                # and not a namespace, so we need to pass 'datacenter' to advanced restore options
-
-                app_ns = namespace_app_map.get(_each_vm_to_restore)
-
-                # Getting the target namespace if restoring to a new namespace name
-                target_ns = _new_name_dict[app_ns]
-                restore_option['datacenter'] = target_ns
-            else:
-                # FOR : Namespace Level Restore
-                # If it's a namespace, then there is no 'datacenter' needed so pop it
-                if 'datacenter' in restore_option:
-                    restore_option.pop('datacenter')
-            self.set_advanced_vm_restore_options(_each_vm_to_restore, restore_option)
+        with self._vm_metadata_scope():
+            for _each_vm_to_restore in restore_option['vm_to_restore']:
+                restore_option["new_name"] = _new_name_dict.get(_each_vm_to_restore, _each_vm_to_restore)
+                namespace_app_map = restore_option.get('namespace_app_map', {})
+                datacenter = restore_option.get('datacenter', None)
+
+                if not namespace_app_map:
+                    # FOR : Full Application Restores Restores
+                    # If namespace_app_map is not passed the it is a full application restore
+                    # so 'datacenter' should be passed. Nothing to do here
+                    pass
+
+                elif _each_vm_to_restore in namespace_app_map:
+                    # FOR : Namespace Level Restore
+                    # If _each_vm_to_restore is in namespace_app_map which means it's an application
+                    # and not a namespace, so we need to pass 'datacenter' to advanced restore options
+
+                    app_ns = namespace_app_map.get(_each_vm_to_restore)
+
+                    # Getting the target namespace if restoring to a new namespace name
+                    target_ns = _new_name_dict[app_ns]
+                    restore_option['datacenter'] = target_ns
+                else:
+                    # FOR : Namespace Level Restore
+                    # If it's a namespace, then there is no 'datacenter' needed so pop it
+                    if 'datacenter' in restore_option:
+                        restore_option.pop('datacenter')
+                self.set_advanced_vm_restore_options(_each_vm_to_restore, restore_option)
         # prepare json
         request_json = self._restore_json(restore_option=restore_option)
         self._virtualserver_option_restore_json["diskLevelVMRestoreOption"][
@@ -508,11 +509,10 @@ class KubernetesVirtualServerSubclient(VirtualServerSubclient):
         # If new_name is not given, it restores the Application with same name
         # with suffix Delete.
         vm_names, vm_ids = self._get_vm_ids_and_names_dict_from_browse()
-        browse_result = self.vm_files_browse()
         application_id = vm_ids[vm_to_restore]
 
         # vs metadata from browse result
-        _metadata = browse_result[1][('\\' + vm_to_restore)]
+        _metadata = self._get_vm_browse_metadata(vm_to_restore, find_nics=False)
         vs_metadata = _metadata["advanced_data"]["browseMetaData"]["virtualServerMetaData"]
         if restore_option['in_place']:
             folder_path = vs_metadata.get("inventoryPath", '')
@@ -720,18 +720,19 @@ class KubernetesVirtualServerSubclient(VirtualServerSubclient):
         self._json_restore_diskLevelVMRestoreOption(restore_option)
         self._json_vcenter_instance(restore_option)
 
-        for _each_vm_to_restore in restore_option['vm_to_restore']:
-            if not restore_option["in_place"]:
-                if 'disk_type' in restore_option:
-                    restore_option['restoreAsManagedVM'] = restore_option['disk_type'][_each_vm_to_restore]
-                if ("restore_new_name" in restore_option and
-                        restore_option["restore_new_name"] is not None):
-                    restore_option["new_name"] = restore_option["restore_new_name"] + _each_vm_to_restore
+        with self._vm_metadata_scope():
+            for _each_vm_to_restore in restore_option['vm_to_restore']:
+                if not restore_option["in_place"]:
+                    if 'disk_type' in restore_option:
+                        restore_option['restoreAsManagedVM'] = restore_option['disk_type'][_each_vm_to_restore]
+                    if ("restore_new_name" in restore_option and
+                            restore_option["restore_new_name"] is not None):
+                        restore_option["new_name"] = restore_option["restore_new_name"] + _each_vm_to_restore
+                    else:
+                        restore_option["new_name"] = "del" + _each_vm_to_restore
                 else:
-                    restore_option["new_name"] = "del" + _each_vm_to_restore
-            else:
-                restore_option["new_name"] = _each_vm_to_restore
-            self.set_advanced_vm_restore_options(_each_vm_to_restore, restore_option)
+                    restore_option["new_name"] = _each_vm_to_restore
+                self.set_advanced_vm_restore_options(_each_vm_to_restore, restore_option)
         # prepare json
         request_json = self._restore_json(restore_option=restore_option)
         self._virtualserver_option_restore_json["diskLevelVMRestoreOption"][
@@ -212,10 +212,9 @@ class OCIVirtualServerSubclient(VirtualServerSubclient):
         # If new_name is not given, it restores the VM with same name
         # with suffix Delete.
         vm_names, vm_ids = self._get_vm_ids_and_names_dict_from_browse()
-        browse_result = self.vm_files_browse()
 
         # vs metadata from browse result
-        _metadata = browse_result[1][('\\' + vm_to_restore)]
+        _metadata = self._get_vm_browse_metadata(vm_to_restore, find_nics=False)
         vs_metadata = _metadata["advanced_data"]["browseMetaData"]["virtualServerMetaData"]
         if restore_option['in_place']:
             folder_path = vs_metadata.get("inventoryPath", '')
@@ -34,6 +34,21 @@ VirtualServerSubclient:
     _get_vm_ids_and_names_dict()      --  creates and returns 2 dictionaries,
                                           along with the vm path
 
+    _get_vm_path_index()              --  returns the cached translation
+                                          index for the VM path component
+
+    _vm_metadata_scope()              --  context manager sharing the VM
+                                          metadata index across the VMs
+
+    _browse_vm_metadata()             --  browses the VMs and indexes the
+                                          metadata by VM name and GUID
+
+    _get_vm_browse_metadata()         --  returns the browse metadata of
+                                          the VM from the metadata index
+
+    _translate_vm_path()              --  rewrites the VM component of a path
+                                          using the translation index
+
     _parse_vm_path()                  --  parses the path provided by user,
                                           and replaces the VM Display Name with
                                           the VM ID
@@ -56,6 +71,10 @@ VirtualServerSubclient:
     _json_nics_advancedRestoreOptions       -- Setter for nics list for
                                                advanced restore option json
 
+    _iter_vsa_browse_response()             -- lazily yields the browse response
+                                               rows with the vm id replaced by
+                                               the vm name
+
     _process_vsa_browse_response()          -- processes the browse response
                                                received from server,and
                                                replaces the vm id with the vm
@@ -88,6 +107,10 @@ VirtualServerSubclient:
                                                for this subclient at the vm
                                                path specified
 
+    iter_browse()                           -- lazily yields the content of the
+                                               backup for this subclient at
+                                               the vm path specified
+
     parse_nics_xml()                        -- gets the list of nics for a VM
 
     get_nics_from_browse()                  -- Browses the vm to get the nics
@@ -150,6 +173,8 @@ For eg:
 
 import os
 import re
+import time
+from contextlib import contextmanager
 from enum import Enum
 import copy
 import xml.etree.ElementTree as ET
@@ -239,6 +264,11 @@ class VirtualServerSubclient(Subclient):
 
         self._vm_names_browse = []
         self._vm_ids_browse = {}
+        self._vm_path_index = {}
+        self._vm_path_index_source = None
+        self._vm_metadata_index = {}
+        self._vm_metadata_scope_depth = 0
+        self.vm_metadata_cache_ttl = None
         self._advanced_restore_option_list = []
         self._live_sync = None
 
@@ -1259,6 +1289,7 @@ class VirtualServerSubclient(Subclient):
 
         _vm_ids, _vm_names = self._get_vm_ids_and_names_dict()
         if not self._vm_names_browse:
+            self._vm_path_index_source = None
             paths, paths_dict = self.browse()
             if not _vm_names:
                 for key, val in paths_dict.items():
@@ -1270,6 +1301,147 @@ class VirtualServerSubclient(Subclient):
 
         return self._vm_names_browse, self._vm_ids_browse
 
+    @contextmanager
+    def _vm_metadata_scope(self):
+        """Context manager within which the VM metadata index built by _get_vm_browse_metadata()
+            is shared, so that a restore of multiple VMs browses the subclient only once.
+
+            If vm_metadata_cache_ttl is set, the index is also kept across the scopes, for
+            vm_metadata_cache_ttl seconds.
+        """
+        if self._vm_metadata_scope_depth == 0 and self.vm_metadata_cache_ttl is None:
+            self._vm_metadata_index = {}
+
+        self._vm_metadata_scope_depth += 1
+        try:
+            yield
+        finally:
+            self._vm_metadata_scope_depth -= 1
+
+            if self._vm_metadata_scope_depth == 0 and self.vm_metadata_cache_ttl is None:
+                self._vm_metadata_index = {}
+
+    def _browse_vm_metadata(self, operation, copy_precedence):
+        """Browses the VMs of the subclient, and indexes the browse metadata by the VM name and GUID
+
+            Args:
+                operation           (str)   --  The type of operation to perform (browse/find)
+
+                copy_precedence     (int)   --  The copy precedence to do browse from
+
+            Returns:
+                dict    -   browse metadata of each VM, with the VM name and GUID as the keys
+        """
+        _, paths_dict = self.vm_files_browse(operation=operation, copy_precedence=copy_precedence)
+        vm_metadata = {}
+
+        for path, metadata in paths_dict.items():
+            vm_metadata[path.lstrip('\\')] = metadata
+
+            if metadata.get('snap_display_name'):
+                vm_metadata[metadata['snap_display_name']] = metadata
+
+        return vm_metadata
+
+    def _get_vm_browse_metadata(self, vm_to_restore, copy_precedence=0, find_nics=True):
+        """Returns the browse metadata of the VM, from the VM metadata index of the subclient.
+
+            The index is built from a single browse of the subclient, and a find browse, if the
+            metadata of the VM does not have the NICs, and is shared by all the VMs restored
+            within _vm_metadata_scope(). Outside the scope, the subclient is browsed on each call,
+            unless vm_metadata_cache_ttl is set.
+
+            Args:
+                vm_to_restore       (str)   --  name or GUID of the VM
+
+                copy_precedence     (int)   --  The copy precedence to do browse from
+
+                    default: 0
+
+                find_nics           (bool)  --  run a find browse if the metadata from browse
+                does not have the NICs of the VM
+
+                    default: True
+
+            Returns:
+                dict    -   browse metadata of the VM, same as returned by vm_files_browse()
+        """
+        now = time.time()
+        entry = self._vm_metadata_index.get(copy_precedence)
+
+        if entry is not None and self.vm_metadata_cache_ttl is not None and \
+                now - entry['time'] > self.vm_metadata_cache_ttl:
+            entry = None
+
+        if entry is None or (self._vm_metadata_scope_depth == 0 and self.vm_metadata_cache_ttl is None):
+            entry = {
+                'time': now,
+                'browse': self._browse_vm_metadata('browse', copy_precedence),
+                'find': None
+            }
+            self._vm_metadata_index[copy_precedence] = entry
+
+        _metadata = entry['browse'][vm_to_restore]
+
+        if find_nics and (('browseMetaData' not in _metadata['advanced_data']) or
+                          ('virtualServerMetaData' not in _metadata['advanced_data']['browseMetaData']) or
+                          ('nics' not in _metadata['advanced_data']['browseMetaData']['virtualServerMetaData'])):
+            if entry['find'] is None:
+                entry['find'] = self._browse_vm_metadata('find', copy_precedence)
+            _metadata = entry['find'][vm_to_restore]
+
+        return _metadata
+
+    def _get_vm_path_index(self, vm_map):
+        """Returns the translation index used to rewrite the VM path component
+           of browse paths.
+
+            The index is rebuilt only for a different mapping object, so repeated
+            browses against the cached browse VM list reuse the same index. The
+            index is invalidated when the browse VM list is loaded again.
+
+            Args:
+                vm_map  (dict)  --  dictionary with the path component to
+                                    replace as key and its replacement as value
+
+            Returns:
+                dict    -   path component to replacement mapping
+        """
+        # the mapping is kept referenced, so that its id is not reused by another mapping
+        if vm_map is not self._vm_path_index_source or len(vm_map) != len(self._vm_path_index):
+            self._vm_path_index_source = vm_map
+            self._vm_path_index = {str(key): str(value) for key, value in vm_map.items()}
+
+        return self._vm_path_index
+
+    @staticmethod
+    def _translate_vm_path(vm_index, path):
+        """Rewrites the VM component(s) of the path in a single pass using the
+           translation index.
+
+            Args:
+                vm_index    (dict)  --  path component to replacement mapping
+
+                path        (str)   --  browse path to translate
+
+            Returns:
+                str     -   translated path
+
+                None    -   if the path does not contain any VM component
+        """
+        if not vm_index:
+            return None
+
+        components = path.split('\\')
+        translated = False
+
+        for index, component in enumerate(components):
+            if component in vm_index:
+                components[index] = vm_index[component]
+                translated = True
+
+        return '\\'.join(components) if translated else None
+
     def _parse_vm_path(self, vm_names, vm_path):
         """Parses the path provided by user, and replaces the VM Display Name
            with the VM ID.
@@ -1283,6 +1455,10 @@ class VirtualServerSubclient(Subclient):
 
             vm_path_list = vm_path.split('\\')
 
+            if vm_path_list[1] in vm_names:
+                vm_path_list[1] = vm_names[vm_path_list[1]]
+                return '\\'.join(vm_path_list)
+
             for vm_name in vm_names:
                 if vm_name in vm_path_list[1]:
                     vm_path = vm_path.replace(vm_path_list[1], vm_names[vm_name])
@@ -1290,6 +1466,29 @@ class VirtualServerSubclient(Subclient):
 
         return vm_path
 
+    def _iter_vsa_browse_response(self, vm_ids, browse_content):
+        """Lazily translates the browse response, replacing the VM ID with the
+        display name of the VM one row at a time.
+
+            Args:
+                vm_ids          (dict)      --  dictionary with VM ID as Key
+                                                and VM Name as value
+
+                browse_content  (tuple)     --  browse response received from
+                                                server
+
+            Yields:
+                tuple   -   (path, details) for each row of the browse response,
+                            with the VM ID in the path replaced by the VM name
+        """
+        vm_index = self._get_vm_path_index(vm_ids)
+
+        for path in browse_content[0]:
+            yield (
+                self._translate_vm_path(vm_index, path) or path,
+                browse_content[1].get(path)
+            )
+
     def _process_vsa_browse_response(self, vm_ids, browse_content):
         """Processes the Browse response and replaces the VM ID with their
         display name before returning to user.
@@ -1308,21 +1507,20 @@ class VirtualServerSubclient(Subclient):
                 dict - path along with the details like name, file/folder,
                        size, modification time
         """
-        for index, path in enumerate(browse_content[0]):
-            if vm_ids:
-                for vm_id in vm_ids:
-                    if vm_id in path:
-                        browse_content[0][index] = path.replace(vm_id, vm_ids[vm_id])
+        vm_index = self._get_vm_path_index(vm_ids)
 
+        paths = []
         temp_dict = {}
 
-        for path in browse_content[1]:
-            if vm_ids:
-                for vm_id in vm_ids:
-                    if vm_id in path:
-                        temp_dict[path.replace(vm_id, vm_ids[vm_id])] = browse_content[1][path]
+        for path in browse_content[0]:
+            paths.append(self._translate_vm_path(vm_index, path) or path)
 
-        return browse_content[0], temp_dict
+        for path, details in browse_content[1].items():
+            translated_path = self._translate_vm_path(vm_index, path)
+            if translated_path is not None:
+                temp_dict[translated_path] = details
+
+        return paths, temp_dict
 
     def _process_restore_request(self, vm_names, restore_content):
         """Processes the Restore Request and replaces the VM display name with
@@ -1433,6 +1631,60 @@ class VirtualServerSubclient(Subclient):
                 vm_ids[val['snap_display_name']] = val['name']
         return self._process_vsa_browse_response(vm_ids, browse_content)
 
+    def iter_browse(self, vm_path='\\',
+                    show_deleted_files=False,
+                    vm_disk_browse=False,
+                    vm_files_browse=False,
+                    operation='browse',
+                    copy_precedence=0,
+                    **kwargs
+                    ):
+        """Lazily yields the content of the backup for this subclient at the
+           path specified, with the VM ID in each path replaced by the VM name.
+
+            For find operation, the VMs are browsed one at a time and their
+            rows are yielded before the next VM is browsed.
+
+            Args:
+                Same as browse()
+
+            Yields:
+                tuple   -   (path, details) for each file or folder, where details
+                            is the dict with name, file/folder, size,
+                            modification time
+
+            Raises:
+                SDKException:
+                    if failed to browse content
+
+                    if response is empty
+
+                    if response is not success
+        """
+        vm_ids, vm_names = self._get_vm_ids_and_names_dict()
+
+        if operation == 'find':
+            if not vm_names:
+                _vm_ids, vm_names = self._get_vm_ids_and_names_dict_from_browse()
+            vm_paths = ['\\' + vm_id for vm_id in vm_names.values()]
+            browse_kwargs = {'copy_precedence': copy_precedence}
+        else:
+            vm_paths = [self._parse_vm_path(vm_names, vm_path)]
+            browse_kwargs = kwargs
+
+        for _vm_path in vm_paths:
+            browse_content = super(VirtualServerSubclient, self).browse(
+                show_deleted_files, vm_disk_browse, True, path=_vm_path,
+                vs_file_browse=vm_files_browse, operation=operation, **browse_kwargs
+            )
+
+            _vm_ids = vm_ids
+            if not _vm_ids:
+                _vm_ids = {val['snap_display_name']: val['name'] for val in browse_content[1].values()}
+
+            for row in self._iter_vsa_browse_response(_vm_ids, browse_content):
+                yield row
+
     def parse_nics_xml(self, input_xml):
         """
             Gets the content of the backup for this subclient at the path
@@ -2265,16 +2517,9 @@ class VirtualServerSubclient(Subclient):
         # with suffix Delete.
         vm_names, vm_ids = self._get_vm_ids_and_names_dict_from_browse()
         copy_precedence = restore_option.get('copy_precedence', 0)
-        browse_result = self.vm_files_browse(copy_precedence=copy_precedence)
 
         # vs metadata from browse result
-        _metadata = browse_result[1][('\\' + vm_to_restore)]
-
-        if ('browseMetaData' not in _metadata['advanced_data']) or \
-                ('virtualServerMetaData' not in _metadata['advanced_data']['browseMetaData']) or \
-                ('nics' not in _metadata['advanced_data']['browseMetaData']['virtualServerMetaData']):
-            browse_result = self.vm_files_browse(operation='find', copy_precedence=copy_precedence)
-            _metadata = browse_result[1][('\\' + vm_to_restore)]
+        _metadata = self._get_vm_browse_metadata(vm_to_restore, copy_precedence)
 
         vs_metadata = _metadata["advanced_data"]["browseMetaData"]["virtualServerMetaData"]
         if restore_option['in_place']:
@@ -2413,7 +2658,6 @@ class VirtualServerSubclient(Subclient):
         # If new_name is not given, it restores the VM with same name
         # with suffix Delete.
         vm_names, vm_ids = self._get_vm_ids_and_names_dict_from_browse()
-        _ = self.vm_files_browse()
         # populate restore source item
         restore_option['name'] = vm_to_restore
         restore_option['guid'] = vm_ids[vm_to_restore]
@@ -2503,14 +2747,8 @@ class VirtualServerSubclient(Subclient):
 
         """
 
-        browse_result = self.vm_files_browse()
         # vs metadata from browse result
-        _metadata = browse_result[1][('\\' + vm_to_restore)]
-        if ('browseMetaData' not in _metadata['advanced_data']) or \
-                ('virtualServerMetaData' not in _metadata['advanced_data']['browseMetaData']) or \
-                ('nics' not in _metadata['advanced_data']['browseMetaData']['virtualServerMetaData']):
-            browse_result = self.vm_files_browse(operation='find')
-            _metadata = browse_result[1][('\\' + vm_to_restore)]
+        _metadata = self._get_vm_browse_metadata(vm_to_restore)
         vs_metadata = _metadata["advanced_data"]["browseMetaData"]["virtualServerMetaData"]
 
         restore_option['resourcePoolPath'] = vs_metadata['resourcePoolPath']
@@ -2770,23 +3008,25 @@ class VirtualServerSubclient(Subclient):
         self._json_restore_diskLevelVMRestoreOption(restore_option)
         self._json_vcenter_instance(restore_option)
 
-        for _each_vm_to_restore in restore_option['vm_to_restore']:
-            if not restore_option["in_place"]:
-                if 'disk_type' in restore_option and restore_option['disk_type']:
-                    restore_option['restoreAsManagedVM'] = restore_option['disk_type'][
-                        _each_vm_to_restore]
-                if ("restore_new_name" in restore_option and
-                        restore_option["restore_new_name"] is not None):
-                    if len(restore_option['vm_to_restore']) == 1:
-                        restore_option["new_name"] = restore_option["restore_new_name"]
+        # share a single browse of the subclient for the metadata of all the VMs to restore
+        with self._vm_metadata_scope():
+            for _each_vm_to_restore in restore_option['vm_to_restore']:
+                if not restore_option["in_place"]:
+                    if 'disk_type' in restore_option and restore_option['disk_type']:
+                        restore_option['restoreAsManagedVM'] = restore_option['disk_type'][
+                            _each_vm_to_restore]
+                    if ("restore_new_name" in restore_option and
+                            restore_option["restore_new_name"] is not None):
+                        if len(restore_option['vm_to_restore']) == 1:
+                            restore_option["new_name"] = restore_option["restore_new_name"]
+                        else:
+                            restore_option["new_name"] = restore_option[
+                                                             "restore_new_name"] + _each_vm_to_restore
                     else:
-                        restore_option["new_name"] = restore_option[
-                                                         "restore_new_name"] + _each_vm_to_restore
+                        restore_option["new_name"] = "del" + _each_vm_to_restore
                 else:
-                    restore_option["new_name"] = "del" + _each_vm_to_restore
-            else:
-                restore_option["new_name"] = _each_vm_to_restore
-            self.set_advanced_vm_restore_options(_each_vm_to_restore, restore_option)
+                    restore_option["new_name"] = _each_vm_to_restore
+                self.set_advanced_vm_restore_options(_each_vm_to_restore, restore_option)
 
         # prepare json
         request_json = self._restore_json(restore_option=restore_option)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import threading
+import time
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.bulk_operations import BulkOperationRunner, RateLimiter
+from cvpysdk.exception import SDKException
+
+
+class BulkOperationRunnerTest(unittest.TestCase):
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def operation(item):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+
+            time.sleep(0.02)
+
+            with lock:
+                running[0] -= 1
+
+            return item
+
+        results = BulkOperationRunner(max_concurrency=3).run_all(operation, range(12))
+
+        self.assertEqual(sorted(result for _, result in results), list(range(12)))
+        self.assertLessEqual(peak[0], 3)
+        self.assertGreater(peak[0], 1)
+
+    def test_items_are_consumed_lazily(self):
+        consumed = []
+
+        def items():
+            for item in range(100):
+                consumed.append(item)
+                yield item
+
+        results = BulkOperationRunner(max_concurrency=2).run(lambda item: item, items())
+        next(results)
+        self.assertLessEqual(len(consumed), 3)
+        results.close()
+
+    def test_results_are_yielded_in_completion_order(self):
+        delays = {'slow': 0.2, 'fast': 0}
+
+        def operation(item):
+            time.sleep(delays[item])
+            return item.upper()
+
+        results = list(BulkOperationRunner(max_concurrency=2).run(operation, ['slow', 'fast']))
+
+        self.assertEqual(results, [('fast', 'FAST'), ('slow', 'SLOW')])
+
+    def test_exceptions_are_returned(self):
+        def operation(item):
+            if item % 2:
+                raise SDKException('Response', '101', str(item))
+            return item
+
+        results = dict(BulkOperationRunner(max_concurrency=4).run_all(operation, range(6)))
+
+        self.assertEqual([results[item] for item in (0, 2, 4)], [0, 2, 4])
+        for item in (1, 3, 5):
+            self.assertIsInstance(results[item], SDKException)
+
+    def test_operation_is_validated_on_the_call(self):
+        runner = BulkOperationRunner()
+
+        self.assertRaises(SDKException, runner.run, None, [1])
+        self.assertRaises(SDKException, BulkOperationRunner, 0)
+
+    def test_rate_limits_the_starts(self):
+        started = []
+        runner = BulkOperationRunner(max_concurrency=5, rate=20)
+        runner.run_all(lambda item: started.append(time.monotonic()), range(5))
+
+        # one operation starts at once, and one more every 1 / 20 seconds
+        self.assertGreaterEqual(max(started) - min(started), 4 / 20.0 * 0.9)
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_rate(self):
+        limiter = RateLimiter(rate=50)
+        start_time = time.monotonic()
+
+        for _ in range(11):
+            limiter.acquire()
+
+        elapsed = time.monotonic() - start_time
+        self.assertGreaterEqual(elapsed, 10 / 50.0 * 0.9)
+        self.assertLess(elapsed, 1)
+
+    def test_burst(self):
+        limiter = RateLimiter(rate=1, burst=5)
+        start_time = time.monotonic()
+
+        for _ in range(5):
+            limiter.acquire()
+
+        self.assertLess(time.monotonic() - start_time, 0.5)
+
+    def test_invalid_inputs(self):
+        self.assertRaises(SDKException, RateLimiter, 0)
+        self.assertRaises(SDKException, RateLimiter, 1, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from unittest import mock
+
+from cvpysdk.change_feed import ChangeFeed
+
+
+class ChangeFeedJobsTest(unittest.TestCase):
+    def _get_feed(self, pages):
+        commcell_object = mock.Mock()
+        commcell_object.job_controller._get_jobs_list.side_effect = pages
+        return ChangeFeed(commcell_object, sources=['jobs'], page_size=3), commcell_object
+
+    @staticmethod
+    def _get_page(job_ids, count, total=None):
+        jobs = {job_id: {'jobId': job_id, 'status': 'Running', 'lastUpdateTime': 100} for job_id in job_ids}
+        return jobs, {'count': count, 'total': total}
+
+    def test_short_filtered_page_is_not_the_last_page(self):
+        # the second job of the first page is not visible, but the server returned a full page
+        feed, commcell_object = self._get_feed([
+            self._get_page([1, 3], count=3),
+            self._get_page([4, 5], count=2)
+        ])
+
+        changes = feed._get_job_changes()
+
+        self.assertEqual([change['id'] for change in changes], [1, 3, 4, 5])
+        offsets = [call[1]['offset'] for call in commcell_object.job_controller._get_jobs_list.call_args_list]
+        self.assertEqual(offsets, [0, 3])
+
+    def test_paging_stops_at_the_total(self):
+        feed, commcell_object = self._get_feed([
+            self._get_page([1, 2, 3], count=3, total=6),
+            self._get_page([4, 5, 6], count=3, total=6)
+        ])
+
+        self.assertEqual(len(feed._get_job_changes()), 6)
+        self.assertEqual(commcell_object.job_controller._get_jobs_list.call_count, 2)
+
+    def test_job_shifted_to_the_next_page_is_returned_once(self):
+        feed, _ = self._get_feed([
+            self._get_page([1, 2, 3], count=3),
+            self._get_page([3, 4], count=2)
+        ])
+
+        self.assertEqual([change['id'] for change in feed._get_job_changes()], [1, 2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
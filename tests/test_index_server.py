@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk.datacube.constants import IndexServerConstants
+from cvpysdk.index_server import IndexServer, _QueryRouter
+
+
+class _HealthySolr(object):
+    """Returns a successful response for every request, recording the urls requested"""
+
+    def __init__(self):
+        self.urls = []
+
+    def make_request(self, method, url, payload=None, headers=None):
+        self.urls.append(url)
+        return True, 'OK'
+
+
+class QueryRouterTest(unittest.TestCase):
+    def _get_index_server(self, server_type, nodes):
+        index_server = IndexServer.__new__(IndexServer)
+        index_server._cvpysdk_object = _HealthySolr()
+        index_server._properties = {
+            IndexServerConstants.SERVER_TYPE: server_type,
+            IndexServerConstants.CLIENT_NAME: list(nodes),
+            IndexServerConstants.CI_SERVER_URL: ['http://{0}:20000'.format(node) for node in nodes]
+        }
+        return index_server
+
+    def test_single_node_cloud_is_healthy(self):
+        index_server = self._get_index_server(5, ['node1'])
+        router = _QueryRouter(index_server)
+
+        self.assertEqual(router.get_nodes(), ['node1'])
+        self.assertTrue(router._healthy['node1'])
+        self.assertEqual(
+            index_server._cvpysdk_object.urls, ['http://node1:20000/solr/rest/admin/healthsummary']
+        )
+
+    def test_multi_node_cloud_is_healthy(self):
+        index_server = self._get_index_server(5, ['node1', 'node2'])
+        router = _QueryRouter(index_server)
+
+        self.assertEqual(sorted(router.get_nodes()), ['node1', 'node2'])
+        self.assertTrue(all(router._healthy.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
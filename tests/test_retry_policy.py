@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from unittest import mock
+
+from cvpysdk import retry_policy
+from cvpysdk.exception import SDKException
+from cvpysdk.job import Job
+from cvpysdk.retry_policy import RetryPolicy
+
+
+class _FakeClock(object):
+    """Monotonic clock advanced only by the sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+        patcher = mock.patch.multiple(retry_policy.time, monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_delay_backoff(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5, multiplier=2, jitter=0)
+
+        self.assertEqual([policy.get_delay(retry) for retry in range(1, 6)], [1, 2, 4, 5, 5])
+        self.assertEqual(policy.get_delay(2, base_delay=3, max_delay=4), 4)
+
+    def test_get_delay_jitter(self):
+        policy = RetryPolicy(base_delay=4, jitter=0.5)
+
+        for _ in range(50):
+            self.assertTrue(2 <= policy.get_delay(1) <= 4)
+
+    def test_attempts_and_metrics(self):
+        policy = RetryPolicy(max_attempts=4, base_delay=1, jitter=0)
+
+        self.assertEqual(list(policy.attempts('operation')), [1, 2, 3, 4])
+        self.assertEqual(self.clock.sleeps, [1, 2, 4])
+        self.assertEqual(policy.metrics['operation'], {
+            'calls': 1, 'attempts': 4, 'retries': 3, 'exhausted': 1, 'sleep_time': 7
+        })
+
+        for _ in policy.attempts('operation'):
+            break
+
+        self.assertEqual(policy.metrics['operation']['calls'], 2)
+        self.assertEqual(policy.metrics['operation']['exhausted'], 1)
+
+        policy.reset_metrics()
+        self.assertEqual(policy.metrics, {})
+
+    def test_deadline(self):
+        policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=100, jitter=0, deadline=10)
+
+        # the retries after 1 + 2 + 4 seconds would end after the deadline
+        self.assertEqual(list(policy.attempts('operation')), [1, 2, 3, 4])
+        self.assertLessEqual(self.clock.now, 10)
+
+        self.assertEqual(len(list(policy.attempts('operation', deadline=0))), 1)
+
+    def test_is_retryable(self):
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable(mock.Mock(status_code=503)))
+        self.assertFalse(policy.is_retryable(mock.Mock(status_code=404)))
+        self.assertTrue(policy.is_retryable(object()))
+
+    def test_invalid_inputs(self):
+        self.assertRaises(SDKException, RetryPolicy, max_attempts=0)
+        self.assertRaises(SDKException, RetryPolicy, deadline=-1)
+        self.assertRaises(SDKException, RetryPolicy, jitter=2)
+
+
+class JobRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+        patcher = mock.patch.multiple(retry_policy.time, monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.job = Job.__new__(Job)
+        self.job._commcell_object = mock.Mock(retry_policy=RetryPolicy())
+
+    def test_is_valid_job_does_not_nest_retries(self):
+        with mock.patch.object(Job, '_get_job_summary', side_effect=SDKException('Job', '104')) as get_job_summary:
+            self.assertFalse(self.job._is_valid_job())
+
+        self.assertEqual(get_job_summary.call_count, 10)
+        for call in get_job_summary.call_args_list:
+            self.assertEqual(call[1], {'max_attempts': 1})
+
+        self.assertLessEqual(self.clock.now, 1 + 1.5 * 8)
+
+    def test_is_valid_job_raises_the_response_failure(self):
+        with mock.patch.object(Job, '_get_job_summary', side_effect=SDKException('Response', '101')):
+            self.assertRaises(SDKException, self.job._is_valid_job)
+
+
+if __name__ == "__main__":
+    unittest.main()
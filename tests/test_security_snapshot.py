@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from unittest import mock
+
+from cvpysdk.security.security_snapshot import SecuritySnapshot
+
+
+def _grant(entity, role_name):
+    return {
+        'securityAssociations': {
+            'associations': [{
+                'entities': {'entity': [entity]},
+                'properties': {'role': {'roleName': role_name}}
+            }]
+        }
+    }
+
+
+PROPERTIES = {
+    'ROLE/1': {'roleProperties': [{
+        'role': {'roleName': 'Restore Operator'},
+        'categoryPermission': {'categoriesPermissionList': [{'permissionName': 'In Place Full Restore'}]}
+    }]},
+    'USER/11': {'users': [{
+        'associatedUserGroups': [],
+        'associatedExternalUserGroups': [
+            {'externalGroupName': 'Backup Admins', 'providerDomainName': 'CORP'}
+        ]
+    }]},
+    'USER/12': {'users': [{}]},
+    'USERGROUP/21': {'userGroups': [_grant({'clientName': 'Client1'}, 'Restore Operator')]}
+}
+
+
+class _CannedResponse(object):
+    def __init__(self, response_json):
+        self._response_json = response_json
+        self.text = 'OK'
+
+    def json(self):
+        return self._response_json
+
+
+class SecuritySnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.commcell_object = mock.Mock()
+        self.commcell_object._services = {'ROLE': 'ROLE/%s', 'USER': 'USER/%s', 'USERGROUP': 'USERGROUP/%s'}
+        self.commcell_object._cvpysdk_object.make_request.side_effect = (
+            lambda method, url: (True, _CannedResponse(PROPERTIES[url]))
+        )
+        self.commcell_object.roles.all_roles = {'restore operator': 1}
+        self.commcell_object.users.all_users = {'corp\\user1': 11, 'user2': 12}
+        self.commcell_object.user_groups.all_user_groups = {'corp\\backup admins': 21}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _assert_external_group_grant(self, snapshot):
+        self.assertEqual(snapshot.get_user_groups('CORP\\User1'), {'corp\\backup admins'})
+        self.assertTrue(snapshot.has_permission('corp\\user1', 'In Place Full Restore', 'clientName', 'client1'))
+        self.assertFalse(snapshot.has_permission('user2', 'In Place Full Restore', 'clientName', 'client1'))
+        self.assertEqual(
+            snapshot.get_users_with_permission('in place full restore', 'clientName', 'Client1'), {'corp\\user1'}
+        )
+
+    def test_external_group_grant(self):
+        snapshot = SecuritySnapshot(self.commcell_object)
+        snapshot.load()
+        self._assert_external_group_grant(snapshot)
+
+        snapshot_file = os.path.join(self.directory, 'snapshot.json.gz')
+        snapshot.save(snapshot_file)
+
+        loaded_snapshot = SecuritySnapshot(self.commcell_object)
+        loaded_snapshot.load_from_file(snapshot_file)
+        self._assert_external_group_grant(loaded_snapshot)
+
+    def test_external_group_entity_key(self):
+        self.assertEqual(
+            SecuritySnapshot._get_entity_key({'externalGroupName': 'Backup Admins', 'providerDomainName': 'CORP'}),
+            ('externalGroupName', 'corp\\backup admins')
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
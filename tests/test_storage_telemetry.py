@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from unittest import mock
+
+from cvpysdk.exception import SDKException
+from cvpysdk.storage_telemetry import CapacitySeries, StorageCapacitySampler
+
+
+class CapacitySeriesTest(unittest.TestCase):
+    def test_ring_wraps_around(self):
+        series = CapacitySeries(3)
+
+        for timestamp in range(5):
+            series.append(timestamp, 100, 100 - timestamp)
+
+        self.assertEqual(len(series), 3)
+        self.assertEqual(series.samples(), [(2, 100, 98), (3, 100, 97), (4, 100, 96)])
+        self.assertEqual(series.latest, (4, 100, 96))
+
+    def test_growth_rate_and_time_to_full(self):
+        series = CapacitySeries(10)
+        self.assertIsNone(series.growth_rate())
+        self.assertIsNone(series.time_to_full())
+
+        # 10 MB used every 60 seconds, with some noise
+        for timestamp, used in ((0, 0), (60, 12), (120, 18), (180, 30)):
+            series.append(timestamp, 1000, 1000 - used)
+
+        self.assertAlmostEqual(series.growth_rate(), 9.6 / 60)
+        self.assertAlmostEqual(series.time_to_full(), 970 / (9.6 / 60))
+
+    def test_time_to_full_when_not_growing(self):
+        series = CapacitySeries(5)
+        series.append(0, 1000, 500)
+        series.append(60, 1000, 600)
+
+        self.assertLess(series.growth_rate(), 0)
+        self.assertIsNone(series.time_to_full())
+
+        series.append(120, 1000, 0)
+        self.assertEqual(series.time_to_full(), 0)
+
+    def test_same_time_samples(self):
+        series = CapacitySeries(5)
+        series.append(0, 1000, 500)
+        series.append(0, 1000, 400)
+
+        self.assertIsNone(series.growth_rate())
+
+    def test_invalid_size(self):
+        self.assertRaises(SDKException, CapacitySeries, 0)
+
+
+class StorageCapacitySamplerTest(unittest.TestCase):
+    def test_library_without_mount_paths(self):
+        commcell_object = mock.Mock()
+        commcell_object._services = {'LIBRARY': 'Library', 'GET_LIBRARY_PROPERTIES': 'Library/%s'}
+        responses = {
+            'Library': {'response': [
+                {'entityInfo': {'id': 1, 'name': 'Lib1'}}, {'entityInfo': {'id': 2, 'name': 'Lib2'}}
+            ]},
+            'Library/1': {'libraryInfo': {'MountPathList': []}},
+            'Library/2': {'libraryInfo': {'MountPathList': [
+                {'mountPathName': '[MA1] /mnt/a', 'mountPathSummary': {'totalSpace': 100, 'freeSpace': 40}}
+            ]}}
+        }
+        commcell_object._cvpysdk_object.make_request.side_effect = (
+            lambda method, url: (True, mock.Mock(json=mock.Mock(return_value=responses[url])))
+        )
+
+        samples = StorageCapacitySampler(commcell_object)._get_library_samples()
+
+        self.assertEqual(samples[('library', 'lib1')], {'capacity': None, 'free': None, 'health': 'Online'})
+        self.assertEqual(samples[('library', 'lib2')], {'capacity': 100, 'free': 40, 'health': 'Online'})
+        self.assertEqual(samples[('media_agent', 'ma1')]['capacity'], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()